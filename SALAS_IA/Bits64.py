@@ -31,11 +31,12 @@ def fen_to_bitmap(fen):
 
 
 # Ejemplo de uso
-fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
-bitmap = fen_to_bitmap(fen)
+if __name__ == "__main__":
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    bitmap = fen_to_bitmap(fen)
 
-# Mostrar el array de 64 elementos
-print(bitmap)
+    # Mostrar el array de 64 elementos
+    print(bitmap)
 
 
 def get_pawn_moves(bitmap, index):
@@ -160,16 +161,17 @@ def get_queen_moves(bitmap, index):
 
 
 # --- Ejemplo de uso ---
-fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
-bitmap = fen_to_bitmap(fen)
+if __name__ == "__main__":
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    bitmap = fen_to_bitmap(fen)
 
-# Movimientos de la torre blanca en a1 (index 56)
-rook_moves = get_rook_moves(bitmap, 56)
-print(f"Movimientos de la torre en a1: {rook_moves}")  # Output: [] (no puede moverse)
+    # Movimientos de la torre blanca en a1 (index 56)
+    rook_moves = get_rook_moves(bitmap, 56)
+    print(f"Movimientos de la torre en a1: {rook_moves}")  # Output: [] (no puede moverse)
 
-# Movimientos del caballo negro en b8 (index 1)
-knight_moves = get_knight_moves(bitmap, 1)
-print(f"Movimientos del caballo en b8: {knight_moves}")  # Output: [16, 18]
+    # Movimientos del caballo negro en b8 (index 1)
+    knight_moves = get_knight_moves(bitmap, 1)
+    print(f"Movimientos del caballo en b8: {knight_moves}")  # Output: [16, 18]
 
 ###### TERCERA ADICIÓN
 
@@ -190,7 +192,7 @@ def is_in_check(bitmap, color):
     opponent = 'black' if color == 'white' else 'white'
     for i in range(64):
         piece = bitmap[i]
-        if piece == 0 or (color == 'white' and piece < 0) or (color == 'black' and piece > 0):
+        if piece == 0 or (color == 'white' and piece > 0) or (color == 'black' and piece < 0):  # solo atacan las piezas rivales
             continue
         moves = []
         if abs(piece) == 1:  # Peón (ataques)
@@ -323,10 +325,11 @@ def generate_legal_moves(bitmap, color):
     return legal_moves
 
 # Ejemplo de uso
-fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
-bitmap = fen_to_bitmap(fen)
-legal_moves = generate_legal_moves(bitmap, 'white')
+if __name__ == "__main__":
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    bitmap = fen_to_bitmap(fen)
+    legal_moves = generate_legal_moves(bitmap, 'white')
 
-print(f"Número de movimientos legales iniciales: {len(legal_moves)}")
+    print(f"Número de movimientos legales iniciales: {len(legal_moves)}")
 
 
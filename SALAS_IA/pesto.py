@@ -1,5 +1,10 @@
 # Carlos Salas Alarcón
 
+try:
+    import numpy as np
+except ImportError:  # NumPy solo hace falta para calc_tableros
+    np = None
+
 PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = 0, 1, 2, 3, 4, 5
 mg_value = [82, 337, 365, 477, 1025, 50000000]
 
@@ -44,6 +49,53 @@ mg_pesto_table = [
 ]
 
 
+# Valores de final de partida de PeSTO (el rey no suma material)
+eg_value = [94, 281, 297, 512, 936, 0]
+
+# Peso de cada tipo de pieza en la fase de la partida (24 = todas las piezas, 0 = solo reyes y peones)
+gamephase_inc = [0, 1, 1, 2, 4, 0]
+
+# Tablas de bonificación posicional (endgame)
+eg_pesto_table = [
+    [  # Peones
+        0, 0, 0, 0, 0, 0, 0, 0, 178, 173, 158, 134, 147, 132, 165, 187,
+        94, 100, 85, 67, 56, 53, 82, 84, 32, 24, 13, 5, -2, 4, 17, 17,
+        13, 9, -3, -7, -7, -8, 3, -1, 4, 7, -6, 1, 0, -5, -1, -8,
+        13, 8, 8, 10, 13, 0, 2, -7, 0, 0, 0, 0, 0, 0, 0, 0
+    ],
+    [  # Caballos
+        -58, -38, -13, -28, -31, -27, -63, -99, -25, -8, -25, -2, -9, -25, -24, -52,
+        -24, -20, 10, 9, -1, -9, -19, -41, -17, 3, 22, 22, 22, 11, 8, -18,
+        -18, -6, 16, 25, 16, 17, 4, -18, -23, -3, -1, 15, 10, -3, -20, -22,
+        -42, -20, -10, -5, -2, -20, -23, -44, -29, -51, -23, -15, -22, -18, -50, -64
+    ],
+    [  # Alfiles
+        -14, -21, -11, -8, -7, -9, -17, -24, -8, -4, 7, -12, -3, -13, -4, -14,
+        2, -8, 0, -1, -2, 6, 0, 4, -3, 9, 12, 9, 14, 10, 3, 2,
+        -6, 3, 13, 19, 7, 10, -3, -9, -12, -3, 8, 10, 13, 3, -7, -15,
+        -14, -18, -7, -1, 4, -9, -15, -27, -23, -9, -23, -5, -9, -16, -5, -17
+    ],
+    [  # Torres
+        13, 10, 18, 15, 12, 12, 8, 5, 11, 13, 13, 11, -3, 3, 8, 3,
+        7, 7, 7, 5, 4, -3, -5, -3, 4, 3, 13, 1, 2, 1, -1, 2,
+        3, 5, 8, 4, -5, -6, -8, -11, -4, 0, -5, -1, -7, -12, -8, -16,
+        -6, -6, 0, 2, -9, -9, -11, -3, -9, 2, 3, -1, -5, -13, 4, -20
+    ],
+    [  # Damas
+        -9, 22, 22, 27, 27, 19, 10, 20, -17, 20, 32, 41, 58, 25, 30, 0,
+        -20, 6, 9, 49, 47, 35, 19, 9, 3, 22, 24, 45, 57, 40, 57, 36,
+        -18, 28, 19, 47, 31, 34, 39, 23, -16, -27, 15, 6, 9, 17, 10, 5,
+        -22, -23, -30, -16, -16, -23, -36, -32, -33, -28, -22, -43, -5, -32, -20, -41
+    ],
+    [  # Reyes
+        -74, -35, -18, -18, -11, 15, 4, -17, -12, 17, 14, 17, 17, 38, 23, 11,
+        10, 17, 23, 15, 20, 45, 44, 13, -8, 22, 24, 27, 26, 33, 26, 3,
+        -18, -4, 21, 24, 27, 23, 9, -11, -19, -3, 11, 21, 23, 16, 7, -9,
+        -27, -11, 4, 13, 14, 4, -5, -17, -53, -34, -21, -11, -28, -14, -24, -43
+    ]
+]
+
+
 def calc_pieza(piece_type, color, square):
     """
     Calcula el valor de una pieza en el medio juego SIN tablas precalculadas.
@@ -88,3 +140,77 @@ def calc_tablero(bitmap, color):
 
     return puntuacion
 
+
+# Fase con todas las piezas en el tablero
+FASE_MAXIMA = 24
+
+_tablas_numpy = None
+
+
+def _tablas_vectorizadas():
+    """
+    Construye una sola vez las tablas de calc_tableros, indexadas por código + 6 (filas
+    0-5 negras, 6 vacía, 7-12 blancas): valor base más bonificación posicional, con la
+    casilla ya espejada para las negras y en positivo para los dos bandos.
+    """
+    global _tablas_numpy
+    if _tablas_numpy is None:
+        medio = np.zeros((13, 64), dtype=np.int32)
+        final = np.zeros((13, 64), dtype=np.int32)
+        fase = np.zeros(13, dtype=np.int32)
+        espejo = np.arange(64) ^ 0x38
+        for tipo in range(6):
+            # El rey no suma material (siempre hay uno de cada color), como en eg_value
+            base_medio = mg_value[tipo] if tipo != KING else 0
+            tabla_medio = base_medio + np.array(mg_pesto_table[tipo], dtype=np.int32)
+            tabla_final = eg_value[tipo] + np.array(eg_pesto_table[tipo], dtype=np.int32)
+            medio[7 + tipo], medio[5 - tipo] = tabla_medio, tabla_medio[espejo]
+            final[7 + tipo], final[5 - tipo] = tabla_final, tabla_final[espejo]
+            fase[7 + tipo] = fase[5 - tipo] = gamephase_inc[tipo]
+        _tablas_numpy = medio, final, fase
+    return _tablas_numpy
+
+
+def calc_tableros(bitmaps):
+    """
+    Calcula de una vez la puntuación PeSTO interpolada (medio juego/final) de los dos
+    bandos para un lote de tableros, sin bucles de Python por casilla.
+
+    Usa la misma orientación que calc_pieza: las tablas se leen tal cual para las
+    blancas y con la casilla espejada (casilla ^ 0x38) para las negras. A diferencia de
+    calc_pieza, el rey no suma su valor base.
+
+    Args:
+        bitmaps (array_like): Tableros de forma (N, 64) con códigos 1-6/-1-6 (int8).
+
+    Returns:
+        numpy.ndarray: Enteros de forma (N, 2); columna 0 para las blancas y 1 para
+        las negras, cada una (medio * fase + final * (24 - fase)) // 24.
+
+    Raises:
+        ImportError: Si NumPy no está instalado.
+        ValueError: Si la forma no es (N, 64) o hay códigos fuera de -6..6.
+    """
+    if np is None:
+        raise ImportError("calc_tableros necesita NumPy.")
+
+    tableros = np.asarray(bitmaps)
+    if tableros.ndim != 2 or tableros.shape[1] != 64:
+        raise ValueError(f"Se esperaba un array de forma (N, 64), no {tableros.shape}.")
+    if tableros.size and (tableros.min() < -6 or tableros.max() > 6):
+        raise ValueError("Código de pieza inválido: deben estar entre -6 y 6.")
+
+    medio, final, fase = _tablas_vectorizadas()
+    indices = tableros.astype(np.intp) + 6
+    casillas = np.arange(64)
+
+    # Una consulta por casilla a las tablas precalculadas y una suma por bando
+    valores_medio = medio[indices, casillas]
+    valores_final = final[indices, casillas]
+    bandos = np.stack([tableros > 0, tableros < 0], axis=1)  # (N, 2, 64)
+    medio_bandos = (valores_medio[:, None, :] * bandos).sum(axis=2)
+    final_bandos = (valores_final[:, None, :] * bandos).sum(axis=2)
+
+    # Con promociones la fase puede pasar de 24
+    fase_total = np.minimum(fase[indices].sum(axis=1), FASE_MAXIMA)[:, None]
+    return (medio_bandos * fase_total + final_bandos * (FASE_MAXIMA - fase_total)) // FASE_MAXIMA
@@ -1,8 +1,9 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response, stream_with_context
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity,get_jwt
 from typing import Dict,Optional,Union,Any,List,Tuple
 from datetime import timedelta
 import os
+import json
 
 from usuario.registro import registrar_usuario,iniciar_sesion
 from usuario.usuario import Usuario
@@ -12,7 +13,10 @@ from utiles.file_menager import cargar_partida
 from juego.sesion_juego import SesionDeJuego
 from juego.usuarioIA import UsuarioIA
 from juego.tablero import Tablero 
+from juego.analisis import analizar_lote, posiciones_de_partida
 from config import JWT_PASSWORD,PATH_PARTIDAS_TEMP
+from config import PROFUNDIDAD_ANALISIS, TIEMPO_ANALISIS_MS, MAX_POSICIONES_ANALISIS
+from config import MAX_PROFUNDIDAD_ANALISIS, MAX_TIEMPO_ANALISIS_MS
 
 app = Flask(__name__)
 app.config["JWT_SECRET_KEY"] = JWT_PASSWORD
@@ -363,6 +367,67 @@ def cargar_partidaa(nombre_sesion: str) -> Dict[str, Any]:
         return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
     
 
+@app.route("/analisis/lote", methods=["POST"])
+@jwt_required()
+def analizar_lotee():
+    """
+    Endpoint para analizar muchas posiciones de una vez (ej. revisar las partidas de un día).
+
+    Las posiciones se analizan con la IA en el pool de procesos compartido y cada
+    resultado se envía en cuanto termina, como una línea JSON (NDJSON), sin esperar al
+    resto del lote. Los resultados no llegan en orden: cada uno lleva su `indice`.
+
+    Cuerpo JSON esperado:
+    ---------------------
+    {
+        "fens": ["<FEN>", ...] (opcional),
+        "partidas": ["partida_20250522_012332.json", ...] (opcional),
+        "profundidad": int (opcional, hasta MAX_PROFUNDIDAD_ANALISIS),
+        "tiempo_ms": int (opcional, hasta MAX_TIEMPO_ANALISIS_MS)
+    }
+
+    Retorna:
+    --------
+    Respuesta `application/x-ndjson` con una línea por posición (ver `juego/analisis.py`),
+    o un JSON de error si la petición no es válida.
+    """
+    try:
+        datos = request.get_json(silent=True) or {}
+        fens = datos.get("fens", [])
+        partidas = datos.get("partidas", [])
+        if not isinstance(fens, list) or not isinstance(partidas, list) or not (fens or partidas):
+            return jsonify({"error": "Debes indicar una lista de 'fens' y/o de 'partidas'."}), 400
+
+        profundidad = datos.get("profundidad", PROFUNDIDAD_ANALISIS)
+        tiempo_ms = datos.get("tiempo_ms", TIEMPO_ANALISIS_MS)
+        # bool es subclase de int: sin excluirlo, true pasaría por profundidad 1
+        if any(isinstance(valor, bool) or not isinstance(valor, int) for valor in (profundidad, tiempo_ms)):
+            return jsonify({"error": "'profundidad' y 'tiempo_ms' deben ser enteros."}), 400
+        if not 1 <= profundidad <= MAX_PROFUNDIDAD_ANALISIS:
+            return jsonify({"error": f"'profundidad' debe estar entre 1 y {MAX_PROFUNDIDAD_ANALISIS}."}), 400
+        if not 1 <= tiempo_ms <= MAX_TIEMPO_ANALISIS_MS:
+            return jsonify({"error": f"'tiempo_ms' debe estar entre 1 y {MAX_TIEMPO_ANALISIS_MS}."}), 400
+
+        posiciones = [{"fen": fen} for fen in fens]
+        for nombre_archivo in partidas:
+            if not isinstance(nombre_archivo, str) or os.path.basename(nombre_archivo) != nombre_archivo:
+                return jsonify({"error": f"Nombre de partida no válido: {nombre_archivo}"}), 400
+            posiciones.extend(posiciones_de_partida(nombre_archivo))
+        if len(posiciones) > MAX_POSICIONES_ANALISIS:
+            return jsonify({"error": f"Como máximo se analizan {MAX_POSICIONES_ANALISIS} posiciones por petición."}), 400
+
+        resultados = analizar_lote(posiciones, profundidad, tiempo_ms)
+        lineas = (json.dumps(resultado) + "\n" for resultado in resultados)
+        return Response(stream_with_context(lineas), mimetype="application/x-ndjson"), 200
+
+    except FileNotFoundError as fnf:
+        return jsonify({"error": str(fnf)}), 404
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": f"Error inesperado: {str(e)}"}), 500
+
+
 @app.route("/retos", methods=["GET"])
 @jwt_required()
 def obtener_retoss() -> tuple:
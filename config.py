@@ -1,3 +1,5 @@
+from typing import Optional
+
 PATH_PARTIDAS:str = "data/partidas"
 
 PATH_USUARIOS: str = "data/usuarios"
@@ -10,4 +12,53 @@ PATH_PARTIDAS_TEMP:str = "data/partidas/temp"
 
 JWT_PASSWORD: str = "leoncomegambas"
 
-PATH_CHATS: str = "data/chats"
\ No newline at end of file
+PATH_CHATS: str = "data/chats"
+
+MOTOR_TABLERO_IA: str = "bitboard"
+
+# Memoria máxima (MB) de la tabla de transposición de la IA según su nivel de dificultad
+TAMANO_TABLA_TRANSPOSICION_MB: dict = {1: 1, 2: 2, 3: 4, 4: 8, 5: 16}
+
+# Tiempo máximo (ms) que la IA dedica a cada movimiento según su nivel de dificultad
+TIEMPO_MOVIMIENTO_IA_MS: dict = {1: 250, 2: 500, 3: 1000, 4: 2000, 5: 4000}
+
+# Podas de la búsqueda de la IA según su nivel: reducción del movimiento nulo, plies que se
+# reducen los movimientos tranquilos tardíos y cuántos movimientos se buscan sin reducir
+# (0 desactiva la poda). Los niveles bajos podan más y gastan menos CPU por movimiento.
+PODAS_IA: dict = {
+    1: {"reduccion_nulo": 3, "reduccion_tardia": 2, "movimientos_sin_reducir": 2},
+    2: {"reduccion_nulo": 3, "reduccion_tardia": 2, "movimientos_sin_reducir": 3},
+    3: {"reduccion_nulo": 2, "reduccion_tardia": 1, "movimientos_sin_reducir": 3},
+    4: {"reduccion_nulo": 2, "reduccion_tardia": 1, "movimientos_sin_reducir": 4},
+    5: {"reduccion_nulo": 2, "reduccion_tardia": 1, "movimientos_sin_reducir": 6},
+}
+
+# Procesos del pool compartido para la búsqueda en paralelo de la IA (0 o 1 la desactiva)
+TRABAJADORES_IA: int = 4
+
+# Libro de aperturas de la IA (ver `juego/libro_aperturas.py`) y medias jugadas de cada
+# partida guardada que entran en él al construirlo
+RUTA_LIBRO_APERTURAS: str = "data/libro_aperturas.bin"
+PLIES_LIBRO_APERTURAS: int = 16
+
+# Tablas de finales de la IA (ver `juego/finales.py`) y número máximo de piezas, reyes
+# incluidos, de las firmas que se abren (None: todas las del directorio, KBNK incluida)
+PATH_FINALES: str = "data/finales"
+PIEZAS_TABLAS_FINALES: Optional[int] = None
+
+# Motor UCI externo con el que juegan las IA en lugar de la búsqueda propia (ejecutable, o
+# None para usar la propia) y número de procesos persistentes del motor (ver `juego/motor_uci.py`)
+MOTOR_UCI: Optional[str] = None
+PROCESOS_MOTOR_UCI: int = 2
+
+# Análisis por lotes de posiciones (ver `juego/analisis.py`): profundidad y tiempo por
+# posición (por defecto y máximos que admite /analisis/lote), memoria de la tabla de
+# transposición de cada proceso, posiciones máximas por petición y resultados que se
+# recuerdan entre peticiones
+PROFUNDIDAD_ANALISIS: int = 4
+TIEMPO_ANALISIS_MS: int = 1000
+MAX_PROFUNDIDAD_ANALISIS: int = 8
+MAX_TIEMPO_ANALISIS_MS: int = 5000
+MEGABYTES_TABLA_ANALISIS: float = 16
+MAX_POSICIONES_ANALISIS: int = 5000
+CAPACIDAD_CACHE_ANALISIS: int = 100000
@@ -1,133 +1,183 @@
+import time
 from typing import Optional 
 from juego.tablero import Tablero
+from juego.intercambio import intercambio_estatico
+from juego.ordenacion import OrdenMovimientos, valor_mvv_lva, es_tactico
+from piezas.codigos import (
+    SIGNO, VALORES, CODIGO_PEON, CODIGO_CABALLO, CODIGO_ALFIL, CODIGO_TORRE, CODIGO_REINA, CODIGO_REY,
+)
+from piezas.tablas_ataque import ATAQUES_CABALLO, ATAQUES_REY, ATAQUES_PEON, ataques_alfil, ataques_torre, ataques_reina
+from juego.tablas_pesto import FASE_MAXIMA
+from juego.tabla_transposicion import (
+    TablaTransposicion, EXACTA, COTA_INFERIOR, COTA_SUPERIOR, REEMPLAZO_PROFUNDIDAD,
+)
+from juego.libro_aperturas import LibroAperturas
+from juego.finales import TablasFinales
 
 INF = 1000000
 
-# Tablas de valores posicionales simplificadas para cada tipo de pieza (blancas).
-# La posición [0][0] es la esquina inferior izquierda desde la perspectiva blanca.
-# Las negras usarán la tabla invertida verticalmente.
-PSQT_PEON = [
-    [ 0,  0,  0,  0,  0,  0,  0,  0],
-    [ 5, 10, 10,-20,-20, 10, 10,  5],
-    [ 5, -5,-10,  0,  0,-10, -5,  5],
-    [ 0,  0,  0, 20, 20,  0,  0,  0],
-    [ 5,  5, 10, 25, 25, 10,  5,  5],
-    [10, 10, 20, 30, 30, 20, 10, 10],
-    [50, 50, 50, 50, 50, 50, 50, 50],
-    [ 100,  100,  100,  100,  100,  100,  100,  100] # un incentivo para que la ia lleve el peon hasta el final y este se convierta en una dama (no elige si es ia, simplemente se convierte en dama)
-]
-
-PSQT_CABALLO = [
-    [-50,-40,-30,-30,-30,-30,-40,-50],
-    [-40,-20,  0,  0,  0,  0,-20,-40],
-    [-30,  0, 10, 15, 15, 10,  0,-30],
-    [-30,  5, 15, 20, 20, 15,  5,-30],
-    [-30,  0, 15, 20, 20, 15,  0,-30],
-    [-30,  5, 10, 15, 15, 10,  5,-30],
-    [-40,-20,  0,  5,  5,  0,-20,-40],
-    [-50,-40,-30,-30,-30,-30,-40,-50]
-]
-
-PSQT_ALFIL = [
-    [-20,-10,-10,-10,-10,-10,-10,-20],
-    [-10,  0,  0,  0,  0,  0,  0,-10],
-    [-10,  0,  5, 10, 10,  5,  0,-10],
-    [-10,  5,  5, 10, 10,  5,  5,-10],
-    [-10,  0, 10, 10, 10, 10,  0,-10],
-    [-10, 10, 10, 10, 10, 10, 10,-10],
-    [-10,  5,  0,  0,  0,  0,  5,-10],
-    [-20,-10,-10,-10,-10,-10,-10,-20]
-]
-
-PSQT_TORRE = [
-    [ 0,  0,  0,  0,  0,  0,  0,  0],
-    [ 5, 10, 10, 10, 10, 10, 10,  5],
-    [-5,  0,  0,  0,  0,  0,  0, -5],
-    [-5,  0,  0,  0,  0,  0,  0, -5],
-    [-5,  0,  0,  0,  0,  0,  0, -5],
-    [-5,  0,  0,  0,  0,  0,  0, -5],
-    [-5,  0,  0,  0,  0,  0,  0, -5],
-    [ 0,  0,  0,  5,  5,  0,  0,  0]
-]
-
-PSQT_REY_MIDGAME = [
-    [-30,-40,-40,-50,-50,-40,-40,-30],
-    [-30,-40,-40,-50,-50,-40,-40,-30],
-    [-30,-40,-40,-50,-50,-40,-40,-30],
-    [-30,-40,-40,-50,-50,-40,-40,-30],
-    [-20,-30,-30,-40,-40,-30,-30,-20],
-    [-10,-20,-20,-20,-20,-20,-20,-10],
-    [ 20, 20,  0,  0,  0,  0, 20, 20],
-    [ 20, 30, 10,  0,  0, 10, 30, 20]
-]
-
-PSQT_REY_ENDGAME = [
-    [-50,-40,-30,-20,-20,-30,-40,-50],
-    [-30,-20,-10,  0,  0,-10,-20,-30],
-    [-30,-10, 20, 30, 30, 20,-10,-30],
-    [-30,-10, 30, 40, 40, 30,-10,-30],
-    [-30,-10, 30, 40, 40, 30,-10,-30],
-    [-30,-10, 20, 30, 30, 20,-10,-30],
-    [-30,-30,  0,  0,  0,  0,-30,-30],
-    [-50,-30,-30,-30,-30,-30,-30,-50]
-]
+# Cada cuántos nodos se consulta el reloj durante la búsqueda
+NODOS_ENTRE_CONSULTAS_RELOJ = 256
+
+# Fracción del reloj de partida que se dedica a un movimiento si no se indica otra cosa
+MOVIMIENTOS_RESTANTES_ESTIMADOS = 30
+
+# Fase (ver `juego/tablas_pesto.py`) igual o inferior a la cual se considera final de partida
+FASE_FINAL = 8
+
+# Semiancho inicial de la ventana de aspiración alrededor del valor de la iteración anterior
+VENTANA_ASPIRACION = 50
+
+# Margen de la poda delta: una captura que ni con este extra llega a alfa no se busca
+MARGEN_DELTA = 200
+
+# Valor de una posición ganada según las tablas de finales, menos las medias jugadas hasta
+# el mate: por debajo de un mate encontrado en la búsqueda, por encima de cualquier evaluación
+VALOR_FINAL_GANADO = INF // 2
+
+# Un mate en n medias jugadas vale INF - n y una posición ganada de las tablas de finales
+# VALOR_FINAL_GANADO - dtm - n: por encima de este umbral el valor depende de la distancia
+# a la raíz
+UMBRAL_GANADO = VALOR_FINAL_GANADO - 1000
+
+
+# Generadores de ataque de las piezas deslizantes por código de tipo, para la movilidad
+_ATAQUES_DESLIZANTES = {CODIGO_ALFIL: ataques_alfil, CODIGO_TORRE: ataques_torre, CODIGO_REINA: ataques_reina}
+
+
+def _valor_a_tabla(valor: int, ply: int) -> int:
+    # La búsqueda cuenta las victorias (mates y finales) desde la raíz y la tabla desde el
+    # propio nodo, que puede volver a aparecer a otra distancia de la raíz
+    if valor > UMBRAL_GANADO:
+        return valor + ply
+    if valor < -UMBRAL_GANADO:
+        return valor - ply
+    return valor
+
+
+def _valor_desde_tabla(valor: int, ply: int) -> int:
+    if valor > UMBRAL_GANADO:
+        return valor - ply
+    if valor < -UMBRAL_GANADO:
+        return valor + ply
+    return valor
+
+
+class TiempoAgotado(Exception):
+    """
+    Se lanza dentro de la búsqueda cuando se supera el tiempo asignado al movimiento.
+    """
 
 class IADeAjedrez:
-    def __init__(self,max_profundidad: int=3) -> None:
+    def __init__(self,max_profundidad: int=3, megabytes_tabla: float=4, politica_tabla: str=REEMPLAZO_PROFUNDIDAD, tiempo_ms: Optional[int]=None,
+                 reduccion_nulo: int=2, reduccion_tardia: int=1, movimientos_sin_reducir: int=3,
+                 libro: Optional[LibroAperturas]=None, finales: Optional[TablasFinales]=None) -> None:
         self.max_profundidad = max_profundidad
+        # Libro de aperturas que se consulta antes de buscar (None: se busca siempre)
+        self.libro = libro
+        # Tablas de finales que se sondean en la raíz y en la búsqueda (None: no se sondean)
+        self.finales = finales
+        # Poda de movimiento nulo (reducción R, 0 la desactiva) y reducción de los movimientos
+        # tranquilos tardíos (plies que se reducen, 0 la desactiva, y cuántos se buscan completos)
+        self.reduccion_nulo = reduccion_nulo
+        self.reduccion_tardia = reduccion_tardia
+        self.movimientos_sin_reducir = movimientos_sin_reducir
+        # Tiempo máximo por movimiento; None busca siempre hasta max_profundidad
+        self.tiempo_ms = tiempo_ms
         self.color = None
         self.color_enemigo = "blanco" if "negro" == self.color else "negro"
-        self.transposition_table: dict[str, float] = {}
-
-    def valor_posicional(self, pieza, fila: int, col: int, fase_juego: str="medio") -> int:
-        tablas = {
-            "peon": PSQT_PEON,
-            "caballo": PSQT_CABALLO,
-            "alfil": PSQT_ALFIL,
-            "torre": PSQT_TORRE,
-            "rey": PSQT_REY_MIDGAME if fase_juego=="medio" else PSQT_REY_ENDGAME,
-        }
-        tabla = tablas.get(pieza.__class__.__name__, 0)
-        if tabla:
-            if pieza.color == "blanco":
-                return tabla[fila][col]
-            else:
-                return tabla[7-fila][col] 
-        return 0
+        # Tabla acotada que se conserva entre los movimientos de la partida
+        self.megabytes_tabla = megabytes_tabla
+        self.tabla_transposicion = TablaTransposicion(megabytes_tabla, politica_tabla)
+        # Movimientos asesinos e historia para ordenar los movimientos de cada nodo
+        self.ordenacion = OrdenMovimientos()
+        # Variación principal de la última iteración completa, como lista y por clave Zobrist
+        self.variacion_principal: list = []
+        self._movimientos_vp: dict[int, tuple] = {}
+        self.profundidad_alcanzada = 0
+        # Mejor movimiento y valor de cada iteración completada en la última búsqueda
+        self.resultados_iteraciones: dict[int, tuple] = {}
+        self._limite_tiempo: Optional[float] = None
+        self._nodos = 0
 
     def es_paso_final(self, tablero: Tablero) -> bool:
-        piezas_totales = sum(1 for fila in tablero.casillas for c in fila if c)
-        return piezas_totales <= 14 
+        # Lectura O(1) de la fase que mantiene el tablero, en lugar de contar piezas
+        return tablero.fase <= FASE_FINAL
 
     def evaluar_material(self, tablero: Tablero) -> int:
-        valor = 0
-        for fila in tablero.casillas:
-            for pieza in fila:
-                if pieza:
-                    valor += pieza.valor if pieza.color == self.color else -pieza.valor
-        return valor
+        # El tablero mantiene el material a favor de las blancas al hacer y deshacer movimientos
+        return tablero.material * SIGNO[self.color]
 
-    def evaluar_posicional(self, tablero: Tablero, fase_juego: str) -> int:
-        valor = 0
-        for fila in range(8):
-            for col in range(8):
-                pieza = tablero.casillas[fila][col]
-                if pieza:
-                    pos_val = self.valor_posicional(pieza, fila, col, fase_juego)
-                    if pieza.color == self.color:
-                        valor += pos_val
-                    else:
-                        valor -= pos_val
-        return valor
+    def evaluar_posicional(self, tablero: Tablero) -> int:
+        # Mezcla de las sumas PeSTO de medio juego y final según la fase (evaluación graduada)
+        fase = min(tablero.fase, FASE_MAXIMA)
+        valor = (tablero.posicional_medio * fase + tablero.posicional_final * (FASE_MAXIMA - fase)) // FASE_MAXIMA
+        return valor * SIGNO[self.color]
 
     def movilidad(self, tablero: Tablero, color: str) -> int:
-        # Cuenta movimientos legales del jugador para valorar movilidad
-        movimientos = self.generar_movimientos(tablero, color)
-        return len(movimientos)
+        # Casillas a las que pueden ir las piezas del jugador (ver `movilidades`)
+        blancas, negras = self.movilidades(tablero)
+        return blancas if color == "blanco" else negras
+
+    @staticmethod
+    def movilidades(tablero: Tablero) -> tuple[int, int]:
+        """
+        Calcula la movilidad de ambos colores en una sola pasada, sin generar movimientos.
+
+        La movilidad de cada pieza es el número de casillas de su máscara de ataque que no
+        ocupan piezas propias (las deslizantes se cortan en el primer bloqueo); la de un
+        peón, sus capturas más los avances a casillas libres. Es una aproximación
+        pseudolegal: no descuenta clavadas ni jaques.
+
+        Parámetros:
+        -----------
+        tablero : Tablero
+            Tablero a evaluar.
+
+        Retorna:
+        --------
+        tuple[int, int]
+            Movilidad de las blancas y de las negras.
+        """
+        piezas = [(indice, codigo) for indice, codigo in enumerate(tablero.codigos) if codigo]
+        ocupacion_blancas = ocupacion_negras = 0
+        for indice, codigo in piezas:
+            if codigo > 0:
+                ocupacion_blancas |= 1 << indice
+            else:
+                ocupacion_negras |= 1 << indice
+        ocupacion = ocupacion_blancas | ocupacion_negras
+
+        movilidad_blancas = movilidad_negras = 0
+        for indice, codigo in piezas:
+            if codigo > 0:
+                propias, rivales, color, avance = ocupacion_blancas, ocupacion_negras, "blanco", indice - 8
+            else:
+                propias, rivales, color, avance = ocupacion_negras, ocupacion_blancas, "negro", indice + 8
+            tipo = abs(codigo)
+            if tipo == CODIGO_PEON:
+                destinos = ATAQUES_PEON[color][indice] & rivales
+                if 0 <= avance < 64 and not (ocupacion >> avance) & 1:
+                    destinos |= 1 << avance
+                    # Doble avance desde la fila inicial (fila 6 las blancas, 1 las negras)
+                    doble = 2 * avance - indice
+                    if indice // 8 == (6 if codigo > 0 else 1) and not (ocupacion >> doble) & 1:
+                        destinos |= 1 << doble
+            elif tipo == CODIGO_CABALLO:
+                destinos = ATAQUES_CABALLO[indice] & ~propias
+            elif tipo == CODIGO_REY:
+                destinos = ATAQUES_REY[indice] & ~propias
+            else:
+                destinos = _ATAQUES_DESLIZANTES[tipo](indice, ocupacion) & ~propias
+            if codigo > 0:
+                movilidad_blancas += destinos.bit_count()
+            else:
+                movilidad_negras += destinos.bit_count()
+        return movilidad_blancas, movilidad_negras
 
     def generar_movimientos(self, tablero:Tablero,color:str)->list:
         """
-        Genera todos los movimientos válidos para un jugador de un color dado.
+        Genera todos los movimientos legales para un jugador de un color dado.
 
         Parametros:
         -----------
@@ -141,96 +191,491 @@ class IADeAjedrez:
         list
             Una lista de tuplas que contienen la pieza y el movimiento válido generado.
         """
-        movimientos = []
-        for fila in range(8):
-            for col in range(8):
-                pieza = tablero.casillas[fila][col]
-                if pieza and pieza.color == color:
-                    legales = pieza.obtener_movimientos_validos(
-                        (fila, col), tablero
-                    )
-                    for movimiento in legales:
-                        movimientos.append(((fila,col),movimiento))
-        return movimientos
+        # Cada motor de tablero genera a su manera (objetos o bitboards) y se filtra
+        # con clavadas y máscara de jaque, sin hacer movimientos de prueba
+        return tablero.generar_movimientos_legales(color)
 
     def evaluar(self, tablero: Tablero) -> int:
-        fase_juego = "final" if self.es_paso_final(tablero) else "medio"
-
         valor = 0
         valor += self.evaluar_material(tablero)
-        valor += self.evaluar_posicional(tablero, fase_juego)
+        valor += self.evaluar_posicional(tablero)
 
-        valor += (self.movilidad(tablero, self.color) - self.movilidad(tablero, self.color_enemigo)) * 10
+        movilidad_blancas, movilidad_negras = self.movilidades(tablero)
+        valor += (movilidad_blancas - movilidad_negras) * SIGNO[self.color] * 10
 
         return valor
     @staticmethod
     def valor_pieza_en(casilla: tuple[int, int],tablero:Tablero) -> int:
-        pieza = tablero.casillas[casilla[0]][casilla[1]]
-        return pieza.valor if pieza else 0
+        return VALORES[abs(tablero.codigos[casilla[0] * 8 + casilla[1]])]
 
-    def alfa_beta(self, tablero:Tablero, profundidad:int, alfa:float, beta:float, maximizando:bool)->float:  
+    def _riesgo_zugzwang(self, tablero: Tablero) -> bool:
+        """
+        Indica si pasar el turno puede ser mejor que cualquier movimiento: en un final
+        (`es_paso_final`) en el que al jugador que mueve solo le quedan rey y peones.
+        """
+        if not self.es_paso_final(tablero):
+            return False
+        signo = SIGNO[tablero.turno]
+        return all(codigo * signo <= 0 or codigo * signo in (CODIGO_PEON, CODIGO_REY) for codigo in tablero.codigos)
+
+    def evaluar_turno(self, tablero: Tablero) -> int:
+        """
+        Evalúa la posición desde el punto de vista del jugador al que le toca mover,
+        como necesita negamax (`evaluar` puntúa siempre para el color de la IA).
         """
-        Implementa el algoritmo de búsqueda Alfa-Beta para la selección del mejor movimiento.
+        valor = self.evaluar(tablero)
+        return valor if tablero.turno == self.color else -valor
+
+    def negamax(self, tablero:Tablero, profundidad:int, alfa:int, beta:int, ply:int=0, permitir_nulo:bool=True)->int:
+        """
+        Búsqueda negamax con poda alfa-beta y búsqueda de variación principal (PVS).
+
+        Las puntuaciones son siempre para el jugador al que le toca mover, así que el
+        valor de un hijo es el opuesto del que devuelve su búsqueda con la ventana
+        (-beta, -alfa) invertida. El primer movimiento (el de la variación principal o
+        la tabla de transposición) se busca con la ventana completa y el resto con una
+        ventana nula (alfa, alfa + 1) que solo comprueba si lo mejoran; solo si alguno
+        lo hace se vuelve a buscar con la ventana completa.
+
+        Fuera de la variación principal se aplican dos podas: el movimiento nulo (si ni
+        pasando el turno el rival baja de beta, el nodo se corta) y la reducción de los
+        movimientos tranquilos tardíos, que se buscan con menos profundidad y solo se
+        repiten a profundidad completa si mejoran alfa.
 
         Parametros:
         -----------
         tablero : Tablero
             El tablero de ajedrez sobre el cual se realiza la búsqueda.
         profundidad : int
-            La profundidad actual de la búsqueda.
-        alfa : float
-            El valor mínimo que el jugador maximizante está dispuesto a aceptar.
-        beta : float
-            El valor máximo que el jugador minimizante está dispuesto a aceptar.
-        maximizando : bool
-            Indica si es el turno del jugador maximizante (IA) o del minimizante (Jugador).
+            La profundidad restante de la búsqueda.
+        alfa : int
+            Puntuación que el jugador al que le toca mover ya tiene asegurada.
+        beta : int
+            Puntuación a partir de la cual el rival evitará esta posición.
+        ply : int
+            Distancia a la raíz (para los movimientos asesinos y la distancia de los mates).
+        permitir_nulo : bool
+            False justo después de un movimiento nulo, para no encadenar dos.
 
         Retorna:
         --------
-        float
-            El valor de la mejor jugada encontrada en el árbol de búsqueda.
+        int
+            El valor de la posición para el jugador al que le toca mover. Si queda fuera
+            de (alfa, beta) es solo una cota del valor real.
+
+        Lanza:
+        ------
+        TiempoAgotado
+            Si se supera el tiempo asignado al movimiento.
         """
-        tablero_hash = tablero.generar_hash()
+        self._nodos += 1
+        if self._limite_tiempo is not None and self._nodos % NODOS_ENTRE_CONSULTAS_RELOJ == 0:
+            if time.perf_counter() >= self._limite_tiempo:
+                raise TiempoAgotado()
+
+        if ply:
+            # Con pocas piezas el valor exacto está en las tablas de finales
+            valor_final = self._sondear_finales(tablero, ply)
+            if valor_final is not None:
+                return valor_final
+
+        clave = tablero.clave_zobrist  # Clave Zobrist incremental, sin recorrer el tablero
+        alfa_original = alfa
+
+        # La clave incluye el turno, así que la puntuación guardada es del jugador que
+        # mueve; la cota indica si es exacta o solo un límite por un corte alfa-beta
+        entrada = self.tabla_transposicion.sondear(clave)
+        movimiento_tabla = None
+        if entrada is not None:
+            profundidad_tabla, valor_tabla, cota, movimiento_tabla = entrada
+            valor_tabla = _valor_desde_tabla(valor_tabla, ply)
+            if profundidad_tabla >= profundidad:
+                if cota == EXACTA:
+                    return valor_tabla
+                if cota == COTA_INFERIOR:
+                    alfa = max(alfa, valor_tabla)
+                else:
+                    beta = min(beta, valor_tabla)
+                if alfa >= beta:
+                    return valor_tabla
 
-        if (tablero_hash, profundidad, maximizando) in self.transposition_table:
-            return self.transposition_table[(tablero_hash, profundidad, maximizando)]
-        
         if profundidad == 0:
-            evaluacion = self.evaluar(tablero)
-            self.transposition_table[(tablero_hash, profundidad, maximizando)] = evaluacion
-            return evaluacion
-
-        color = self.color if maximizando else self.color_enemigo
-        movimientos = self.generar_movimientos(tablero, color)
-        movimientos.sort(key=lambda mov: IADeAjedrez.valor_pieza_en(mov[1],tablero), reverse=True) # ordeno movimientos para primero los que pueden eliminar algo de mayor valor para podar mejor los movimientos
-        mejor_valor = -INF if maximizando else INF
-        
-        for origen, movimiento in movimientos:
-            tablero.hacer_movimiento(origen, movimiento)
-            valor = self.alfa_beta(tablero, profundidad - 1, alfa, beta, not maximizando)
-            tablero.deshacer_ultimo_movimiento()
-            
-            if maximizando:
-                mejor_valor = max(mejor_valor, valor)
-                alfa = max(alfa, valor)
+            # En lugar de evaluar una posición con capturas pendientes, se resuelven antes
+            valor = self.quiescencia(tablero, alfa, beta, ply)
+            if valor <= alfa_original:
+                cota = COTA_SUPERIOR
+            elif valor >= beta:
+                cota = COTA_INFERIOR
             else:
-                mejor_valor = min(mejor_valor, valor)
-                beta = min(beta, valor)
-            
-            if beta <= alfa:
+                cota = EXACTA
+            self.tabla_transposicion.guardar(clave, 0, _valor_a_tabla(valor, ply), cota)
+            return valor
+
+        en_jaque = tablero.validador.esta_en_jaque(tablero.turno)
+        es_vp = beta - alfa > 1
+        if (
+            permitir_nulo and self.reduccion_nulo and not es_vp and not en_jaque
+            and profundidad > self.reduccion_nulo and beta < INF // 2
+            and not self._riesgo_zugzwang(tablero)
+        ):
+            estado = tablero.hacer_movimiento_nulo()
+            try:
+                valor = -self.negamax(tablero, profundidad - 1 - self.reduccion_nulo, -beta, -beta + 1, ply + 1, False)
+            finally:
+                tablero.deshacer_movimiento_nulo(estado)
+            if valor >= beta:
+                return valor if valor < INF // 2 else beta
+
+        movimientos = self.generar_movimientos(tablero, tablero.turno)
+        if not movimientos:
+            # Jaque mate o rey ahogado (tablas); cuanto más lejos de la raíz, menos vale el
+            # mate, así que se prefiere el más corto y se retrasa el propio
+            return -INF + ply if en_jaque else 0
+
+        # Se prueba primero el movimiento de la variación principal de la iteración anterior
+        # y, si la posición no está en ella, el mejor de la tabla de transposición; después
+        # capturas, asesinos e historia (ver `juego/ordenacion.py`)
+        movimiento_previo = self._movimientos_vp.get(clave, movimiento_tabla)
+        ordenados = self.ordenacion.seleccionar(tablero.codigos, movimientos, movimiento_previo, ply)
+
+        mejor_valor = -INF
+        mejor_movimiento = None
+        for indice, (origen, movimiento) in enumerate(ordenados):
+            reduccion = 0
+            if (
+                self.reduccion_tardia and indice >= self.movimientos_sin_reducir and profundidad >= 3
+                and not en_jaque and not es_tactico(tablero.codigos, (origen, movimiento))
+            ):
+                reduccion = min(self.reduccion_tardia, profundidad - 2)
+            tablero.hacer_movimiento(origen, movimiento)
+            try:
+                if indice == 0:
+                    valor = -self.negamax(tablero, profundidad - 1, -beta, -alfa, ply + 1)
+                else:
+                    valor = -self.negamax(tablero, profundidad - 1 - reduccion, -alfa - 1, -alfa, ply + 1)
+                    if reduccion and valor > alfa:
+                        # El movimiento reducido mejora alfa: se comprueba sin reducir
+                        valor = -self.negamax(tablero, profundidad - 1, -alfa - 1, -alfa, ply + 1)
+                    if alfa < valor < beta:
+                        valor = -self.negamax(tablero, profundidad - 1, -beta, -alfa, ply + 1)
+            finally:
+                # Si se agota el tiempo el tablero queda igualmente como estaba
+                tablero.deshacer_ultimo_movimiento()
+
+            if valor > mejor_valor:
+                mejor_valor, mejor_movimiento = valor, (origen, movimiento)
+            alfa = max(alfa, valor)
+            if alfa >= beta:
+                self.ordenacion.registrar_corte(tablero.codigos, mejor_movimiento, ply, profundidad)
                 break
-        self.transposition_table[(tablero_hash, profundidad, maximizando)] = mejor_valor
+
+        if mejor_valor <= alfa_original:
+            cota = COTA_SUPERIOR
+        elif mejor_valor >= beta:
+            cota = COTA_INFERIOR
+        else:
+            cota = EXACTA
+        self.tabla_transposicion.guardar(clave, profundidad, _valor_a_tabla(mejor_valor, ply), cota, mejor_movimiento)
+        return mejor_valor
+
+    def quiescencia(self, tablero: Tablero, alfa: int, beta: int, ply: int = 0) -> int:
+        """
+        Búsqueda de quietud: desde una hoja solo se siguen capturas y promociones hasta
+        llegar a una posición tranquila, para no evaluar a mitad de un intercambio
+        (efecto horizonte).
+
+        El jugador que mueve puede no capturar ("stand pat"), así que la evaluación
+        estática es una cota inferior: si ya supera beta se corta. Se descartan las
+        capturas que no llegarían a alfa ni sumando el material ganado y un margen
+        (poda delta) y las que pierden material según el intercambio estático (SEE).
+
+        Parametros:
+        -----------
+        tablero : Tablero
+            El tablero de ajedrez sobre el cual se realiza la búsqueda.
+        alfa : int
+            Puntuación que el jugador al que le toca mover ya tiene asegurada.
+        beta : int
+            Puntuación a partir de la cual el rival evitará esta posición.
+        ply : int
+            Distancia a la raíz (para la distancia de las victorias de las tablas de finales).
+
+        Retorna:
+        --------
+        int
+            El valor de la posición para el jugador al que le toca mover.
+
+        Lanza:
+        ------
+        TiempoAgotado
+            Si se supera el tiempo asignado al movimiento.
+        """
+        self._nodos += 1
+        if self._limite_tiempo is not None and self._nodos % NODOS_ENTRE_CONSULTAS_RELOJ == 0:
+            if time.perf_counter() >= self._limite_tiempo:
+                raise TiempoAgotado()
+
+        valor_final = self._sondear_finales(tablero, ply)
+        if valor_final is not None:
+            return valor_final
+
+        estatica = self.evaluar_turno(tablero)
+        if estatica >= beta:
+            return estatica
+        alfa = max(alfa, estatica)
+
+        codigos = tablero.codigos
+        candidatos = []
+        for origen, destino in self.generar_movimientos(tablero, tablero.turno):
+            indice_destino = destino[0] * 8 + destino[1]
+            atacante = abs(codigos[origen[0] * 8 + origen[1]])
+            capturada = abs(codigos[indice_destino])
+            es_peon = atacante == CODIGO_PEON
+            promocion = es_peon and destino[0] in (0, 7)
+            if not capturada and es_peon and origen[1] != destino[1]:
+                capturada = CODIGO_PEON  # Captura al paso
+            if not capturada and not promocion:
+                continue
+
+            ganancia = VALORES[capturada]
+            if promocion:
+                ganancia += VALORES[CODIGO_REINA] - VALORES[CODIGO_PEON]
+            if estatica + ganancia + MARGEN_DELTA <= alfa:
+                continue
+            if capturada and VALORES[capturada] < VALORES[atacante] and intercambio_estatico(codigos, origen, destino) < 0:
+                continue
+            # MVV-LVA: primero la víctima más valiosa con el atacante más barato
+            candidatos.append((valor_mvv_lva(codigos, (origen, destino)), origen, destino))
+
+        candidatos.sort(reverse=True)
+        mejor_valor = estatica
+        for _, origen, destino in candidatos:
+            tablero.hacer_movimiento(origen, destino)
+            try:
+                valor = -self.quiescencia(tablero, -beta, -alfa, ply + 1)
+            finally:
+                tablero.deshacer_ultimo_movimiento()
+
+            if valor > mejor_valor:
+                mejor_valor = valor
+            if valor > alfa:
+                alfa = valor
+                if alfa >= beta:
+                    break
+
         return mejor_valor
 
+    @staticmethod
+    def tiempo_desde_reloj(restante_ms: int, incremento_ms: int=0, movimientos_restantes: int=MOVIMIENTOS_RESTANTES_ESTIMADOS) -> int:
+        """
+        Calcula el tiempo a dedicar a un movimiento a partir del reloj de la partida.
+
+        Parámetros:
+        -----------
+        restante_ms : int
+            Tiempo que le queda en el reloj al jugador.
+        incremento_ms : int
+            Incremento por movimiento.
+        movimientos_restantes : int
+            Movimientos entre los que se reparte el tiempo restante.
+
+        Retorna:
+        --------
+        int
+            Milisegundos para el movimiento (nunca más de lo que queda en el reloj).
+
+        Lanza:
+        ------
+        ValueError
+            Si el tiempo restante es negativo o el número de movimientos no es positivo.
+        """
+        if restante_ms < 0 or movimientos_restantes <= 0:
+            raise ValueError("Reloj de partida no válido.")
+        return min(restante_ms, restante_ms // movimientos_restantes + incremento_ms * 3 // 4)
+
+    def _extraer_variacion_principal(self, tablero: Tablero, profundidad: int) -> list:
+        """
+        Recorre los mejores movimientos guardados en la tabla de transposición desde la
+        posición actual, sin superar la profundidad ni repetir posiciones.
+        """
+        variacion = []
+        vistas = set()
+        while len(variacion) < profundidad and tablero.clave_zobrist not in vistas:
+            vistas.add(tablero.clave_zobrist)
+            entrada = self.tabla_transposicion.sondear(tablero.clave_zobrist)
+            if entrada is None or entrada[3] is None:
+                break
+            movimiento = entrada[3]
+            if movimiento not in tablero.generar_movimientos_legales(tablero.turno):
+                break
+            variacion.append(movimiento)
+            tablero.hacer_movimiento(*movimiento)
+        for _ in variacion:
+            tablero.deshacer_ultimo_movimiento()
+        return variacion
+
+    def _buscar_raiz(self, tablero: Tablero, movimientos: list, profundidad: int, alfa: int, beta: int) -> tuple:
+        """
+        Busca los movimientos de la raíz con PVS: el primero con la ventana (alfa, beta)
+        y el resto con ventana nula, llevando alfa de un movimiento al siguiente.
+
+        Retorna:
+        --------
+        tuple
+            (mejor_movimiento, mejor_valor). Si el valor queda fuera de (alfa, beta) el
+            movimiento no es fiable y hay que repetir la búsqueda con otra ventana.
+        """
+        mejor_valor = -INF
+        mejor_movimiento: Optional[tuple] = None
+        for indice, (origen, destino) in enumerate(movimientos):
+
+            tablero.hacer_movimiento(origen, destino)
+            try:
+                if indice == 0:
+                    valor = -self.negamax(tablero, profundidad - 1, -beta, -alfa, 1)
+                else:
+                    valor = -self.negamax(tablero, profundidad - 1, -alfa - 1, -alfa, 1)
+                    if alfa < valor < beta:
+                        valor = -self.negamax(tablero, profundidad - 1, -beta, -alfa, 1)
+            finally:
+                tablero.deshacer_ultimo_movimiento()
+
+            if valor > mejor_valor or mejor_movimiento is None:
+                mejor_valor = valor
+                mejor_movimiento = (origen, destino)
+            alfa = max(alfa, valor)
+            if alfa >= beta:
+                break
+
+        return mejor_movimiento, mejor_valor
+
+    def _buscar_con_aspiracion(self, tablero: Tablero, movimientos: list, profundidad: int, valor_previo: Optional[int]) -> tuple:
+        """
+        Busca la raíz con una ventana de aspiración centrada en el valor de la iteración
+        anterior; si el resultado cae fuera, se ensancha por ese lado y se repite hasta
+        que quede dentro o la ventana sea completa.
+
+        Retorna:
+        --------
+        tuple
+            (mejor_movimiento, mejor_valor) con un valor exacto.
+        """
+        if valor_previo is None or abs(valor_previo) >= INF // 2:
+            return self._buscar_raiz(tablero, movimientos, profundidad, -INF, INF)
+
+        margen_bajo = margen_alto = VENTANA_ASPIRACION
+        while True:
+            alfa = valor_previo - margen_bajo if margen_bajo < INF else -INF
+            beta = valor_previo + margen_alto if margen_alto < INF else INF
+            mejor_movimiento, valor = self._buscar_raiz(tablero, movimientos, profundidad, alfa, beta)
+            if valor <= alfa and alfa > -INF:
+                margen_bajo *= 4
+            elif valor >= beta and beta < INF:
+                margen_alto *= 4
+            else:
+                return mejor_movimiento, valor
+
+    def movimiento_de_libro(self, tablero: Tablero) -> Optional[tuple]:
+        """
+        Consulta el libro de aperturas para la posición actual.
+
+        Parámetros:
+        -----------
+        tablero : Tablero
+            Posición en la que mueve la IA.
+
+        Retorna:
+        --------
+        Optional[tuple]
+            Movimiento del libro elegido según los pesos, o None si no hay libro o la
+            posición no está en él.
+        """
+        if self.libro is None:
+            return None
+        return self.libro.elegir(tablero.clave_zobrist, self.generar_movimientos(tablero, self.color))
+
+    def _sondear_finales(self, tablero: Tablero, ply: int = 0) -> Optional[int]:
+        # Valor exacto de la posición para el jugador que mueve, o None si no está en las
+        # tablas; como los mates, la victoria vale menos cuanto más lejos de la raíz
+        if self.finales is None or tablero.numero_piezas > self.finales.max_piezas:
+            return None
+        resultado = self.finales.sondear(tablero.codigos, tablero.turno)
+        if resultado is None:
+            return None
+        resultado, dtm = resultado
+        return resultado * (VALOR_FINAL_GANADO - dtm - ply)
+
+    def movimiento_de_finales(self, tablero: Tablero) -> Optional[tuple]:
+        """
+        Elige el movimiento directamente con las tablas de finales.
+
+        Si gana, el movimiento que da mate antes; si pierde, el que lo retrasa más; si es
+        tablas, uno que las mantenga (a igualdad, el de mejor evaluación estática).
+
+        Parámetros:
+        -----------
+        tablero : Tablero
+            Posición en la que mueve la IA.
 
-    def encontrar_mejor_movimiento(self, tablero: Tablero) -> tuple:
+        Retorna:
+        --------
+        Optional[tuple]
+            Movimiento elegido, o None si la posición o alguna de sus sucesoras no están
+            en las tablas (entonces hay que buscar).
+        """
+        if self._sondear_finales(tablero) is None:
+            return None
+        mejor_movimiento = None
+        mejor_clave = None
+        for movimiento in self.generar_movimientos(tablero, tablero.turno):
+            tablero.hacer_movimiento(*movimiento)
+            try:
+                valor = self._sondear_finales(tablero)
+                estatica = self.evaluar_turno(tablero)
+            finally:
+                tablero.deshacer_ultimo_movimiento()
+            if valor is None:
+                return None
+            clave = (-valor, -estatica)
+            if mejor_clave is None or clave > mejor_clave:
+                mejor_movimiento, mejor_clave = movimiento, clave
+        return mejor_movimiento
+
+    def movimiento_sin_busqueda(self, tablero: Tablero) -> Optional[tuple]:
+        """
+        Movimiento del libro de aperturas o de las tablas de finales, si la posición está
+        en alguno de ellos; None si hay que buscar.
+        """
+        movimiento = self.movimiento_de_libro(tablero)
+        if movimiento is None:
+            movimiento = self.movimiento_de_finales(tablero)
+        if movimiento is not None:
+            self.variacion_principal = [movimiento]
+            self.profundidad_alcanzada = 0
+            self.resultados_iteraciones = {}
+        return movimiento
+
+    def encontrar_mejor_movimiento(self, tablero: Tablero, tiempo_ms: Optional[int]=None, movimientos_raiz: Optional[list]=None) -> tuple:
         """
-        Encuentra el mejor movimiento utilizando el algoritmo de búsqueda Alfa-Beta.
+        Encuentra el mejor movimiento utilizando negamax con PVS y profundización iterativa.
+
+        Si la posición está en el libro de aperturas o en las tablas de finales se juega
+        su movimiento sin buscar. Si no, se busca a profundidad 1, 2, ... hasta la profundidad máxima o hasta
+        agotar el tiempo; se devuelve el mejor movimiento de la última iteración completa.
+        Cada iteración empieza con una ventana de aspiración alrededor del valor de la anterior.
+        El límite de tiempo vale también para la primera: si ni esa termina, se devuelve el
+        primer movimiento según la ordenación (y `resultados_iteraciones` queda vacío).
 
         Parámetros:
         -----------
         tablero : Tablero
             El tablero de ajedrez donde se realizará la búsqueda del mejor movimiento.
+        tiempo_ms : Optional[int]
+            Tiempo máximo para el movimiento; por defecto el de la instancia (`tiempo_ms`).
+            Ver `tiempo_desde_reloj` para calcularlo a partir de un reloj de partida.
+        movimientos_raiz : Optional[list]
+            Si se indica, solo se buscan estos movimientos de la raíz (búsqueda en
+            paralelo, ver `juego/busqueda_paralela.py`).
 
         Retorna:
         --------
@@ -238,29 +683,69 @@ class IADeAjedrez:
             Devuelve el mejor movimiento encontrado, como una tupla (origen, destino).
             Si no hay movimientos disponibles, devuelve None.
         """
-        mejor_valor: float = -INF
-        mejor_movimiento: Optional[tuple] = None
-        self.transposition_table.clear()
+        if movimientos_raiz is None:
+            movimiento_directo = self.movimiento_sin_busqueda(tablero)
+            if movimiento_directo is not None:
+                return movimiento_directo
+
+        self.tabla_transposicion.nueva_busqueda()
+        self.ordenacion.nueva_busqueda()
         movimientos = self.generar_movimientos(tablero,self.color)
+        if movimientos_raiz is not None:
+            movimientos = [movimiento for movimiento in movimientos if movimiento in movimientos_raiz]
         self.color_enemigo = "blanco" if "negro" == self.color else "negro"
         if self.es_paso_final(tablero): # Aumenta la profundidad de busqueda en caso de que hayan menos piezas, ya que la respuesta en late game es mas rapida aprovechamos para que sea mas "inteligente"
-            profundidad = self.max_profundidad + 1
+            profundidad_maxima = self.max_profundidad + 1
         else:
-            profundidad = self.max_profundidad
+            profundidad_maxima = self.max_profundidad
 
         if not movimientos:
             return None 
 
-        for origen, destino in movimientos:
-
-            tablero.hacer_movimiento(origen, destino)
-
-            valor = self.alfa_beta(tablero,profundidad - 1, -INF, INF, False)
-
+        if tiempo_ms is None:
+            tiempo_ms = self.tiempo_ms
+        inicio = time.perf_counter()
+        limite = None if tiempo_ms is None else inicio + tiempo_ms / 1000
+        # Mientras no hay una iteración anterior, la raíz se ordena como cualquier otro nodo;
+        # el primero es también el movimiento de respaldo si no termina ninguna iteración
+        movimientos = list(self.ordenacion.seleccionar(tablero.codigos, movimientos, None, 0))
+        mejor_movimiento: Optional[tuple] = movimientos[0]
+        valor: Optional[int] = None
+        self.variacion_principal = [mejor_movimiento]
+        self._movimientos_vp = {}
+        self.profundidad_alcanzada = 0
+        self.resultados_iteraciones = {}
+        self._nodos = 0
+
+        # Profundización iterativa: cada iteración completa deja un mejor movimiento válido
+        # y su variación principal ordena la siguiente
+        for profundidad in range(1, profundidad_maxima + 1):
+            self._limite_tiempo = limite
+            try:
+                mejor_movimiento, valor = self._buscar_con_aspiracion(tablero, movimientos, profundidad, valor)
+            except TiempoAgotado:
+                break
+            finally:
+                self._limite_tiempo = None
+            self.profundidad_alcanzada = profundidad
+            self.resultados_iteraciones[profundidad] = (mejor_movimiento, valor)
+
+            movimientos.remove(mejor_movimiento)
+            movimientos.insert(0, mejor_movimiento)
+            # La raíz no se guarda en la tabla: la variación sigue desde el mejor movimiento
+            tablero.hacer_movimiento(*mejor_movimiento)
+            self.variacion_principal = [mejor_movimiento] + self._extraer_variacion_principal(tablero, profundidad - 1)
             tablero.deshacer_ultimo_movimiento()
+            self._movimientos_vp = {}
+            for movimiento in self.variacion_principal:
+                self._movimientos_vp[tablero.clave_zobrist] = movimiento
+                tablero.hacer_movimiento(*movimiento)
+            for _ in self.variacion_principal:
+                tablero.deshacer_ultimo_movimiento()
+
+            # Si ya se ha gastado más de la mitad del tiempo, la siguiente iteración
+            # (bastante más cara) casi seguro no terminaría
+            if limite is not None and time.perf_counter() - inicio > (limite - inicio) / 2:
+                break
 
-            if valor > mejor_valor:
-                mejor_valor = valor
-                mejor_movimiento = (origen, destino)
-
-        return mejor_movimiento
\ No newline at end of file
+        return mejor_movimiento
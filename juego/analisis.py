@@ -0,0 +1,303 @@
+"""
+Módulo con el análisis por lotes de posiciones, pensado para revisar partidas terminadas.
+
+`analizar_lote` recibe posiciones en FEN (sueltas o sacadas de partidas guardadas con
+`posiciones_de_partida`) y las evalúa con `IADeAjedrez` en el pool de procesos compartido
+de `juego/busqueda_paralela.py`. Los resultados se devuelven a medida que terminan, no en
+el orden de entrada (cada uno lleva su `indice`), para poder enviarlos por streaming.
+
+Las posiciones repetidas (las de la apertura se repiten entre las partidas de un día) no
+se buscan de nuevo:
+- cada posición distinta de un lote se analiza una sola vez;
+- una caché acotada guarda los resultados entre lotes, por clave Zobrist y límites;
+- cada proceso del pool conserva su IA, y con ella su tabla de transposición, entre
+  tareas, así que las posiciones cercanas a otras ya analizadas reutilizan su búsqueda.
+
+Para no acaparar el pool que comparten las partidas en curso, solo hay unas pocas tareas
+de análisis en cola a la vez.
+
+Funciones:
+----------
+- posiciones_de_partida
+- analizar_lote
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from juego.tablero import Tablero
+from juego.IAjedrez import IADeAjedrez, INF
+from juego.validador_movimiento import ValidadorMovimiento
+from juego.busqueda_paralela import iniciar_pool
+from juego.sesion_juego import MOTORES_TABLERO
+from juego.finales import tablas_compartidas
+from utiles.file_menager import cargar_partida
+from config import (
+    MOTOR_TABLERO_IA, TRABAJADORES_IA, PATH_FINALES, PROFUNDIDAD_ANALISIS, TIEMPO_ANALISIS_MS,
+    MEGABYTES_TABLA_ANALISIS, CAPACIDAD_CACHE_ANALISIS,
+)
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int]]
+
+# Tareas en cola por cada proceso del pool
+TAREAS_POR_TRABAJADOR = 2
+
+# Resultados ya calculados por (clave Zobrist, profundidad, tiempo), del más antiguo al más
+# reciente; los comparten todas las peticiones de la API, cada una en su hilo
+_resultados: "OrderedDict[Tuple[int, int, Optional[int]], Dict[str, Any]]" = OrderedDict()
+_candado_resultados = threading.Lock()
+
+# IA de análisis por (memoria de la tabla, directorio de finales), una por hilo: en los
+# procesos del pool solo hay uno, pero sin pool varias peticiones analizan a la vez
+_locales = threading.local()
+
+
+def _movimiento_json(movimiento: Movimiento) -> Dict[str, List[int]]:
+    # Mismo formato que los movimientos de las partidas guardadas
+    origen, destino = movimiento
+    return {"origen": list(origen), "destino": list(destino)}
+
+
+def posiciones_de_partida(nombre_archivo: str) -> List[Dict[str, Any]]:
+    """
+    Reproduce una partida guardada y devuelve sus posiciones, listas para `analizar_lote`.
+
+    Las promociones se hacen a dama, como en la sesión de juego. La partida deja de leerse
+    en el primer movimiento ilegal (archivo dañado).
+
+    Parámetros:
+    -----------
+    nombre_archivo : str
+        Nombre del archivo de la partida en `data/partidas`.
+
+    Retorna:
+    --------
+    List[Dict[str, Any]]
+        Una entrada por posición, desde la inicial hasta la final, con `partida`, `ply`,
+        `fen` y `jugada` (el movimiento que se jugó en ella, o None en la última).
+
+    Lanza:
+    ------
+    FileNotFoundError
+        Si la partida no existe.
+    """
+    datos = cargar_partida(nombre_archivo)
+    tablero = Tablero()
+    posiciones = []
+    for ply, registro in enumerate(datos.get("movimientos", [])):
+        movimiento = (tuple(registro["origen"]), tuple(registro["destino"]))
+        if movimiento not in tablero.generar_movimientos_legales(tablero.turno):
+            break
+        posiciones.append({"partida": nombre_archivo, "ply": ply, "fen": tablero.obtener_fen(),
+                           "jugada": _movimiento_json(movimiento)})
+        tablero.hacer_movimiento(*movimiento)
+    posiciones.append({"partida": nombre_archivo, "ply": len(posiciones), "fen": tablero.obtener_fen(), "jugada": None})
+    return posiciones
+
+
+def _ia_de_analisis(megabytes_tabla: float, directorio_finales: Optional[str]) -> IADeAjedrez:
+    ias: Dict[Tuple[float, Optional[str]], IADeAjedrez] = getattr(_locales, "ias", None)
+    if ias is None:
+        ias = _locales.ias = {}
+    clave = (megabytes_tabla, directorio_finales)
+    if clave not in ias:
+        finales = tablas_compartidas(directorio_finales) if directorio_finales is not None else None
+        ias[clave] = IADeAjedrez(megabytes_tabla=megabytes_tabla, finales=finales)
+    return ias[clave]
+
+
+def _analizar_posicion(
+    clase_tablero: Type[Tablero], fen: str, profundidad: int, tiempo_ms: Optional[int],
+    megabytes_tabla: float, directorio_finales: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Analiza una posición en un proceso del pool (o en el propio, si no hay pool).
+
+    Retorna:
+    --------
+    Dict[str, Any]
+        Mejor movimiento, valor para el que mueve y para las blancas, profundidad
+        alcanzada y variación principal.
+    """
+    tablero = clase_tablero()
+    tablero.cargar_fen(fen)
+    ia = _ia_de_analisis(megabytes_tabla, directorio_finales)
+    ia.max_profundidad = profundidad
+    ia.color = tablero.turno
+    signo = 1 if tablero.turno == "blanco" else -1
+
+    movimientos = ia.generar_movimientos(tablero, tablero.turno)
+    if not movimientos:
+        # Posición final: mate (pierde el que mueve) o ahogado
+        valor = -INF if ValidadorMovimiento(tablero).esta_en_jaque(tablero.turno) else 0
+        return {"mejor_movimiento": None, "valor": valor, "valor_blancas": signo * valor,
+                "profundidad": 0, "variacion": []}
+
+    # Con los movimientos de la raíz explícitos siempre se busca (y hay valor), también en
+    # las posiciones de las tablas de finales, que se sondean desde el primer ply
+    mejor_movimiento = ia.encontrar_mejor_movimiento(tablero, tiempo_ms, movimientos)
+    if ia.resultados_iteraciones:
+        mejor_movimiento, valor = ia.resultados_iteraciones[ia.profundidad_alcanzada]
+    else:
+        # Se agotó el tiempo antes de completar la primera iteración: evaluación estática
+        valor = ia.evaluar_turno(tablero)
+    return {
+        "mejor_movimiento": _movimiento_json(mejor_movimiento),
+        "valor": valor,
+        "valor_blancas": signo * valor,
+        "profundidad": ia.profundidad_alcanzada,
+        "variacion": [_movimiento_json(movimiento) for movimiento in ia.variacion_principal],
+    }
+
+
+def _resultado_guardado(clave: Tuple[int, int, Optional[int]]) -> Optional[Dict[str, Any]]:
+    with _candado_resultados:
+        resultado = _resultados.get(clave)
+        if resultado is not None:
+            _resultados.move_to_end(clave)
+        return resultado
+
+
+def _guardar_resultado(clave: Tuple[int, int, Optional[int]], resultado: Dict[str, Any]) -> None:
+    with _candado_resultados:
+        _resultados[clave] = resultado
+        _resultados.move_to_end(clave)
+        while len(_resultados) > CAPACIDAD_CACHE_ANALISIS:
+            _resultados.popitem(last=False)
+
+
+def analizar_lote(
+    posiciones: Iterable[Dict[str, Any]], profundidad: int = PROFUNDIDAD_ANALISIS,
+    tiempo_ms: Optional[int] = TIEMPO_ANALISIS_MS, pool: Optional[ProcessPoolExecutor] = None,
+    trabajadores: int = TRABAJADORES_IA, megabytes_tabla: float = MEGABYTES_TABLA_ANALISIS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Analiza un lote de posiciones y devuelve los resultados a medida que terminan.
+
+    Cada resultado es una copia de la posición de entrada (con los campos que traiga, ej.
+    `partida`, `ply` y `jugada` de `posiciones_de_partida`) más su `indice` en el lote y
+    el análisis: `mejor_movimiento`, `valor` (para el bando que mueve), `valor_blancas`,
+    `profundidad` y `variacion`. Si la posición no se puede analizar (ej. un FEN no
+    válido), lleva `error` en lugar del análisis.
+
+    Sin pool (o con menos de 2 trabajadores), o si el pool se rompe, las posiciones se
+    analizan en el propio proceso.
+
+    Parámetros:
+    -----------
+    posiciones : Iterable[Dict[str, Any]]
+        Posiciones a analizar; cada una con al menos `fen`.
+    profundidad : int
+        Profundidad máxima de la búsqueda de cada posición.
+    tiempo_ms : Optional[int]
+        Tiempo máximo por posición; None busca siempre hasta `profundidad`.
+    pool : Optional[ProcessPoolExecutor]
+        Pool a usar; por defecto el compartido.
+    trabajadores : int
+        Procesos del pool, para decidir cuántas tareas hay en cola a la vez.
+    megabytes_tabla : float
+        Memoria de la tabla de transposición de la IA de cada proceso.
+
+    Retorna:
+    --------
+    Iterator[Dict[str, Any]]
+        Resultados en el orden en que terminan.
+
+    Lanza:
+    ------
+    ValueError
+        Si la profundidad es menor que 1 o el tiempo no es positivo.
+    """
+    if profundidad < 1:
+        raise ValueError("La profundidad del análisis debe ser al menos 1.")
+    if tiempo_ms is not None and tiempo_ms <= 0:
+        raise ValueError("El tiempo del análisis debe ser positivo.")
+    pool = pool if pool is not None else iniciar_pool(trabajadores)
+    if trabajadores < 2:
+        pool = None
+    return _analizar_lote(posiciones, profundidad, tiempo_ms, pool, trabajadores, megabytes_tabla)
+
+
+def _analizar_lote(
+    posiciones: Iterable[Dict[str, Any]], profundidad: int, tiempo_ms: Optional[int],
+    pool: Optional[ProcessPoolExecutor], trabajadores: int, megabytes_tabla: float,
+) -> Iterator[Dict[str, Any]]:
+    clase_tablero = MOTORES_TABLERO[MOTOR_TABLERO_IA]
+    # Las tablas de finales no se envían entre procesos: cada uno abre las suyas una vez
+    directorio_finales = PATH_FINALES if tablas_compartidas(PATH_FINALES) is not None else None
+    argumentos = (profundidad, tiempo_ms, megabytes_tabla, directorio_finales)
+
+    def lanzar(fen: str) -> Future:
+        nonlocal pool
+        if pool is not None:
+            try:
+                return pool.submit(_analizar_posicion, clase_tablero, fen, *argumentos)
+            except (BrokenProcessPool, RuntimeError):
+                pool = None  # Roto o cerrado: el resto del lote se analiza aquí
+        futuro: Future = Future()
+        try:
+            futuro.set_result(_analizar_posicion(clase_tablero, fen, *argumentos))
+        except Exception as error:
+            futuro.set_exception(error)
+        return futuro
+
+    entradas = iter(enumerate(posiciones))
+    agotadas = False
+    # Posiciones del lote que esperan cada análisis en curso y el FEN con que se lanzó
+    esperando: Dict[Tuple[int, int, Optional[int]], List[Dict[str, Any]]] = {}
+    futuros: Dict[Future, Tuple[Tuple[int, int, Optional[int]], str]] = {}
+    try:
+        while True:
+            # Sin pool cada posición se analiza al lanzarla: de una en una para ir devolviéndolas
+            en_cola = TAREAS_POR_TRABAJADOR * trabajadores if pool is not None else 1
+            while not agotadas and len(futuros) < en_cola:
+                try:
+                    indice, posicion = next(entradas)
+                except StopIteration:
+                    agotadas = True
+                    break
+                salida = dict(posicion, indice=indice)
+                fen = posicion.get("fen")
+                try:
+                    if not isinstance(fen, str):
+                        raise ValueError("Falta el FEN de la posición.")
+                    tablero = clase_tablero()
+                    tablero.cargar_fen(fen)
+                except ValueError as error:
+                    yield dict(salida, error=str(error))
+                    continue
+                clave = (tablero.clave_zobrist, profundidad, tiempo_ms)
+                guardado = _resultado_guardado(clave)
+                if guardado is not None:
+                    yield dict(salida, **guardado)
+                elif clave in esperando:
+                    esperando[clave].append(salida)
+                else:
+                    esperando[clave] = [salida]
+                    futuros[lanzar(fen)] = (clave, fen)
+
+            if not futuros:
+                return
+            terminados, _ = wait(futuros, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                clave, fen = futuros.pop(futuro)
+                try:
+                    try:
+                        resultado = futuro.result()
+                    except BrokenProcessPool:
+                        pool = None
+                        resultado = lanzar(fen).result()
+                except Exception as error:
+                    resultado = {"error": str(error)}
+                else:
+                    _guardar_resultado(clave, resultado)
+                for salida in esperando.pop(clave):
+                    yield dict(salida, **resultado)
+    finally:
+        # Si el consumidor abandona el lote (ej. el cliente corta la conexión), se
+        # descartan las tareas que aún no han empezado
+        for futuro in futuros:
+            futuro.cancel()
@@ -0,0 +1,35 @@
+"""
+Módulo con las utilidades básicas para representar el tablero mediante bitboards de 64 bits.
+
+Cada casilla (fila, columna) del tablero se corresponde con el bit `fila * 8 + columna`,
+siguiendo la misma disposición plana de 64 casillas que `SALAS_IA/Bits64.py`
+(índice 0 = a8, índice 63 = h1). Así, "avanzar" para las blancas equivale a restar 8
+al índice (desplazar la máscara a la derecha) y para las negras a sumar 8.
+
+Contenido:
+----------
+- Constantes de columnas, filas y tipos de pieza.
+- Posición del bitboard de cada código de pieza.
+"""
+
+from typing import Tuple
+
+MASCARA_64: int = (1 << 64) - 1
+
+COLUMNA_A: int = sum(1 << (fila * 8) for fila in range(8))
+COLUMNA_H: int = COLUMNA_A << 7
+
+# FILAS[i] contiene las casillas de la fila interna i (0 = octava fila, 7 = primera fila)
+FILAS: Tuple[int, ...] = tuple(0xFF << (8 * fila) for fila in range(8))
+
+# Orden de los tipos de pieza, el mismo que usan los códigos 1..6 de `piezas/codigos.py`
+PEON, CABALLO, ALFIL, TORRE, REINA, REY = range(6)
+
+
+def indice_codigo(codigo: int) -> int:
+    """
+    Devuelve la posición (0-11) del bitboard de una pieza a partir de su código con signo
+    (1-6 blancas, -1..-6 negras, como en `piezas/codigos.py`).
+    """
+    return codigo - 1 if codigo > 0 else 5 - codigo
+
@@ -0,0 +1,226 @@
+"""
+Módulo con la búsqueda en paralelo de la IA sobre un pool de procesos.
+
+Los movimientos de la raíz se reparten entre los procesos del pool. Cada proceso recibe
+la posición en FEN, reconstruye el tablero y hace su propia profundización iterativa
+solo sobre su grupo de movimientos. Cada proceso conserva una IA por cada combinación de
+parámetros de búsqueda, así que su tabla de transposición, los movimientos asesinos y la
+historia pasan de un movimiento de la partida al siguiente, igual que en la búsqueda en
+el propio proceso.
+
+La fusión es determinista: se toma la mayor profundidad que han completado todos los
+grupos y, de los mejores movimientos de cada grupo a esa profundidad, el de mayor valor;
+a igualdad de valor gana el que va antes en el orden de la raíz.
+
+El pool es único por proceso (`iniciar_pool`), de modo que todas las sesiones con IA de
+la API lo comparten. Se crea con el primer movimiento de la IA (no al importar la API) y
+se cierra al terminar el proceso.
+
+Funciones:
+----------
+- iniciar_pool
+- pool_compartido
+- cerrar_pool
+- buscar_en_paralelo
+"""
+
+import atexit
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple, Type
+
+from juego.tablero import Tablero
+from juego.IAjedrez import IADeAjedrez
+from juego.finales import tablas_compartidas
+from config import TRABAJADORES_IA
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int]]
+
+_pool: Optional[ProcessPoolExecutor] = None
+_trabajadores: int = 0
+_candado = threading.Lock()
+_cierre_registrado = False
+
+# IA de cada proceso del pool, por parámetros de búsqueda
+_ias: Dict[tuple, IADeAjedrez] = {}
+
+
+def iniciar_pool(trabajadores: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Crea el pool de procesos compartido, si no existe ya.
+
+    Parámetros:
+    -----------
+    trabajadores : int
+        Número de procesos. Con menos de 2 no se crea pool y la IA busca en el propio proceso.
+
+    Retorna:
+    --------
+    Optional[ProcessPoolExecutor]
+        El pool compartido, o None si no hay ninguno (búsqueda en el propio proceso).
+    """
+    global _pool, _trabajadores, _cierre_registrado
+    if trabajadores < 2:
+        return _pool
+    # Varias peticiones de la API pueden pedir el primer movimiento de la IA a la vez
+    with _candado:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=trabajadores)
+            _trabajadores = trabajadores
+            if not _cierre_registrado:
+                atexit.register(cerrar_pool)
+                _cierre_registrado = True
+    return _pool
+
+
+def pool_compartido() -> Optional[ProcessPoolExecutor]:
+    """
+    Devuelve el pool compartido, o None si no se ha iniciado.
+    """
+    return _pool
+
+
+def cerrar_pool() -> None:
+    """
+    Cierra el pool compartido esperando a que terminen las búsquedas en curso.
+    """
+    global _pool, _trabajadores
+    with _candado:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+        _pool = None
+        _trabajadores = 0
+
+
+def _ia_del_proceso(parametros: dict) -> IADeAjedrez:
+    clave = tuple(sorted(parametros.items()))
+    if clave not in _ias:
+        # Las tablas de finales no se envían entre procesos: cada proceso abre las suyas una vez
+        parametros = dict(parametros)
+        directorio_finales = parametros.pop("directorio_finales", None)
+        finales = tablas_compartidas(directorio_finales) if directorio_finales is not None else None
+        _ias[clave] = IADeAjedrez(**parametros, finales=finales)
+    return _ias[clave]
+
+
+def _buscar_grupo(
+    clase_tablero: Type[Tablero], fen: str, color: str, parametros: dict,
+    movimientos: List[Movimiento], limite: Optional[float],
+) -> Tuple[Dict[int, Tuple[Movimiento, int]], List[Movimiento]]:
+    """
+    Busca un grupo de movimientos de la raíz en un proceso del pool.
+
+    Retorna:
+    --------
+    Tuple[Dict[int, Tuple[Movimiento, int]], List[Movimiento]]
+        Mejor movimiento del grupo y su valor para cada profundidad completada, y la
+        variación principal de la última.
+    """
+    tablero = clase_tablero()
+    tablero.cargar_fen(fen)
+    # encontrar_mejor_movimiento empieza una búsqueda nueva en la tabla (nueva_busqueda):
+    # las entradas de movimientos anteriores se siguen usando, pero pasan a reemplazables
+    ia = _ia_del_proceso(parametros)
+    ia.color = color
+    # El límite es una hora absoluta: descuenta lo que la tarea haya esperado en la cola
+    tiempo_ms = None if limite is None else max(0, int((limite - time.time()) * 1000))
+    ia.encontrar_mejor_movimiento(tablero, tiempo_ms, movimientos)
+    return ia.resultados_iteraciones, ia.variacion_principal
+
+
+def buscar_en_paralelo(
+    ia: IADeAjedrez, tablero: Tablero, tiempo_ms: Optional[int] = None,
+    pool: Optional[ProcessPoolExecutor] = None, trabajadores: Optional[int] = None,
+) -> Optional[Movimiento]:
+    """
+    Encuentra el mejor movimiento repartiendo los movimientos de la raíz entre procesos.
+
+    Si no hay pool (o solo un trabajador) o el pool se ha roto, busca en el propio
+    proceso con `ia.encontrar_mejor_movimiento`. Las posiciones del libro de aperturas
+    y de las tablas de finales de la IA se resuelven aquí mismo, sin ocupar el pool.
+
+    Parámetros:
+    -----------
+    ia : IADeAjedrez
+        IA con el color y los parámetros de búsqueda (profundidad, tabla, podas).
+    tablero : Tablero
+        Posición actual; no se modifica.
+    tiempo_ms : Optional[int]
+        Tiempo máximo para el movimiento; por defecto `ia.tiempo_ms`.
+    pool : Optional[ProcessPoolExecutor]
+        Pool a usar; por defecto el compartido, que se crea aquí la primera vez con
+        `TRABAJADORES_IA` procesos.
+    trabajadores : Optional[int]
+        En cuántos grupos se reparten los movimientos; por defecto los procesos del pool compartido.
+
+    Retorna:
+    --------
+    Optional[Movimiento]
+        Mejor movimiento (origen, destino), o None si no hay movimientos.
+    """
+    if pool is None:
+        pool = iniciar_pool(TRABAJADORES_IA)
+    trabajadores = trabajadores if trabajadores is not None else _trabajadores
+    if pool is None or trabajadores < 2:
+        return ia.encontrar_mejor_movimiento(tablero, tiempo_ms)
+
+    movimiento_directo = ia.movimiento_sin_busqueda(tablero)
+    if movimiento_directo is not None:
+        return movimiento_directo
+
+    movimientos = ia.generar_movimientos(tablero, ia.color)
+    if len(movimientos) < 2:
+        return movimientos[0] if movimientos else None
+
+    # Todos los procesos ven la raíz en el mismo orden; el reparto alterno equilibra los
+    # grupos, porque los movimientos más prometedores quedan al principio
+    ordenados = list(ia.ordenacion.seleccionar(tablero.codigos, movimientos, None, 0))
+    grupos = [ordenados[i::trabajadores] for i in range(min(trabajadores, len(ordenados)))]
+
+    if tiempo_ms is None:
+        tiempo_ms = ia.tiempo_ms
+    limite = None if tiempo_ms is None else time.time() + tiempo_ms / 1000
+    parametros = {
+        "max_profundidad": ia.max_profundidad,
+        "megabytes_tabla": ia.megabytes_tabla,
+        "politica_tabla": ia.tabla_transposicion.politica,
+        "reduccion_nulo": ia.reduccion_nulo,
+        "reduccion_tardia": ia.reduccion_tardia,
+        "movimientos_sin_reducir": ia.movimientos_sin_reducir,
+        "directorio_finales": ia.finales.directorio if ia.finales is not None else None,
+    }
+    fen = tablero.obtener_fen()
+
+    try:
+        futuros = [
+            pool.submit(_buscar_grupo, type(tablero), fen, ia.color, parametros, grupo, limite)
+            for grupo in grupos
+        ]
+        resultados = [futuro.result() for futuro in futuros]
+    except BrokenProcessPool:
+        return ia.encontrar_mejor_movimiento(tablero, tiempo_ms)
+
+    # Un grupo que no completó ni la primera iteración no aporta candidato; si no completó
+    # ninguno, se juega el primer movimiento según la ordenación
+    resultados = [(iteraciones, variacion) for iteraciones, variacion in resultados if iteraciones]
+    if not resultados:
+        ia.profundidad_alcanzada = 0
+        ia.resultados_iteraciones = {}
+        ia.variacion_principal = [ordenados[0]]
+        return ordenados[0]
+    profundidad = min(max(iteraciones) for iteraciones, _ in resultados)
+    orden = {movimiento: i for i, movimiento in enumerate(ordenados)}
+    mejor_movimiento, valor = max(
+        (iteraciones[profundidad] for iteraciones, _ in resultados),
+        key=lambda candidato: (candidato[1], -orden[candidato[0]]),
+    )
+    ia.profundidad_alcanzada = profundidad
+    ia.resultados_iteraciones = {profundidad: (mejor_movimiento, valor)}
+    # La variación del grupo ganador solo vale si ese grupo no pasó de la profundidad común
+    ia.variacion_principal = [mejor_movimiento]
+    for iteraciones, variacion in resultados:
+        if max(iteraciones) == profundidad and variacion[:1] == [mejor_movimiento]:
+            ia.variacion_principal = list(variacion)
+    return mejor_movimiento
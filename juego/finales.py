@@ -0,0 +1,565 @@
+"""
+Módulo con las tablas de finales de la IA: generación retrógrada y sondeo sin red.
+
+Sustituye, para la IA principal, a la consulta por HTTP de `SALAS_IA/LICHESS.py`. Para
+cada firma de material (KQK, KRK, KPK y KBNK: un bando con rey y una o dos piezas contra
+rey solo) se calcula de antemano, para todas las posiciones, si el bando fuerte gana y en
+cuántas medias jugadas da mate con juego perfecto de ambos (DTM). La IA consulta las
+tablas en la raíz y durante la búsqueda en cuanto quedan pocas piezas
+(`IADeAjedrez.movimiento_de_finales`), así que juega estos finales sin buscar.
+
+Formato de las tablas:
+----------------------
+Un archivo `<firma>.dtm` por firma con un byte por posición: 0 si es tablas (o la posición
+es ilegal) y DTM + 1 si no. El resultado se deduce del turno (el bando débil, con el rey
+solo, nunca gana), de modo que el mismo byte sirve de tabla WDL y de DTM. Las tablas se
+escriben siempre con el bando fuerte en blancas; las posiciones con el bando fuerte en
+negras se reflejan verticalmente al sondear. En las firmas sin peones el rey débil se
+lleva por simetría al triángulo a1-d1-d4, lo que reduce la tabla a 10/64 del tamaño.
+
+El índice de una posición es, de más a menos significativo: turno (0 mueve el fuerte,
+1 el débil), casilla del rey débil (en el triángulo si no hay peones), casilla del rey
+fuerte y casilla de cada pieza del bando fuerte en el orden de `FIRMAS`.
+
+Las tablas se abren con mmap: no se cargan en memoria y todos los procesos las comparten.
+Se generan una vez (los archivos no se versionan):
+
+    python -m juego.finales --generar KQK KRK KPK KBNK
+
+Clases:
+-------
+- TablasFinales
+
+Funciones:
+----------
+- generar_tabla
+- tablas_compartidas
+"""
+
+import argparse
+import mmap
+import os
+import time
+from collections import defaultdict
+from itertools import product
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from piezas.codigos import CODIGO_PEON, CODIGO_CABALLO, CODIGO_ALFIL, CODIGO_TORRE, CODIGO_REINA, CODIGO_REY
+from piezas.tablas_ataque import (
+    ATAQUES_REY, ATAQUES_CABALLO, ATAQUES_PEON, INDICES_VECINOS_REY, INDICES_SALTOS_CABALLO, INDICES_RAYOS,
+    DIRECCIONES_ALFIL, DIRECCIONES_TORRE, DIRECCIONES_REINA, ataques_alfil, ataques_torre, ataques_reina,
+)
+from config import PATH_FINALES, PIEZAS_TABLAS_FINALES
+
+# Piezas del bando fuerte (además del rey) de cada firma, en el orden en que se indexan
+FIRMAS: Dict[str, Tuple[int, ...]] = {
+    "KQK": (CODIGO_REINA,),
+    "KRK": (CODIGO_TORRE,),
+    "KPK": (CODIGO_PEON,),
+    "KBNK": (CODIGO_ALFIL, CODIGO_CABALLO),
+}
+
+# Tablas que tienen que existir antes de generar otra: las promociones de KPK llevan a
+# KQK y KRK (las de caballo y alfil son tablas)
+DEPENDENCIAS: Dict[str, Tuple[str, ...]] = {"KPK": ("KQK", "KRK")}
+_PROMOCIONES = (CODIGO_REINA, CODIGO_TORRE)
+
+# Resultado para el bando al que le toca mover
+GANA = 1
+TABLAS = 0
+PIERDE = -1
+
+MUEVE_FUERTE = 0
+MUEVE_DEBIL = 1
+
+_LETRAS = {CODIGO_REINA: "Q", CODIGO_TORRE: "R", CODIGO_ALFIL: "B", CODIGO_CABALLO: "N", CODIGO_PEON: "P"}
+_ORDEN_LETRAS = "QRBNP"
+
+_ATAQUES_DESLIZANTES = {CODIGO_ALFIL: ataques_alfil, CODIGO_TORRE: ataques_torre, CODIGO_REINA: ataques_reina}
+_DIRECCIONES = {CODIGO_ALFIL: DIRECCIONES_ALFIL, CODIGO_TORRE: DIRECCIONES_TORRE, CODIGO_REINA: DIRECCIONES_REINA}
+
+
+def _transformacion(voltear_fila: bool, voltear_columna: bool, trasponer: bool) -> Tuple[int, ...]:
+    tabla = []
+    for casilla in range(64):
+        fila, columna = divmod(casilla, 8)
+        if voltear_fila:
+            fila = 7 - fila
+        if voltear_columna:
+            columna = 7 - columna
+        if trasponer:
+            fila, columna = columna, fila
+        tabla.append(fila * 8 + columna)
+    return tuple(tabla)
+
+
+# Las 8 simetrías del tablero, la identidad primero
+_SIMETRIAS = tuple(
+    _transformacion(fila, columna, trasponer)
+    for trasponer in (False, True) for fila in (False, True) for columna in (False, True)
+)
+
+# Triángulo a1-d1-d4 (la fila 7 es la primera fila del tablero)
+TRIANGULO: Tuple[int, ...] = tuple(
+    casilla for casilla in range(64) if casilla // 8 >= 4 and 7 - casilla // 8 <= casilla % 8 <= 3
+)
+_POSICION_TRIANGULO = {casilla: i for i, casilla in enumerate(TRIANGULO)}
+
+# Simetría que lleva cada casilla del rey débil al triángulo
+_SIMETRIA_REY = tuple(
+    next(simetria for simetria in _SIMETRIAS if simetria[casilla] in _POSICION_TRIANGULO) for casilla in range(64)
+)
+
+
+# Diagonal a1-h8 del triángulo y reflejo sobre ella
+_REFLEJO_DIAGONAL = _transformacion(True, True, True)
+_DIAGONAL = frozenset(casilla for casilla in TRIANGULO if _REFLEJO_DIAGONAL[casilla] == casilla)
+
+
+def _nombre_firma(tipos: Sequence[int]) -> str:
+    return "K" + "".join(sorted((_LETRAS[tipo] for tipo in tipos), key=_ORDEN_LETRAS.index)) + "K"
+
+
+def tamano_tabla(firma: str) -> int:
+    """
+    Número de posiciones (bytes) de la tabla de una firma.
+    """
+    tipos = FIRMAS[firma]
+    reyes = len(TRIANGULO) if CODIGO_PEON not in tipos else 64
+    return 2 * reyes * 64 ** (len(tipos) + 1)
+
+
+def _indice(sin_peones: bool, turno: int, rey_debil: int, rey_fuerte: int, casillas: Sequence[int]) -> int:
+    if sin_peones:
+        simetria = _SIMETRIA_REY[rey_debil]
+        rey = simetria[rey_debil]
+        resto = [simetria[rey_fuerte]] + [simetria[casilla] for casilla in casillas]
+        # Con el rey en la diagonal, la posición y su reflejo sobre ella son la misma:
+        # se elige siempre la menor para que ocupen un solo índice
+        if rey in _DIAGONAL:
+            reflejo = [_REFLEJO_DIAGONAL[casilla] for casilla in resto]
+            if reflejo < resto:
+                resto = reflejo
+        indice = turno * len(TRIANGULO) + _POSICION_TRIANGULO[rey]
+        for casilla in resto:
+            indice = indice * 64 + casilla
+    else:
+        indice = (turno * 64 + rey_debil) * 64 + rey_fuerte
+        for casilla in casillas:
+            indice = indice * 64 + casilla
+    return indice
+
+
+def _posicion(sin_peones: bool, piezas: int, indice: int) -> Tuple[int, int, int, Tuple[int, ...]]:
+    casillas = []
+    for _ in range(piezas):
+        indice, casilla = divmod(indice, 64)
+        casillas.append(casilla)
+    indice, rey_fuerte = divmod(indice, 64)
+    if sin_peones:
+        turno, posicion = divmod(indice, len(TRIANGULO))
+        rey_debil = TRIANGULO[posicion]
+    else:
+        turno, rey_debil = divmod(indice, 64)
+    return turno, rey_debil, rey_fuerte, tuple(reversed(casillas))
+
+
+def _ataques_fuertes(rey_fuerte: int, tipos: Sequence[int], casillas: Sequence[int]) -> int:
+    # El rey débil no bloquea: así se ven también las casillas que deja atrás al huir de un rayo
+    ocupacion = 1 << rey_fuerte
+    for casilla in casillas:
+        ocupacion |= 1 << casilla
+    ataques = ATAQUES_REY[rey_fuerte]
+    for tipo, casilla in zip(tipos, casillas):
+        if tipo == CODIGO_PEON:
+            ataques |= ATAQUES_PEON["blanco"][casilla]
+        elif tipo == CODIGO_CABALLO:
+            ataques |= ATAQUES_CABALLO[casilla]
+        else:
+            ataques |= _ATAQUES_DESLIZANTES[tipo](casilla, ocupacion)
+    return ataques
+
+
+def _respuestas_debil(
+    rey_debil: int, rey_fuerte: int, tipos: Sequence[int], casillas: Sequence[int]
+) -> Tuple[bool, bool, List[int]]:
+    """
+    Movimientos del rey débil: si está en jaque, si puede capturar una pieza (lo que lleva
+    a un final de tablas) y las casillas a las que puede ir sin capturar.
+    """
+    ataques = _ataques_fuertes(rey_fuerte, tipos, casillas)
+    captura = False
+    destinos = []
+    for destino in INDICES_VECINOS_REY[rey_debil]:
+        if ataques >> destino & 1:
+            continue
+        if destino in casillas:
+            captura = True
+        else:
+            destinos.append(destino)
+    return bool(ataques >> rey_debil & 1), captura, destinos
+
+
+def _es_legal(turno: int, rey_debil: int, rey_fuerte: int, tipos: Sequence[int], casillas: Sequence[int]) -> bool:
+    if len({rey_debil, rey_fuerte, *casillas}) != len(casillas) + 2:
+        return False
+    if ATAQUES_REY[rey_fuerte] >> rey_debil & 1:
+        return False
+    for tipo, casilla in zip(tipos, casillas):
+        if tipo == CODIGO_PEON and casilla // 8 in (0, 7):
+            return False
+    # El bando que no mueve no puede estar en jaque
+    return turno == MUEVE_DEBIL or not _ataques_fuertes(rey_fuerte, tipos, casillas) >> rey_debil & 1
+
+
+def _retrocesos_fuertes(
+    rey_debil: int, rey_fuerte: int, tipos: Sequence[int], casillas: Tuple[int, ...]
+) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+    """
+    Posiciones (rey fuerte, casillas) desde las que el bando fuerte llega a esta con un
+    movimiento sin captura (el débil no tiene nada que capturar).
+    """
+    ocupacion = (1 << rey_debil) | (1 << rey_fuerte)
+    for casilla in casillas:
+        ocupacion |= 1 << casilla
+
+    for origen in INDICES_VECINOS_REY[rey_fuerte]:
+        if not ocupacion >> origen & 1 and not ATAQUES_REY[rey_debil] >> origen & 1:
+            yield origen, casillas
+
+    for i, (tipo, casilla) in enumerate(zip(tipos, casillas)):
+        origenes = []
+        if tipo == CODIGO_PEON:
+            # Los peones blancos avanzan hacia la fila 0; ninguno sale de la fila 7
+            origen = casilla + 8
+            if origen < 56 and not ocupacion >> origen & 1:
+                origenes.append(origen)
+                if casilla // 8 == 4 and not ocupacion >> (casilla + 16) & 1:
+                    origenes.append(casilla + 16)
+        elif tipo == CODIGO_CABALLO:
+            origenes = [origen for origen in INDICES_SALTOS_CABALLO[casilla] if not ocupacion >> origen & 1]
+        else:
+            for direccion in _DIRECCIONES[tipo]:
+                for origen in INDICES_RAYOS[direccion][casilla]:
+                    if ocupacion >> origen & 1:
+                        break
+                    origenes.append(origen)
+        for origen in origenes:
+            yield rey_fuerte, casillas[:i] + (origen,) + casillas[i + 1:]
+
+
+def _posiciones_legales(tipos: Sequence[int], turno: int) -> Iterator[Tuple[int, int, Tuple[int, ...]]]:
+    reyes = TRIANGULO if CODIGO_PEON not in tipos else range(64)
+    for rey_debil in reyes:
+        for rey_fuerte in range(64):
+            if rey_fuerte == rey_debil or ATAQUES_REY[rey_fuerte] >> rey_debil & 1:
+                continue
+            for casillas in product(range(64), repeat=len(tipos)):
+                if _es_legal(turno, rey_debil, rey_fuerte, tipos, casillas):
+                    yield rey_debil, rey_fuerte, casillas
+
+
+def _leer_tabla(directorio: str, firma: str) -> bytes:
+    ruta = os.path.join(directorio, f"{firma}.dtm")
+    with open(ruta, "rb") as f:
+        datos = f.read()
+    if len(datos) != tamano_tabla(firma):
+        raise ValueError(f"La tabla {ruta} no tiene el tamaño esperado.")
+    return datos
+
+
+def _semillas_promocion(
+    tipos: Tuple[int, ...], directorio: str, tabla: bytearray, niveles: Dict[int, List[int]]
+) -> None:
+    """
+    Resuelve las posiciones en las que el bando fuerte corona y pasa a otra tabla.
+    """
+    sin_peones = CODIGO_PEON not in tipos
+    dependencias = {}
+    for i, tipo in enumerate(tipos):
+        if tipo != CODIGO_PEON:
+            continue
+        for promocion in _PROMOCIONES:
+            tipos_hija = tipos[:i] + (promocion,) + tipos[i + 1:]
+            firma_hija = _nombre_firma(tipos_hija)
+            if firma_hija not in dependencias:
+                dependencias[firma_hija] = _leer_tabla(directorio, firma_hija)
+
+    for rey_debil, rey_fuerte, casillas in _posiciones_legales(tipos, MUEVE_FUERTE):
+        mejor = None
+        for i, (tipo, casilla) in enumerate(zip(tipos, casillas)):
+            destino = casilla - 8
+            if tipo != CODIGO_PEON or casilla // 8 != 1 or destino in (rey_debil, rey_fuerte) or destino in casillas:
+                continue
+            for promocion in _PROMOCIONES:
+                tipos_hija = tipos[:i] + (promocion,) + tipos[i + 1:]
+                firma_hija = _nombre_firma(tipos_hija)
+                por_tipo = dict(zip(tipos_hija, casillas[:i] + (destino,) + casillas[i + 1:]))
+                casillas_hija = tuple(por_tipo[t] for t in FIRMAS[firma_hija])
+                hija = dependencias[firma_hija][_indice(
+                    CODIGO_PEON not in tipos_hija, MUEVE_DEBIL, rey_debil, rey_fuerte, casillas_hija
+                )]
+                if hija and (mejor is None or hija < mejor):
+                    mejor = hija
+        if mejor is not None:
+            indice = _indice(sin_peones, MUEVE_FUERTE, rey_debil, rey_fuerte, casillas)
+            tabla[indice] = mejor + 1
+            niveles[mejor].append(indice)
+
+
+def generar_tabla(firma: str, directorio: str = PATH_FINALES) -> int:
+    """
+    Genera por análisis retrógrado la tabla de una firma y la escribe en `<firma>.dtm`.
+
+    Se parte de los mates y se retrocede media jugada cada vez: una posición del bando
+    fuerte gana en n + 1 si tiene un movimiento a una posición perdida en n, y una del
+    bando débil pierde en n + 1 cuando todos sus movimientos llevan a posiciones ganadas
+    en n o menos. Capturar una pieza siempre salva al bando débil (queda material
+    insuficiente) y coronar lleva a las tablas de `DEPENDENCIAS`, que deben existir.
+
+    Parámetros:
+    -----------
+    firma : str
+        Una de las claves de `FIRMAS`.
+    directorio : str
+        Directorio de las tablas.
+
+    Retorna:
+    --------
+    int
+        Mayor DTM (en medias jugadas) de la tabla.
+
+    Lanza:
+    ------
+    ValueError
+        Si la firma no está en `FIRMAS`.
+    FileNotFoundError
+        Si falta alguna tabla de la que depende.
+    """
+    if firma not in FIRMAS:
+        raise ValueError(f"Firma desconocida: {firma}. Disponibles: {', '.join(FIRMAS)}.")
+    tipos = FIRMAS[firma]
+    sin_peones = CODIGO_PEON not in tipos
+    tabla = bytearray(tamano_tabla(firma))
+    # niveles[n]: posiciones resueltas con DTM n, pendientes de propagar
+    niveles: Dict[int, List[int]] = defaultdict(list)
+
+    for rey_debil, rey_fuerte, casillas in _posiciones_legales(tipos, MUEVE_DEBIL):
+        en_jaque, captura, destinos = _respuestas_debil(rey_debil, rey_fuerte, tipos, casillas)
+        if en_jaque and not captura and not destinos:
+            indice = _indice(sin_peones, MUEVE_DEBIL, rey_debil, rey_fuerte, casillas)
+            tabla[indice] = 1
+            niveles[0].append(indice)
+    _semillas_promocion(tipos, directorio, tabla, niveles)
+
+    nivel = 0
+    while niveles:
+        siguiente = nivel + 2  # Valor guardado de las posiciones con DTM nivel + 1
+        if siguiente > 255:
+            raise ValueError(f"La tabla {firma} tiene un DTM mayor que el que cabe en un byte.")
+        for indice in niveles.pop(nivel, ()):
+            if tabla[indice] != nivel + 1:
+                continue  # Se encontró después un mate más corto
+            turno, rey_debil, rey_fuerte, casillas = _posicion(sin_peones, len(tipos), indice)
+            if turno == MUEVE_DEBIL:
+                for rey_previo, casillas_previas in _retrocesos_fuertes(rey_debil, rey_fuerte, tipos, casillas):
+                    if _ataques_fuertes(rey_previo, tipos, casillas_previas) >> rey_debil & 1:
+                        continue
+                    previo = _indice(sin_peones, MUEVE_FUERTE, rey_debil, rey_previo, casillas_previas)
+                    if not tabla[previo] or tabla[previo] > siguiente:
+                        tabla[previo] = siguiente
+                        niveles[nivel + 1].append(previo)
+            else:
+                ocupadas = (rey_fuerte,) + casillas
+                for rey_previo in INDICES_VECINOS_REY[rey_debil]:
+                    if rey_previo in ocupadas or ATAQUES_REY[rey_fuerte] >> rey_previo & 1:
+                        continue
+                    previo = _indice(sin_peones, MUEVE_DEBIL, rey_previo, rey_fuerte, casillas)
+                    if tabla[previo]:
+                        continue
+                    _, captura, destinos = _respuestas_debil(rey_previo, rey_fuerte, tipos, casillas)
+                    if captura or not destinos:
+                        continue
+                    if all(
+                        0 < tabla[_indice(sin_peones, MUEVE_FUERTE, destino, rey_fuerte, casillas)] <= nivel + 1
+                        for destino in destinos
+                    ):
+                        tabla[previo] = siguiente
+                        niveles[nivel + 1].append(previo)
+        nivel += 1
+
+    os.makedirs(directorio, exist_ok=True)
+    ruta = os.path.join(directorio, f"{firma}.dtm")
+    with open(ruta + ".tmp", "wb") as f:
+        f.write(tabla)
+    os.replace(ruta + ".tmp", ruta)
+    _tablas.pop(directorio, None)
+    return max(tabla) - 1
+
+
+class TablasFinales:
+    """
+    Tablas de finales de un directorio, abiertas con mmap para sondear posiciones.
+
+    Atributos:
+    ----------
+    directorio : str
+        Directorio de las tablas.
+    firmas : List[str]
+        Firmas cuyas tablas se han encontrado.
+    max_piezas : int
+        Mayor número de piezas (reyes incluidos) de las firmas disponibles.
+
+    Métodos:
+    --------
+    sondear(codigos, turno) -> Optional[Tuple[int, int]]:
+        Resultado y DTM de una posición para el bando que mueve.
+    cerrar() -> None:
+        Libera los mapeos.
+    """
+
+    def __init__(self, directorio: str = PATH_FINALES, max_piezas: Optional[int] = PIEZAS_TABLAS_FINALES) -> None:
+        """
+        Abre las tablas de un directorio. Las firmas sin archivo (o con un tamaño que no
+        corresponde) simplemente no se sondean.
+
+        Parámetros:
+        -----------
+        directorio : str
+            Directorio de las tablas.
+        max_piezas : Optional[int]
+            Solo se abren las tablas de firmas con como mucho estas piezas, reyes incluidos
+            (None: todas las que haya; el límite sale entonces de la mayor firma presente).
+        """
+        self.directorio = directorio
+        self._tablas: Dict[str, mmap.mmap] = {}
+        for firma in FIRMAS:
+            ruta = os.path.join(directorio, f"{firma}.dtm")
+            if max_piezas is not None and len(FIRMAS[firma]) + 2 > max_piezas:
+                continue
+            if os.path.isfile(ruta) and os.path.getsize(ruta) == tamano_tabla(firma):
+                with open(ruta, "rb") as f:
+                    self._tablas[firma] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.firmas: List[str] = list(self._tablas)
+        # Sin tablas aún se reconocen las tablas por material insuficiente (KK, KNK, KBK)
+        self.max_piezas: int = max((len(FIRMAS[firma]) + 2 for firma in self._tablas), default=3)
+
+    def sondear(self, codigos: Sequence[int], turno: str) -> Optional[Tuple[int, int]]:
+        """
+        Consulta una posición en las tablas.
+
+        Parámetros:
+        -----------
+        codigos : Sequence[int]
+            Tablero codificado (`Tablero.codigos`).
+        turno : str
+            Color al que le toca mover.
+
+        Retorna:
+        --------
+        Optional[Tuple[int, int]]
+            (resultado, dtm) para el bando que mueve: GANA, TABLAS o PIERDE y las medias
+            jugadas hasta el mate (0 en tablas). None si la posición no está en ninguna tabla.
+        """
+        blancas: List[Tuple[int, int]] = []
+        negras: List[Tuple[int, int]] = []
+        for casilla, codigo in enumerate(codigos):
+            if codigo:
+                if codigo > 0:
+                    blancas.append((codigo, casilla))
+                else:
+                    negras.append((-codigo, casilla))
+        if len(blancas) + len(negras) > self.max_piezas:
+            return None
+
+        piezas_blancas = [pieza for pieza in blancas if pieza[0] != CODIGO_REY]
+        piezas_negras = [pieza for pieza in negras if pieza[0] != CODIGO_REY]
+        if piezas_blancas and piezas_negras:
+            return None
+        if piezas_blancas:
+            fuertes, color_fuerte, voltear = piezas_blancas, "blanco", 0
+            bando_fuerte, bando_debil = blancas, negras
+        else:
+            fuertes, color_fuerte, voltear = piezas_negras, "negro", 56
+            bando_fuerte, bando_debil = negras, blancas
+        if not fuertes or (len(fuertes) == 1 and fuertes[0][0] in (CODIGO_CABALLO, CODIGO_ALFIL)):
+            return TABLAS, 0
+
+        firma = _nombre_firma([tipo for tipo, _ in fuertes])
+        tabla = self._tablas.get(firma)
+        if tabla is None:
+            return None
+        # Con el bando fuerte en negras se refleja el tablero para que mueva "hacia arriba"
+        por_tipo = {tipo: casilla ^ voltear for tipo, casilla in fuertes}
+        casillas = tuple(por_tipo[tipo] for tipo in FIRMAS[firma])
+        rey_fuerte = next(casilla for tipo, casilla in bando_fuerte if tipo == CODIGO_REY) ^ voltear
+        rey_debil = next(casilla for tipo, casilla in bando_debil if tipo == CODIGO_REY) ^ voltear
+        mueve = MUEVE_FUERTE if turno == color_fuerte else MUEVE_DEBIL
+
+        valor = tabla[_indice(CODIGO_PEON not in FIRMAS[firma], mueve, rey_debil, rey_fuerte, casillas)]
+        if not valor:
+            return TABLAS, 0
+        return (GANA if mueve == MUEVE_FUERTE else PIERDE), valor - 1
+
+    def cerrar(self) -> None:
+        """
+        Libera los mapeos de las tablas.
+        """
+        for datos in self._tablas.values():
+            datos.close()
+        self._tablas = {}
+        self.firmas = []
+
+
+_tablas: Dict[str, TablasFinales] = {}
+
+
+def tablas_compartidas(directorio: str = PATH_FINALES) -> Optional[TablasFinales]:
+    """
+    Devuelve las tablas de un directorio abiertas una sola vez por proceso.
+
+    Parámetros:
+    -----------
+    directorio : str
+        Directorio de las tablas.
+
+    Retorna:
+    --------
+    Optional[TablasFinales]
+        Las tablas, o None si el directorio no tiene ninguna (la IA busca siempre). Un
+        directorio vacío no se recuerda: se vuelve a mirar en la siguiente llamada, por si
+        se han generado las tablas mientras tanto.
+    """
+    if directorio not in _tablas:
+        tablas = TablasFinales(directorio)
+        if not tablas.firmas:
+            return None
+        _tablas[directorio] = tablas
+    return _tablas[directorio]
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Genera las tablas de finales de la IA.")
+    parser.add_argument("--generar", nargs="*", default=list(FIRMAS), choices=list(FIRMAS),
+                        help="Firmas a generar (por defecto todas).")
+    parser.add_argument("--directorio", default=PATH_FINALES, help="Directorio de las tablas.")
+    args = parser.parse_args()
+
+    pendientes: List[str] = []
+    for firma in args.generar:
+        for dependencia in DEPENDENCIAS.get(firma, ()):
+            ruta = os.path.join(args.directorio, f"{dependencia}.dtm")
+            if dependencia not in pendientes and (dependencia in args.generar or not os.path.isfile(ruta)):
+                pendientes.append(dependencia)
+        if firma not in pendientes:
+            pendientes.append(firma)
+
+    for firma in pendientes:
+        inicio = time.perf_counter()
+        dtm = generar_tabla(firma, args.directorio)
+        print(f"{firma}: {tamano_tabla(firma)} posiciones, DTM máximo {dtm} medias jugadas, "
+              f"{time.perf_counter() - inicio:.1f} s")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,107 @@
+"""
+Módulo con la evaluación estática de intercambios (SEE) sobre el tablero codificado.
+
+Calcula, sin hacer movimientos, el material que gana o pierde una captura si ambos
+bandos siguen recapturando en la misma casilla, siempre con su pieza de menor valor.
+La búsqueda de quietud lo usa para descartar capturas que pierden material.
+
+Funciones:
+----------
+- intercambio_estatico
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from piezas.codigos import (
+    VALORES, CODIGO_PEON, CODIGO_CABALLO, CODIGO_ALFIL, CODIGO_TORRE, CODIGO_REINA, CODIGO_REY,
+)
+from piezas.tablas_ataque import (
+    INDICES_SALTOS_CABALLO, INDICES_VECINOS_REY, INDICES_CAPTURAS_PEON, INDICES_RAYOS,
+    DIRECCIONES_ALFIL, DIRECCIONES_TORRE,
+)
+
+
+def _atacante_menor(codigos: Sequence[int], indice: int, signo: int) -> Optional[int]:
+    """
+    Devuelve la casilla de la pieza de menor valor del bando `signo` que ataca `indice`,
+    o None si no hay ninguna. Los rayos se cortan en la primera pieza, así que al retirar
+    un atacante aparecen los que estaban detrás (rayos X).
+    """
+    # Un peón atacante está donde capturaría un peón del otro color
+    color_defensor = "negro" if signo > 0 else "blanco"
+    peon = signo * CODIGO_PEON
+    for i in INDICES_CAPTURAS_PEON[color_defensor][indice]:
+        if codigos[i] == peon:
+            return i
+
+    caballo = signo * CODIGO_CABALLO
+    for i in INDICES_SALTOS_CABALLO[indice]:
+        if codigos[i] == caballo:
+            return i
+
+    mejor: Optional[int] = None
+    valor_mejor = 0
+    reina = signo * CODIGO_REINA
+    for direcciones, deslizante in ((DIRECCIONES_ALFIL, signo * CODIGO_ALFIL), (DIRECCIONES_TORRE, signo * CODIGO_TORRE)):
+        for direccion in direcciones:
+            for i in INDICES_RAYOS[direccion][indice]:
+                codigo = codigos[i]
+                if codigo:
+                    if (codigo == deslizante or codigo == reina) and (mejor is None or VALORES[abs(codigo)] < valor_mejor):
+                        mejor, valor_mejor = i, VALORES[abs(codigo)]
+                    break
+    if mejor is not None:
+        return mejor
+
+    rey = signo * CODIGO_REY
+    for i in INDICES_VECINOS_REY[indice]:
+        if codigos[i] == rey:
+            return i
+    return None
+
+
+def intercambio_estatico(codigos: Sequence[int], origen: Tuple[int, int], destino: Tuple[int, int]) -> int:
+    """
+    Evalúa estáticamente la secuencia de capturas que empieza con origen -> destino.
+
+    Parámetros:
+    -----------
+    codigos : Sequence[int]
+        Tablero codificado (`Tablero.codigos`); no se modifica.
+    origen : Tuple[int, int]
+        Casilla de la pieza que captura.
+    destino : Tuple[int, int]
+        Casilla capturada (vacía en una captura al paso).
+
+    Retorna:
+    --------
+    int
+        Material ganado (positivo) o perdido (negativo) por el bando que captura.
+    """
+    casillas = list(codigos)
+    indice_origen = origen[0] * 8 + origen[1]
+    indice = destino[0] * 8 + destino[1]
+    atacante = casillas[indice_origen]
+    capturada = casillas[indice]
+    if not capturada and abs(atacante) == CODIGO_PEON and origen[1] != destino[1]:
+        capturada = -atacante  # Captura al paso
+
+    ganancias: List[int] = [VALORES[abs(capturada)]]
+    casillas[indice_origen] = 0
+    valor_en_casilla = VALORES[abs(atacante)]
+    signo = -1 if atacante > 0 else 1
+
+    while True:
+        casilla_atacante = _atacante_menor(casillas, indice, signo)
+        if casilla_atacante is None:
+            break
+        # Lo que gana este bando si recaptura, suponiendo que luego el rival responde
+        ganancias.append(valor_en_casilla - ganancias[-1])
+        valor_en_casilla = VALORES[abs(casillas[casilla_atacante])]
+        casillas[casilla_atacante] = 0
+        signo = -signo
+
+    # Cada bando puede dejar de recapturar si no le conviene
+    for i in range(len(ganancias) - 1, 0, -1):
+        ganancias[i - 1] = -max(-ganancias[i - 1], ganancias[i])
+    return ganancias[0]
@@ -0,0 +1,309 @@
+"""
+Módulo con el libro de aperturas de la IA.
+
+El libro guarda, para cada posición de apertura, los movimientos jugados en ella con un
+peso. La IA lo consulta antes de buscar (`IADeAjedrez.movimiento_de_libro`) y, si la
+posición está en el libro, elige uno de sus movimientos al azar según los pesos, sin
+gastar CPU en la búsqueda.
+
+Formato del archivo:
+--------------------
+Entradas de 16 bytes big-endian ordenadas por clave, con la misma disposición que un
+libro Polyglot (clave de 64 bits, movimiento de 16, peso de 16 y 32 bits libres, que aquí
+guardan el número de partidas). Las claves son las Zobrist de `juego/zobrist.py`, no las
+de Polyglot, así que el archivo solo sirve para este motor. El movimiento se codifica
+como origen * 64 + destino, con las casillas como `fila * 8 + columna`.
+
+El archivo se abre con mmap y cada consulta es una búsqueda binaria sobre él: no se
+carga en memoria y todos los procesos que lo abren comparten las mismas páginas.
+
+El libro se construye con `construir_libro` a partir de las partidas terminadas de
+`data/partidas`:
+
+    python -m juego.libro_aperturas --plies 16
+
+Clases:
+-------
+- LibroAperturas
+
+Funciones:
+----------
+- construir_libro
+- libro_compartido
+"""
+
+import argparse
+import json
+import mmap
+import os
+import random
+import struct
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from juego.tablero import Tablero
+from juego.tabla_transposicion import codificar_movimiento, decodificar_movimiento
+from config import PATH_PARTIDAS, RUTA_LIBRO_APERTURAS, PLIES_LIBRO_APERTURAS
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int]]
+
+# Clave, movimiento, peso y número de partidas
+_ENTRADA = struct.Struct(">QHHI")
+_CLAVE = struct.Struct(">Q")
+TAMANO_ENTRADA = _ENTRADA.size
+
+PESO_MAXIMO = 0xFFFF
+
+# Peso que aporta cada partida al movimiento según el resultado para el bando que lo juega
+PESO_VICTORIA = 2
+PESO_TABLAS = 1
+
+_libros: Dict[str, "LibroAperturas"] = {}
+
+
+class LibroAperturas:
+    """
+    Libro de aperturas de solo lectura sobre un archivo mapeado en memoria.
+
+    Atributos:
+    ----------
+    ruta : str
+        Ruta del archivo del libro.
+    entradas : int
+        Número de entradas (posición, movimiento) del libro.
+
+    Métodos:
+    --------
+    movimientos(clave) -> List[Tuple[Movimiento, int]]:
+        Movimientos de una posición con sus pesos.
+    elegir(clave, movimientos_legales, aleatorio) -> Optional[Movimiento]:
+        Elige un movimiento del libro al azar según los pesos.
+    cerrar() -> None:
+        Libera el mapeo del archivo.
+    """
+
+    def __init__(self, ruta: str) -> None:
+        """
+        Abre el libro.
+
+        Parámetros:
+        -----------
+        ruta : str
+            Ruta del archivo del libro.
+
+        Lanza:
+        ------
+        FileNotFoundError
+            Si el archivo no existe.
+        ValueError
+            Si el tamaño del archivo no es múltiplo del tamaño de una entrada.
+        """
+        self.ruta = ruta
+        tamano = os.path.getsize(ruta)
+        if tamano % TAMANO_ENTRADA:
+            raise ValueError(f"El libro {ruta} no tiene un número entero de entradas de {TAMANO_ENTRADA} bytes.")
+        self.entradas: int = tamano // TAMANO_ENTRADA
+        self._datos: Optional[mmap.mmap] = None
+        # mmap no admite archivos vacíos: un libro vacío simplemente no tiene posiciones
+        if self.entradas:
+            with open(ruta, "rb") as f:
+                self._datos = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _primera_entrada(self, clave: int) -> int:
+        # Búsqueda binaria de la primera entrada con clave >= la buscada
+        bajo, alto = 0, self.entradas
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if _CLAVE.unpack_from(self._datos, medio * TAMANO_ENTRADA)[0] < clave:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+
+    def movimientos(self, clave: int) -> List[Tuple[Movimiento, int]]:
+        """
+        Devuelve los movimientos del libro para una posición.
+
+        Parámetros:
+        -----------
+        clave : int
+            Clave Zobrist de la posición (`Tablero.clave_zobrist`).
+
+        Retorna:
+        --------
+        List[Tuple[Movimiento, int]]
+            Movimientos con su peso, de mayor a menor peso; vacía si la posición no está.
+        """
+        if self._datos is None:
+            return []
+        resultado = []
+        for i in range(self._primera_entrada(clave), self.entradas):
+            clave_entrada, codigo, peso, _ = _ENTRADA.unpack_from(self._datos, i * TAMANO_ENTRADA)
+            if clave_entrada != clave:
+                break
+            resultado.append((decodificar_movimiento(codigo), peso))
+        return resultado
+
+    def elegir(
+        self, clave: int, movimientos_legales: List[Movimiento], aleatorio: Optional[random.Random] = None
+    ) -> Optional[Movimiento]:
+        """
+        Elige al azar, con probabilidad proporcional al peso, uno de los movimientos del
+        libro para la posición. Solo se consideran los movimientos legales, lo que además
+        descarta las colisiones de clave.
+
+        Parámetros:
+        -----------
+        clave : int
+            Clave Zobrist de la posición.
+        movimientos_legales : List[Movimiento]
+            Movimientos legales de la posición.
+        aleatorio : Optional[random.Random]
+            Generador a usar; por defecto el del módulo `random`.
+
+        Retorna:
+        --------
+        Optional[Movimiento]
+            Movimiento elegido, o None si la posición no está en el libro.
+        """
+        candidatos = [(movimiento, peso) for movimiento, peso in self.movimientos(clave)
+                      if peso > 0 and movimiento in movimientos_legales]
+        if not candidatos:
+            return None
+        aleatorio = aleatorio or random
+        return aleatorio.choices([m for m, _ in candidatos], weights=[p for _, p in candidatos])[0]
+
+    def cerrar(self) -> None:
+        """
+        Libera el mapeo del archivo.
+        """
+        if self._datos is not None:
+            self._datos.close()
+            self._datos = None
+        self.entradas = 0
+
+
+def _partidas_terminadas(directorio: str):
+    for archivo in sorted(os.listdir(directorio)):
+        ruta = os.path.join(directorio, archivo)
+        if not (archivo.endswith(".json") and os.path.isfile(ruta)):
+            continue
+        try:
+            with open(ruta, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if datos.get("terminado"):
+            yield datos
+
+
+def construir_libro(
+    directorio: str = PATH_PARTIDAS, ruta: str = RUTA_LIBRO_APERTURAS, plies: int = PLIES_LIBRO_APERTURAS,
+    minimo_partidas: int = 1,
+) -> int:
+    """
+    Construye el libro de aperturas a partir de las partidas terminadas de un directorio.
+
+    Cada partida se reproduce desde la posición inicial durante sus primeros `plies`
+    movimientos. Cada movimiento suma al par (posición, movimiento) `PESO_VICTORIA` si
+    el bando que lo jugó ganó la partida, `PESO_TABLAS` si fue tablas y nada si la perdió.
+    Una partida deja de leerse en el primer movimiento ilegal (archivo dañado).
+
+    Parámetros:
+    -----------
+    directorio : str
+        Directorio con las partidas en JSON (`utiles/file_menager.py`).
+    ruta : str
+        Archivo del libro que se escribe (se sustituye si existe).
+    plies : int
+        Medias jugadas de cada partida que entran en el libro.
+    minimo_partidas : int
+        Partidas en las que debe aparecer un movimiento para entrar en el libro.
+
+    Retorna:
+    --------
+    int
+        Número de entradas escritas.
+
+    Lanza:
+    ------
+    ValueError
+        Si `plies` o `minimo_partidas` son menores que 1.
+    """
+    if plies < 1 or minimo_partidas < 1:
+        raise ValueError("plies y minimo_partidas deben ser al menos 1.")
+
+    pesos: Dict[Tuple[int, int], int] = defaultdict(int)
+    partidas: Dict[Tuple[int, int], int] = defaultdict(int)
+    for datos in _partidas_terminadas(directorio):
+        ganador = datos.get("ganador")
+        tablero = Tablero()
+        for registro in datos.get("movimientos", [])[:plies]:
+            movimiento = (tuple(registro["origen"]), tuple(registro["destino"]))
+            if movimiento not in tablero.generar_movimientos_legales(tablero.turno):
+                break
+            entrada = (tablero.clave_zobrist, codificar_movimiento(movimiento))
+            if ganador is None:
+                pesos[entrada] += PESO_TABLAS
+            elif ganador == tablero.turno:
+                pesos[entrada] += PESO_VICTORIA
+            partidas[entrada] += 1
+            tablero.hacer_movimiento(*movimiento)
+
+    # Ordenadas por clave y, dentro de cada posición, los movimientos de más peso primero
+    entradas = sorted(
+        ((clave, codigo, min(pesos[(clave, codigo)], PESO_MAXIMO), min(n, 0xFFFFFFFF))
+         for (clave, codigo), n in partidas.items() if n >= minimo_partidas),
+        key=lambda entrada: (entrada[0], -entrada[2], entrada[1]),
+    )
+
+    directorio_libro = os.path.dirname(ruta)
+    if directorio_libro:
+        os.makedirs(directorio_libro, exist_ok=True)
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as f:
+        for entrada in entradas:
+            f.write(_ENTRADA.pack(*entrada))
+    # Se sustituye de golpe para no dejar a medias un libro que otro proceso tenga abierto
+    os.replace(temporal, ruta)
+    _libros.pop(ruta, None)
+    return len(entradas)
+
+
+def libro_compartido(ruta: str = RUTA_LIBRO_APERTURAS) -> Optional[LibroAperturas]:
+    """
+    Devuelve el libro abierto una sola vez por proceso para una ruta, o None si no existe.
+
+    Parámetros:
+    -----------
+    ruta : str
+        Ruta del archivo del libro.
+
+    Retorna:
+    --------
+    Optional[LibroAperturas]
+        El libro, o None si el archivo no existe o no es válido (la IA busca siempre). Un
+        libro que falta no se recuerda: se vuelve a intentar abrir en la siguiente llamada,
+        por si se ha construido mientras tanto.
+    """
+    if ruta not in _libros:
+        try:
+            _libros[ruta] = LibroAperturas(ruta)
+        except (OSError, ValueError):
+            return None
+    return _libros[ruta]
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Construye el libro de aperturas a partir de las partidas guardadas.")
+    parser.add_argument("--partidas", default=PATH_PARTIDAS, help="Directorio de las partidas en JSON.")
+    parser.add_argument("--salida", default=RUTA_LIBRO_APERTURAS, help="Archivo del libro.")
+    parser.add_argument("--plies", type=int, default=PLIES_LIBRO_APERTURAS, help="Medias jugadas por partida.")
+    parser.add_argument("--minimo", type=int, default=1, help="Partidas mínimas por movimiento.")
+    args = parser.parse_args()
+    entradas = construir_libro(args.partidas, args.salida, args.plies, args.minimo)
+    print(f"Libro escrito en {args.salida}: {entradas} entradas")
+
+
+if __name__ == "__main__":
+    _main()
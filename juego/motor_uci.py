@@ -0,0 +1,649 @@
+"""
+Módulo con el cliente de motores de ajedrez externos que hablan el protocolo UCI.
+
+Sustituye al patrón de `SALAS_IA/foreignai.py` y `SALAS_IA/Incógnita 1.py`, que arrancan
+un proceso nuevo del motor en cada consulta, repiten el saludo `uci` y esperan siempre
+`movetime 2000`. Aquí un pool mantiene N procesos vivos y los reutiliza entre consultas;
+las peticiones se encolan y devuelven un `Future`, cada una con su propio límite de tiempo
+y/o profundidad, y si un proceso muere o deja de responder se reinicia y la petición se
+repite una vez. Las peticiones de una misma partida van siempre al mismo proceso, que
+conserva su tabla hash entre movimientos; `ucinewgame` solo se envía al cambiar de partida.
+
+`IAMotorUCI` permite usar el pool como motor de la IA en lugar de la búsqueda propia:
+mantiene el libro de aperturas y las tablas de finales de `IADeAjedrez`, y si el motor
+falla o propone un movimiento ilegal busca con el motor propio.
+
+Clases:
+-------
+- ResultadoUCI
+- ErrorMotorUCI
+- MotorUCI
+- PoolMotoresUCI
+- IAMotorUCI
+
+Funciones:
+----------
+- movimiento_desde_uci
+- movimiento_a_uci
+- posicion_uci
+- pool_uci_compartido
+"""
+
+import itertools
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from juego.tablero import Tablero, PROMOCIONES
+from juego.IAjedrez import IADeAjedrez, INF
+from config import MOTOR_UCI, PROCESOS_MOTOR_UCI
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int]]
+
+# Margen sobre el tiempo pedido antes de dar por colgado al motor
+MARGEN_RESPUESTA_MS = 2000
+
+# Espera máxima del saludo inicial (`uciok`, `readyok`)
+ESPERA_ARRANQUE_MS = 10000
+
+# Espera máxima de una petición solo por profundidad (sin tiempo)
+ESPERA_PROFUNDIDAD_MS = 60000
+
+# Letra UCI de cada pieza de promoción, por su clase
+_LETRA_PROMOCION = {clase: {"dama": "q", "torre": "r", "alfil": "b", "caballo": "n"}[nombre]
+                    for nombre, clase in PROMOCIONES.items()}
+
+# Identificadores de partida de IAMotorUCI para el pool
+_partidas = itertools.count()
+
+_pool_compartido: Optional["PoolMotoresUCI"] = None
+# Varias peticiones de la API pueden crear a la vez su primera UsuarioIA
+_candado_pool = threading.Lock()
+
+
+class ResultadoUCI(NamedTuple):
+    """
+    Respuesta de un motor UCI a una petición de análisis.
+
+    Atributos:
+    ----------
+    mejor_movimiento : Optional[str]
+        Movimiento en notación UCI (ej. 'e2e4', 'e7e8q'), o None si no hay movimientos.
+    puntuacion_cp : Optional[int]
+        Valor en centipeones para el bando que mueve (None si es un mate).
+    mate_en : Optional[int]
+        Jugadas hasta el mate (negativo si lo recibe el bando que mueve), o None.
+    profundidad : int
+        Profundidad de la última línea `info` con puntuación.
+    variacion : Tuple[str, ...]
+        Variación principal en notación UCI.
+    """
+    mejor_movimiento: Optional[str]
+    puntuacion_cp: Optional[int]
+    mate_en: Optional[int]
+    profundidad: int
+    variacion: Tuple[str, ...]
+
+
+class ErrorMotorUCI(RuntimeError):
+    """
+    Se lanza cuando el proceso del motor se cierra o no responde a tiempo.
+    """
+
+
+def movimiento_desde_uci(texto: str) -> Optional[Movimiento]:
+    """
+    Convierte un movimiento UCI ('e2e4', 'e7e8q') a (origen, destino).
+
+    (origen, destino) no lleva la pieza de promoción y el tablero promociona a dama, así
+    que una promoción a otra pieza ('e7e8n') devuelve None, como un movimiento no válido:
+    quien lo use busca otro en lugar de jugar una dama que el motor no ha elegido.
+    """
+    if len(texto) not in (4, 5) or texto[4:] not in ("", "q"):
+        return None
+    origen = Tablero.interpretar_casilla(texto[:2])
+    destino = Tablero.interpretar_casilla(texto[2:4])
+    if origen is None or destino is None:
+        return None
+    return origen, destino
+
+
+def movimiento_a_uci(origen: Tuple[int, int], destino: Tuple[int, int], promocion: str = "") -> str:
+    """
+    Convierte (origen, destino) a notación UCI ('e2e4'), con la letra de promoción opcional.
+    """
+    return "".join("abcdefgh"[columna] + str(8 - fila) for fila, columna in (origen, destino)) + promocion
+
+
+def posicion_uci(tablero: Tablero) -> Tuple[str, List[str]]:
+    """
+    Devuelve la partida del tablero como FEN inicial y lista de movimientos UCI, para
+    enviarla con `position fen ... moves ...` y que el motor vea las repeticiones.
+
+    Deshace todo el historial para leer el FEN inicial y lo vuelve a jugar, así que el
+    tablero queda como estaba.
+
+    Parámetros:
+    -----------
+    tablero : Tablero
+        Tablero con la partida en curso.
+
+    Retorna:
+    --------
+    Tuple[str, List[str]]
+        FEN de la posición antes del primer movimiento y movimientos jugados desde ella.
+    """
+    registros = list(tablero.historial_movimientos)
+    jugadas = [
+        movimiento_a_uci(origen, destino, _LETRA_PROMOCION[type(promovida)] if promovida is not None else "")
+        for origen, destino, _, _, _, promovida, *_ in registros
+    ]
+    for _ in registros:
+        tablero.deshacer_ultimo_movimiento()
+    fen_inicial = tablero.obtener_fen()
+    for origen, destino, _, _, _, promovida, *_ in registros:
+        nombre = None
+        if promovida is not None:
+            nombre = next(n for n, clase in PROMOCIONES.items() if isinstance(promovida, clase))
+        tablero.hacer_movimiento(origen, destino, nombre)
+    return fen_inicial, jugadas
+
+
+class MotorUCI:
+    """
+    Un proceso de motor UCI con el saludo ya hecho, listo para recibir posiciones.
+
+    Un hilo lee la salida del proceso y la deja en una cola, de modo que todas las
+    esperas tienen límite de tiempo y un proceso colgado no bloquea a quien lo usa.
+
+    Métodos:
+    --------
+    nueva_partida() -> None:
+        Envía `ucinewgame` y espera a que el motor esté listo.
+    analizar(fen, tiempo_ms, profundidad, espera_ms) -> ResultadoUCI:
+        Analiza una posición hasta el límite indicado.
+    vivo() -> bool:
+        Indica si el proceso sigue en marcha.
+    cerrar() -> None:
+        Termina el proceso.
+    """
+
+    def __init__(self, comando: Union[str, Sequence[str]], opciones: Optional[Dict[str, object]] = None) -> None:
+        """
+        Arranca el motor y completa el saludo UCI.
+
+        Parámetros:
+        -----------
+        comando : Union[str, Sequence[str]]
+            Ejecutable del motor, o ejecutable y argumentos.
+        opciones : Optional[Dict[str, object]]
+            Opciones UCI (`setoption`) que se envían tras el saludo, ej. {"Hash": 64}.
+
+        Lanza:
+        ------
+        ErrorMotorUCI
+            Si el motor no completa el saludo.
+        OSError
+            Si no se puede ejecutar el comando.
+        """
+        self.comando: List[str] = [comando] if isinstance(comando, str) else list(comando)
+        self._proceso = subprocess.Popen(
+            self.comando,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            bufsize=1,
+        )
+        self._lineas: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._leer, daemon=True).start()
+        try:
+            self._enviar("uci")
+            self._esperar("uciok", time.monotonic() + ESPERA_ARRANQUE_MS / 1000)
+            for nombre, valor in (opciones or {}).items():
+                self._enviar(f"setoption name {nombre} value {valor}")
+            self._sincronizar()
+        except ErrorMotorUCI:
+            self.cerrar()
+            raise
+
+    def _leer(self) -> None:
+        for linea in self._proceso.stdout:
+            self._lineas.put(linea.strip())
+        self._lineas.put(None)  # Fin de la salida: el proceso ha terminado
+
+    def _enviar(self, orden: str) -> None:
+        try:
+            self._proceso.stdin.write(orden + "\n")
+            self._proceso.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as error:
+            raise ErrorMotorUCI(f"El motor se ha cerrado: {error}")
+
+    def _esperar(self, prefijo: str, limite: float) -> List[str]:
+        # Devuelve las líneas recibidas hasta la que empieza por `prefijo`, incluida
+        lineas = []
+        while True:
+            try:
+                linea = self._lineas.get(timeout=max(0.0, limite - time.monotonic()))
+            except queue.Empty:
+                raise ErrorMotorUCI(f"El motor no ha respondido '{prefijo}' a tiempo.")
+            if linea is None:
+                self._lineas.put(None)  # El fin de la salida sigue ahí para las siguientes esperas
+                raise ErrorMotorUCI("El motor se ha cerrado.")
+            lineas.append(linea)
+            if linea.split(" ", 1)[0] == prefijo:
+                return lineas
+
+    def _sincronizar(self) -> None:
+        self._enviar("isready")
+        self._esperar("readyok", time.monotonic() + ESPERA_ARRANQUE_MS / 1000)
+
+    def vivo(self) -> bool:
+        """
+        Indica si el proceso del motor sigue en marcha.
+        """
+        return self._proceso.poll() is None
+
+    def nueva_partida(self) -> None:
+        """
+        Avisa al motor de que la siguiente posición es de otra partida (vacía su tabla hash).
+        """
+        self._enviar("ucinewgame")
+        self._sincronizar()
+
+    def analizar(
+        self, fen: str, tiempo_ms: Optional[int] = None, profundidad: Optional[int] = None,
+        espera_ms: Optional[int] = None, movimientos: Sequence[str] = (),
+    ) -> ResultadoUCI:
+        """
+        Analiza una posición hasta agotar el tiempo o alcanzar la profundidad (lo primero).
+
+        Parámetros:
+        -----------
+        fen : str
+            Posición en FEN.
+        tiempo_ms : Optional[int]
+            Tiempo de análisis (`go movetime`).
+        profundidad : Optional[int]
+            Profundidad de análisis (`go depth`).
+        espera_ms : Optional[int]
+            Espera máxima de la respuesta antes de pedir `stop`; por defecto el tiempo más
+            `MARGEN_RESPUESTA_MS`, o `ESPERA_PROFUNDIDAD_MS` si solo se da profundidad.
+        movimientos : Sequence[str]
+            Movimientos UCI jugados desde `fen` hasta la posición a analizar.
+
+        Retorna:
+        --------
+        ResultadoUCI
+            Mejor movimiento, puntuación y variación principal.
+
+        Lanza:
+        ------
+        ValueError
+            Si no se indica ni tiempo ni profundidad.
+        ErrorMotorUCI
+            Si el motor se cierra o no responde ni siquiera tras `stop`.
+        """
+        if tiempo_ms is None and profundidad is None:
+            raise ValueError("Hay que indicar tiempo_ms, profundidad o ambos.")
+        if espera_ms is None:
+            espera_ms = tiempo_ms + MARGEN_RESPUESTA_MS if tiempo_ms is not None else ESPERA_PROFUNDIDAD_MS
+
+        orden = "go"
+        if profundidad is not None:
+            orden += f" depth {profundidad}"
+        if tiempo_ms is not None:
+            orden += f" movetime {tiempo_ms}"
+        posicion = f"position fen {fen}"
+        if movimientos:
+            posicion += " moves " + " ".join(movimientos)
+        self._enviar(posicion)
+        self._enviar(orden)
+        try:
+            lineas = self._esperar("bestmove", time.monotonic() + espera_ms / 1000)
+        except ErrorMotorUCI:
+            if not self.vivo():
+                raise
+            # Se le da una última oportunidad de contestar con lo que tenga
+            self._enviar("stop")
+            lineas = self._esperar("bestmove", time.monotonic() + MARGEN_RESPUESTA_MS / 1000)
+        return self._interpretar(lineas)
+
+    @staticmethod
+    def _interpretar(lineas: List[str]) -> ResultadoUCI:
+        cp = mate = None
+        profundidad = 0
+        variacion: Tuple[str, ...] = ()
+        for linea in lineas:
+            partes = linea.split()
+            if not partes or partes[0] != "info" or "score" not in partes:
+                continue
+            if "multipv" in partes and partes[partes.index("multipv") + 1] != "1":
+                continue
+            try:
+                tipo, valor = partes[partes.index("score") + 1], int(partes[partes.index("score") + 2])
+                if "depth" in partes:
+                    profundidad = int(partes[partes.index("depth") + 1])
+            except (IndexError, ValueError):
+                continue
+            cp, mate = (valor, None) if tipo == "cp" else (None, valor)
+            if "pv" in partes:
+                variacion = tuple(partes[partes.index("pv") + 1:])
+        partes = lineas[-1].split()
+        mejor = partes[1] if len(partes) > 1 and partes[1] not in ("(none)", "0000") else None
+        return ResultadoUCI(mejor, cp, mate, profundidad, variacion)
+
+    def cerrar(self) -> None:
+        """
+        Pide al motor que termine y, si no lo hace enseguida, mata el proceso.
+        """
+        if self.vivo():
+            try:
+                self._enviar("quit")
+                self._proceso.wait(timeout=1)
+            except (ErrorMotorUCI, subprocess.TimeoutExpired):
+                self._proceso.kill()
+                self._proceso.wait()
+        for flujo in (self._proceso.stdin, self._proceso.stdout):
+            try:
+                flujo.close()
+            except OSError:
+                pass
+
+
+class PoolMotoresUCI:
+    """
+    Pool de procesos de motor UCI persistentes.
+
+    Cada proceso tiene un hilo con su propia cola de peticiones; el proceso se arranca en
+    la primera petición y se reutiliza después. Si falla (se cierra o no responde), se
+    descarta, se arranca otro y la petición se repite una vez.
+
+    Las peticiones de una partida (`partida`) van siempre a la cola del mismo proceso, así
+    que su tabla hash sigue valiendo de un movimiento al siguiente; el proceso envía
+    `ucinewgame` cuando la petición es de otra partida que la anterior o no tiene
+    partida. Las peticiones sin partida van al proceso con menos peticiones pendientes.
+
+    Atributos:
+    ----------
+    comando : Union[str, Sequence[str]]
+        Ejecutable del motor (y argumentos).
+    procesos : int
+        Número de procesos (y de peticiones atendidas a la vez).
+    reinicios : int
+        Procesos descartados por fallo desde que se creó el pool.
+
+    Métodos:
+    --------
+    enviar(fen, tiempo_ms, profundidad, partida, movimientos) -> Future:
+        Encola una petición y devuelve su `Future` (con un `ResultadoUCI`).
+    analizar(fen, tiempo_ms, profundidad, partida, movimientos) -> ResultadoUCI:
+        Encola una petición y espera su resultado.
+    cerrar() -> None:
+        Atiende las peticiones pendientes y termina los procesos.
+    """
+
+    def __init__(
+        self, comando: Union[str, Sequence[str]], procesos: int = 2, opciones: Optional[Dict[str, object]] = None,
+    ) -> None:
+        """
+        Crea el pool; los procesos se arrancan al llegar las primeras peticiones.
+
+        Parámetros:
+        -----------
+        comando : Union[str, Sequence[str]]
+            Ejecutable del motor (y argumentos).
+        procesos : int
+            Número de procesos del motor.
+        opciones : Optional[Dict[str, object]]
+            Opciones UCI para todos los procesos.
+
+        Lanza:
+        ------
+        ValueError
+            Si `procesos` es menor que 1.
+        """
+        if procesos < 1:
+            raise ValueError("El pool necesita al menos un proceso.")
+        self.comando = comando
+        self.procesos = procesos
+        self.opciones = dict(opciones or {})
+        self.reinicios = 0
+        self._cerrado = False
+        self._cerrojo = threading.Lock()
+        self._colas: "List[queue.Queue[Optional[tuple]]]" = [queue.Queue() for _ in range(procesos)]
+        # Peticiones encoladas o en curso de cada proceso
+        self._pendientes = [0] * procesos
+        self._hilos = [
+            threading.Thread(target=self._atender, args=(i,), name=f"motor-uci-{i}", daemon=True)
+            for i in range(procesos)
+        ]
+        for hilo in self._hilos:
+            hilo.start()
+
+    def enviar(
+        self, fen: str, tiempo_ms: Optional[int] = None, profundidad: Optional[int] = None,
+        partida: Optional[Hashable] = None, movimientos: Sequence[str] = (),
+    ) -> Future:
+        """
+        Encola el análisis de una posición sin esperar a que termine.
+
+        Parámetros:
+        -----------
+        fen : str
+            Posición en FEN.
+        tiempo_ms : Optional[int]
+            Tiempo de análisis.
+        profundidad : Optional[int]
+            Profundidad de análisis.
+        partida : Optional[Hashable]
+            Identificador de la partida: sus peticiones van siempre al mismo proceso y
+            no vacían su tabla hash. None para una posición suelta (con `ucinewgame`).
+        movimientos : Sequence[str]
+            Movimientos UCI jugados desde `fen` hasta la posición a analizar.
+
+        Retorna:
+        --------
+        Future
+            Se completa con un `ResultadoUCI`, o con `ErrorMotorUCI` si falla también el reintento.
+
+        Lanza:
+        ------
+        ValueError
+            Si no se indica ni tiempo ni profundidad.
+        RuntimeError
+            Si el pool ya está cerrado.
+        """
+        if tiempo_ms is None and profundidad is None:
+            raise ValueError("Hay que indicar tiempo_ms, profundidad o ambos.")
+        futuro: Future = Future()
+        with self._cerrojo:
+            if self._cerrado:
+                raise RuntimeError("El pool de motores UCI está cerrado.")
+            if partida is None:
+                indice = min(range(self.procesos), key=self._pendientes.__getitem__)
+            else:
+                indice = hash(partida) % self.procesos
+            self._pendientes[indice] += 1
+            self._colas[indice].put((futuro, fen, tiempo_ms, profundidad, partida, tuple(movimientos)))
+        return futuro
+
+    def analizar(
+        self, fen: str, tiempo_ms: Optional[int] = None, profundidad: Optional[int] = None,
+        partida: Optional[Hashable] = None, movimientos: Sequence[str] = (),
+    ) -> ResultadoUCI:
+        """
+        Analiza una posición y espera el resultado (ver `enviar`).
+        """
+        return self.enviar(fen, tiempo_ms, profundidad, partida, movimientos).result()
+
+    def _atender(self, indice: int) -> None:
+        motor: Optional[MotorUCI] = None
+        # Partida de la última petición atendida, la que tiene el proceso en su tabla hash
+        partida_actual: Optional[Hashable] = None
+        while True:
+            peticion = self._colas[indice].get()
+            if peticion is None:
+                break
+            futuro, fen, tiempo_ms, profundidad, partida, movimientos = peticion
+            try:
+                if not futuro.set_running_or_notify_cancel():
+                    continue
+                error: Optional[Exception] = None
+                for _ in range(2):
+                    try:
+                        nueva_partida = partida is None or partida != partida_actual
+                        if motor is None or not motor.vivo():
+                            if motor is not None:
+                                motor.cerrar()
+                                self._contar_reinicio()
+                            motor = MotorUCI(self.comando, self.opciones)
+                            nueva_partida = False  # Un proceso recién arrancado ya empieza limpio
+                        if nueva_partida:
+                            motor.nueva_partida()
+                        partida_actual = partida
+                        resultado = motor.analizar(fen, tiempo_ms, profundidad, movimientos=movimientos)
+                    except (ErrorMotorUCI, OSError) as fallo:
+                        error = fallo
+                        if motor is not None:
+                            motor.cerrar()
+                            self._contar_reinicio()
+                        motor = None
+                        continue
+                    futuro.set_result(resultado)
+                    break
+                else:
+                    futuro.set_exception(error)
+            finally:
+                with self._cerrojo:
+                    self._pendientes[indice] -= 1
+        if motor is not None:
+            motor.cerrar()
+
+    def _contar_reinicio(self) -> None:
+        with self._cerrojo:
+            self.reinicios += 1
+
+    def cerrar(self) -> None:
+        """
+        Deja de aceptar peticiones, atiende las que ya estaban en cola y termina los procesos.
+        """
+        with self._cerrojo:
+            if self._cerrado:
+                return
+            self._cerrado = True
+            for cola in self._colas:
+                cola.put(None)
+        for hilo in self._hilos:
+            hilo.join()
+
+
+def pool_uci_compartido() -> Optional[PoolMotoresUCI]:
+    """
+    Devuelve el pool del motor configurado en `MOTOR_UCI`, creado una sola vez por proceso,
+    o None si no hay motor externo configurado.
+    """
+    global _pool_compartido
+    with _candado_pool:
+        if _pool_compartido is None and MOTOR_UCI:
+            _pool_compartido = PoolMotoresUCI(MOTOR_UCI, PROCESOS_MOTOR_UCI)
+    return _pool_compartido
+
+
+class IAMotorUCI(IADeAjedrez):
+    """
+    IA que elige sus movimientos con un motor UCI externo del pool.
+
+    Conserva todo lo de `IADeAjedrez` (libro de aperturas, tablas de finales y la
+    búsqueda propia como respaldo), pero en lugar de buscar pide el movimiento al pool.
+
+    Atributos adicionales:
+    ----------------------
+    pool : PoolMotoresUCI
+        Pool de motores al que se envían las posiciones.
+    profundidad_uci : Optional[int]
+        Profundidad máxima que se pide al motor (None: solo tiempo).
+    ultimo_resultado : Optional[ResultadoUCI]
+        Respuesta del motor al último movimiento.
+
+    Cada partida tiene un identificador para el pool, que la mantiene en un mismo proceso
+    sin vaciar su tabla hash; cambia cuando la posición no continúa la de la petición
+    anterior (otro FEN inicial o un historial que no la prolonga).
+    """
+
+    def __init__(self, pool: PoolMotoresUCI, *args, profundidad_uci: Optional[int] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.pool = pool
+        self.profundidad_uci = profundidad_uci
+        self.ultimo_resultado: Optional[ResultadoUCI] = None
+        # Identificador, FEN inicial y movimientos de la última partida enviada al motor
+        self._partida_uci: Optional[Tuple[int, str, List[str]]] = None
+
+    def encontrar_mejor_movimiento(
+        self, tablero: Tablero, tiempo_ms: Optional[int] = None, movimientos_raiz: Optional[list] = None
+    ) -> Optional[Movimiento]:
+        """
+        Pide el mejor movimiento al motor externo.
+
+        Las posiciones del libro y de las tablas de finales se resuelven sin consultar al
+        motor. Si se restringen los movimientos de la raíz, el motor falla o su movimiento
+        no es legal en el tablero, se usa la búsqueda propia (`IADeAjedrez`).
+
+        Parámetros:
+        -----------
+        tablero : Tablero
+            Posición en la que mueve la IA.
+        tiempo_ms : Optional[int]
+            Tiempo para el movimiento; por defecto el de la instancia.
+        movimientos_raiz : Optional[list]
+            Movimientos de la raíz a considerar (solo con la búsqueda propia).
+
+        Retorna:
+        --------
+        Optional[Movimiento]
+            Movimiento (origen, destino), o None si no hay movimientos.
+        """
+        if movimientos_raiz is not None:
+            return super().encontrar_mejor_movimiento(tablero, tiempo_ms, movimientos_raiz)
+        movimiento = self.movimiento_sin_busqueda(tablero)
+        if movimiento is not None:
+            return movimiento
+
+        if tiempo_ms is None:
+            tiempo_ms = self.tiempo_ms
+        if tiempo_ms is None and self.profundidad_uci is None:
+            tiempo_ms = MARGEN_RESPUESTA_MS
+        fen_inicial, jugadas = posicion_uci(tablero)
+        if (
+            self._partida_uci is not None and self._partida_uci[1] == fen_inicial
+            and jugadas[:len(self._partida_uci[2])] == self._partida_uci[2]
+        ):
+            partida = self._partida_uci[0]
+        else:
+            partida = next(_partidas)
+        self._partida_uci = (partida, fen_inicial, jugadas)
+        try:
+            resultado = self.pool.analizar(
+                fen_inicial, tiempo_ms, self.profundidad_uci, partida=partida, movimientos=jugadas
+            )
+        except (ErrorMotorUCI, RuntimeError):
+            return super().encontrar_mejor_movimiento(tablero, tiempo_ms)
+        self.ultimo_resultado = resultado
+
+        movimiento = movimiento_desde_uci(resultado.mejor_movimiento) if resultado.mejor_movimiento else None
+        if movimiento is None or movimiento not in self.generar_movimientos(tablero, tablero.turno):
+            return super().encontrar_mejor_movimiento(tablero, tiempo_ms)
+
+        if resultado.mate_en is not None:
+            # Mismo criterio que la búsqueda propia: INF menos las medias jugadas hasta el mate
+            mate = resultado.mate_en
+            valor = INF - (2 * mate - 1) if mate > 0 else -INF - 2 * mate
+        else:
+            valor = resultado.puntuacion_cp or 0
+        self.variacion_principal = [movimiento]
+        self.profundidad_alcanzada = resultado.profundidad
+        self.resultados_iteraciones = {resultado.profundidad: (movimiento, valor)}
+        return movimiento
@@ -0,0 +1,179 @@
+"""
+Módulo con la ordenación de movimientos de la búsqueda de la IA.
+
+Cuanto antes se prueba el mejor movimiento de un nodo, antes se produce el corte
+alfa-beta. Los movimientos se entregan por etapas y solo se puntúa cada etapa cuando
+se llega a ella, de modo que si hay un corte temprano no se gasta tiempo en el resto:
+
+1. El movimiento de la tabla de transposición (o de la variación principal).
+2. Capturas y promociones, por MVV-LVA (víctima más valiosa, atacante menos valioso).
+3. Los dos movimientos asesinos del ply: movimientos tranquilos que produjeron un corte
+   en otro nodo a la misma distancia de la raíz.
+4. El resto de movimientos tranquilos, según la tabla de historia (pieza, casilla destino),
+   que acumula los cortes producidos durante la búsqueda.
+
+Clases:
+-------
+- OrdenMovimientos
+"""
+
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from piezas.codigos import VALORES, CODIGO_PEON, CODIGO_REINA
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int]]
+
+# Plies para los que se guardan movimientos asesinos
+MAX_PLY = 64
+
+
+def es_tactico(codigos: Sequence[int], movimiento: Movimiento) -> bool:
+    """
+    Indica si un movimiento es una captura (al paso incluida) o una promoción.
+    """
+    (fila_o, col_o), (fila_d, col_d) = movimiento
+    if codigos[fila_d * 8 + col_d]:
+        return True
+    return abs(codigos[fila_o * 8 + col_o]) == CODIGO_PEON and (col_o != col_d or fila_d in (0, 7))
+
+
+def valor_mvv_lva(codigos: Sequence[int], movimiento: Movimiento) -> int:
+    """
+    Puntuación MVV-LVA de una captura o promoción: manda el valor de la víctima y, a
+    igualdad, es mejor capturar con la pieza más barata.
+    """
+    (fila_o, col_o), (fila_d, col_d) = movimiento
+    atacante = abs(codigos[fila_o * 8 + col_o])
+    victima = abs(codigos[fila_d * 8 + col_d])
+    if not victima and atacante == CODIGO_PEON and col_o != col_d:
+        victima = CODIGO_PEON  # Captura al paso
+    valor = VALORES[victima]
+    if atacante == CODIGO_PEON and fila_d in (0, 7):
+        valor += VALORES[CODIGO_REINA] - VALORES[CODIGO_PEON]
+    return valor * 8 - atacante
+
+
+def _por_seleccion(puntuados: List[Tuple[int, Movimiento]]) -> Iterator[Movimiento]:
+    # Selección del máximo en cada paso: no se ordena lo que un corte deja sin probar
+    while puntuados:
+        mejor = 0
+        for i in range(1, len(puntuados)):
+            if puntuados[i][0] > puntuados[mejor][0]:
+                mejor = i
+        puntuados[mejor], puntuados[-1] = puntuados[-1], puntuados[mejor]
+        yield puntuados.pop()[1]
+
+
+class OrdenMovimientos:
+    """
+    Estado de la ordenación de movimientos: asesinos por ply e historia por pieza y destino.
+
+    Atributos:
+    ----------
+    asesinos : List[List[Optional[Movimiento]]]
+        Dos movimientos asesinos por ply, el más reciente primero.
+    historia : List[List[int]]
+        historia[codigo][casilla]: puntuación de los cortes del código de pieza (con signo,
+        los negativos se indexan desde el final) al mover a la casilla.
+
+    Métodos:
+    --------
+    seleccionar(codigos, movimientos, movimiento_tabla, ply) -> Iterator[Movimiento]:
+        Entrega los movimientos en orden por etapas.
+    registrar_corte(codigos, movimiento, ply, profundidad) -> None:
+        Actualiza asesinos e historia tras un corte beta de un movimiento tranquilo.
+    nueva_busqueda() -> None:
+        Vacía los asesinos y envejece la historia.
+    """
+
+    def __init__(self) -> None:
+        self.asesinos: List[List[Optional[Movimiento]]] = [[None, None] for _ in range(MAX_PLY)]
+        self.historia: List[List[int]] = [[0] * 64 for _ in range(13)]
+
+    def seleccionar(
+        self, codigos: Sequence[int], movimientos: List[Movimiento], movimiento_tabla: Optional[Movimiento], ply: int
+    ) -> Iterator[Movimiento]:
+        """
+        Entrega los movimientos legales de un nodo en orden, puntuando cada etapa solo
+        cuando se llega a ella.
+
+        Parámetros:
+        -----------
+        codigos : Sequence[int]
+            Tablero codificado del nodo (`Tablero.codigos`).
+        movimientos : List[Movimiento]
+            Movimientos legales del nodo.
+        movimiento_tabla : Optional[Movimiento]
+            Movimiento de la tabla de transposición o de la variación principal.
+        ply : int
+            Distancia a la raíz.
+
+        Retorna:
+        --------
+        Iterator[Movimiento]
+            Cada movimiento legal exactamente una vez.
+        """
+        if movimiento_tabla is not None and movimiento_tabla in movimientos:
+            yield movimiento_tabla
+        else:
+            movimiento_tabla = None
+
+        capturas: List[Tuple[int, Movimiento]] = []
+        tranquilos: List[Movimiento] = []
+        for movimiento in movimientos:
+            if movimiento == movimiento_tabla:
+                continue
+            if es_tactico(codigos, movimiento):
+                capturas.append((valor_mvv_lva(codigos, movimiento), movimiento))
+            else:
+                tranquilos.append(movimiento)
+        yield from _por_seleccion(capturas)
+
+        if ply < MAX_PLY:
+            for asesino in self.asesinos[ply]:
+                if asesino is not None and asesino in tranquilos:
+                    tranquilos.remove(asesino)
+                    yield asesino
+
+        historia = self.historia
+        yield from _por_seleccion([
+            (historia[codigos[origen[0] * 8 + origen[1]]][destino[0] * 8 + destino[1]], (origen, destino))
+            for origen, destino in tranquilos
+        ])
+
+    def registrar_corte(self, codigos: Sequence[int], movimiento: Movimiento, ply: int, profundidad: int) -> None:
+        """
+        Registra que un movimiento produjo un corte beta. Las capturas y promociones ya
+        se ordenan por MVV-LVA, así que solo se registran los movimientos tranquilos.
+
+        Parámetros:
+        -----------
+        codigos : Sequence[int]
+            Tablero codificado del nodo, con el movimiento ya deshecho.
+        movimiento : Movimiento
+            Movimiento que produjo el corte.
+        ply : int
+            Distancia a la raíz.
+        profundidad : int
+            Profundidad restante del nodo; los cortes más profundos pesan más.
+        """
+        if es_tactico(codigos, movimiento):
+            return
+        if ply < MAX_PLY:
+            asesinos = self.asesinos[ply]
+            if asesinos[0] != movimiento:
+                asesinos[1] = asesinos[0]
+                asesinos[0] = movimiento
+        (fila_o, col_o), (fila_d, col_d) = movimiento
+        self.historia[codigos[fila_o * 8 + col_o]][fila_d * 8 + col_d] += profundidad * profundidad
+
+    def nueva_busqueda(self) -> None:
+        """
+        Prepara una búsqueda nueva: los asesinos dependen de la posición de la raíz y se
+        vacían; la historia se conserva a medias para que pesen más los cortes recientes.
+        """
+        for asesinos in self.asesinos:
+            asesinos[0] = asesinos[1] = None
+        for fila in self.historia:
+            for i in range(64):
+                fila[i] //= 2
@@ -0,0 +1,365 @@
+"""
+Módulo de perft: recuento de nodos hoja del árbol de movimientos legales.
+
+Sirve a la vez como prueba de corrección y como banco de rendimiento de la generación
+de movimientos. Cuenta las posiciones alcanzables a una profundidad dada desde un FEN,
+permite desglosar el recuento por movimiento raíz (divide) y mide los nodos por segundo.
+Al comprobar las referencias también recorre el árbol verificando que las sumas de
+evaluación que el tablero mantiene al hacer y deshacer movimientos coinciden con las
+calculadas desde cero.
+
+Motores disponibles:
+--------------------
+- "objetos": `Tablero`, generación pieza a pieza sobre la matriz de objetos.
+- "bitboard": `TableroBitboard`, generación mediante máscaras de 64 bits.
+- "bitmap": generadores de `SALAS_IA/Bits64.py` sobre la lista plana de 64 enteros
+  (sin enroque, captura al paso ni promoción, por lo que no coincide con las referencias).
+
+Uso desde la línea de comandos:
+-------------------------------
+    python -m juego.perft --referencias --profundidad 3
+    python -m juego.perft --fen "<fen>" --profundidad 4 --motor bitboard --dividir
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional, Tuple
+
+from juego.tablero import Tablero
+from juego.tablero_bitboard import TableroBitboard
+from juego.tablas_pesto import sumas_evaluacion
+from piezas.peon import Peon
+
+FEN_INICIAL = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Posiciones de referencia con sus recuentos conocidos por profundidad
+POSICIONES_REFERENCIA: Dict[str, Tuple[str, Dict[int, int]]] = {
+    "inicial": (FEN_INICIAL, {1: 20, 2: 400, 3: 8902, 4: 197281}),
+    "kiwipete": (
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        {1: 48, 2: 2039, 3: 97862},
+    ),
+    "al_paso": ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", {1: 14, 2: 191, 3: 2812, 4: 43238}),
+    "promocion": (
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        {1: 6, 2: 264, 3: 9467},
+    ),
+    "enroque_promocion": (
+        "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        {1: 44, 2: 1486, 3: 62379},
+    ),
+}
+
+MOTORES = {"objetos": Tablero, "bitboard": TableroBitboard}
+
+# Piezas de promoción, con la letra que usa la notación UCI
+_PROMOCIONES_UCI = (("dama", "q"), ("torre", "r"), ("alfil", "b"), ("caballo", "n"))
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int], Optional[str]]
+
+
+def _contrario(color: str) -> str:
+    return "negro" if color == "blanco" else "blanco"
+
+
+def movimientos_perft(tablero: Tablero, color: str) -> List[Movimiento]:
+    """
+    Devuelve los movimientos legales de un color desdoblando cada promoción en sus cuatro piezas.
+
+    Parámetros:
+    -----------
+    tablero : Tablero
+        Tablero sobre el que se generan los movimientos.
+    color : str
+        Color que mueve.
+
+    Retorna:
+    --------
+    List[Movimiento]
+        Ternas (origen, destino, promocion), con promocion None si no la hay.
+    """
+    movimientos: List[Movimiento] = []
+    casillas = tablero.casillas
+    for origen, destino in tablero.generar_movimientos_legales(color):
+        if destino[0] in (0, 7) and casillas[origen[0]][origen[1]].__class__ is Peon:
+            movimientos.extend((origen, destino, pieza) for pieza, _ in _PROMOCIONES_UCI)
+        else:
+            movimientos.append((origen, destino, None))
+    return movimientos
+
+
+def perft(tablero: Tablero, color: str, profundidad: int) -> int:
+    """
+    Cuenta los nodos hoja a la profundidad dada haciendo y deshaciendo movimientos.
+
+    En el último nivel se cuentan los movimientos sin llegar a hacerlos.
+
+    Parámetros:
+    -----------
+    tablero : Tablero
+        Tablero con la posición de partida; queda igual al terminar.
+    color : str
+        Color que mueve en la posición de partida.
+    profundidad : int
+        Número de medias jugadas a explorar.
+
+    Retorna:
+    --------
+    int
+        Número de posiciones hoja.
+    """
+    if profundidad == 0:
+        return 1
+    movimientos = movimientos_perft(tablero, color)
+    if profundidad == 1:
+        return len(movimientos)
+
+    siguiente = _contrario(color)
+    nodos = 0
+    for origen, destino, promocion in movimientos:
+        tablero.hacer_movimiento(origen, destino, promocion)
+        nodos += perft(tablero, siguiente, profundidad - 1)
+        tablero.deshacer_ultimo_movimiento()
+    return nodos
+
+
+def perft_dividido(tablero: Tablero, color: str, profundidad: int) -> Dict[str, int]:
+    """
+    Desglosa el recuento de perft por movimiento raíz, en notación UCI (ej. 'e2e4', 'a7a8q').
+
+    Parámetros:
+    -----------
+    tablero : Tablero
+        Tablero con la posición de partida.
+    color : str
+        Color que mueve.
+    profundidad : int
+        Profundidad total, contando el movimiento raíz (mínimo 1).
+
+    Retorna:
+    --------
+    Dict[str, int]
+        Nodos hoja bajo cada movimiento raíz.
+
+    Lanza:
+    ------
+    ValueError
+        Si la profundidad es menor que 1.
+    """
+    if profundidad < 1:
+        raise ValueError("La profundidad del divide debe ser al menos 1.")
+    letras = dict(_PROMOCIONES_UCI)
+    resultado: Dict[str, int] = {}
+    for origen, destino, promocion in movimientos_perft(tablero, color):
+        tablero.hacer_movimiento(origen, destino, promocion)
+        clave = _casilla_uci(origen) + _casilla_uci(destino) + (letras[promocion] if promocion else "")
+        resultado[clave] = perft(tablero, _contrario(color), profundidad - 1)
+        tablero.deshacer_ultimo_movimiento()
+    return resultado
+
+
+def perft_bitmap(bitmap: List[int], color: str, profundidad: int) -> int:
+    """
+    Perft sobre los generadores de `SALAS_IA/Bits64.py` ('white' o 'black').
+
+    Esos generadores trabajan copiando la lista de 64 enteros en cada movimiento y no
+    contemplan enroque, captura al paso ni promoción.
+    """
+    from SALAS_IA import Bits64
+
+    if profundidad == 0:
+        return 1
+    movimientos = Bits64.generate_legal_moves(bitmap, color)
+    if profundidad == 1:
+        return len(movimientos)
+
+    siguiente = "black" if color == "white" else "white"
+    nodos = 0
+    for inicio, fin in movimientos:
+        nuevo = Bits64.copy_bitmap(bitmap)
+        nuevo[fin] = nuevo[inicio]
+        nuevo[inicio] = 0
+        nodos += perft_bitmap(nuevo, siguiente, profundidad - 1)
+    return nodos
+
+
+def errores_sumas(tablero: Tablero, color: str, profundidad: int) -> int:
+    """
+    Recorre el árbol como `perft` y cuenta las posiciones en las que las sumas incrementales
+    del tablero (material, posicional de medio juego y de final, y fase) no coinciden con
+    `sumas_evaluacion`.
+
+    Parámetros:
+    -----------
+    tablero : Tablero
+        Tablero con la posición de partida; queda igual al terminar.
+    color : str
+        Color que mueve en la posición de partida.
+    profundidad : int
+        Número de medias jugadas a explorar.
+
+    Retorna:
+    --------
+    int
+        Número de posiciones con alguna suma distinta (0 si todo cuadra).
+    """
+    incrementales = (tablero.material, tablero.posicional_medio, tablero.posicional_final, tablero.fase)
+    errores = int(incrementales != sumas_evaluacion(tablero.codigos))
+    if profundidad == 0:
+        return errores
+    siguiente = _contrario(color)
+    for origen, destino, promocion in movimientos_perft(tablero, color):
+        tablero.hacer_movimiento(origen, destino, promocion)
+        errores += errores_sumas(tablero, siguiente, profundidad - 1)
+        tablero.deshacer_ultimo_movimiento()
+    return errores
+
+
+def medir(fen: str, profundidad: int, motor: str = "objetos") -> Dict[str, float]:
+    """
+    Ejecuta perft desde un FEN con el motor indicado y mide su velocidad.
+
+    Parámetros:
+    -----------
+    fen : str
+        Posición de partida.
+    profundidad : int
+        Número de medias jugadas.
+    motor : str
+        "objetos", "bitboard" o "bitmap".
+
+    Retorna:
+    --------
+    Dict[str, float]
+        Diccionario con "nodos", "segundos" y "nps" (nodos por segundo).
+
+    Lanza:
+    ------
+    ValueError
+        Si el motor no existe o el FEN no es válido.
+    """
+    if motor == "bitmap":
+        from SALAS_IA import Bits64
+
+        bitmap = Bits64.fen_to_bitmap(fen)
+        color = "white" if fen.split()[1] == "w" else "black"
+        inicio = time.perf_counter()
+        nodos = perft_bitmap(bitmap, color, profundidad)
+    elif motor in MOTORES:
+        tablero = MOTORES[motor]()
+        color = tablero.cargar_fen(fen)
+        inicio = time.perf_counter()
+        nodos = perft(tablero, color, profundidad)
+    else:
+        raise ValueError(f"Motor desconocido: {motor}. Usa uno de: objetos, bitboard, bitmap.")
+
+    segundos = time.perf_counter() - inicio
+    return {"nodos": nodos, "segundos": segundos, "nps": nodos / segundos if segundos > 0 else 0.0}
+
+
+def comprobar_referencias(profundidad_maxima: int = 3, motor: str = "objetos") -> List[Dict[str, object]]:
+    """
+    Ejecuta perft sobre las posiciones de referencia y compara con los recuentos conocidos.
+
+    Parámetros:
+    -----------
+    profundidad_maxima : int
+        Profundidad máxima a comprobar en cada posición.
+    motor : str
+        Motor con el que se generan los movimientos.
+
+    Retorna:
+    --------
+    List[Dict[str, object]]
+        Un resultado por posición y profundidad con "posicion", "profundidad", "esperado",
+        "nodos", "correcto", "segundos" y "nps".
+    """
+    resultados: List[Dict[str, object]] = []
+    for nombre, (fen, esperados) in POSICIONES_REFERENCIA.items():
+        for profundidad, esperado in sorted(esperados.items()):
+            if profundidad > profundidad_maxima:
+                break
+            medida = medir(fen, profundidad, motor)
+            resultados.append({
+                "posicion": nombre,
+                "profundidad": profundidad,
+                "esperado": esperado,
+                "correcto": medida["nodos"] == esperado,
+                **medida,
+            })
+    return resultados
+
+
+def comprobar_sumas(profundidad: int = 2, motor: str = "objetos") -> Dict[str, int]:
+    """
+    Comprueba las sumas de evaluación incrementales en el árbol de cada posición de referencia.
+
+    Parámetros:
+    -----------
+    profundidad : int
+        Medias jugadas a recorrer desde cada posición.
+    motor : str
+        "objetos" o "bitboard".
+
+    Retorna:
+    --------
+    Dict[str, int]
+        Posiciones con sumas distintas (ver `errores_sumas`) por posición de referencia.
+    """
+    errores: Dict[str, int] = {}
+    for nombre, (fen, _) in POSICIONES_REFERENCIA.items():
+        tablero = MOTORES[motor]()
+        color = tablero.cargar_fen(fen)
+        errores[nombre] = errores_sumas(tablero, color, profundidad)
+    return errores
+
+
+def _casilla_uci(casilla: Tuple[int, int]) -> str:
+    fila, col = casilla
+    return "abcdefgh"[col] + str(8 - fila)
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Perft: recuento de nodos y velocidad del generador de movimientos.")
+    parser.add_argument("--fen", default=FEN_INICIAL, help="Posición de partida en FEN.")
+    parser.add_argument("--profundidad", type=int, default=3, help="Número de medias jugadas.")
+    parser.add_argument("--motor", default="objetos", choices=("objetos", "bitboard", "bitmap"))
+    parser.add_argument("--dividir", action="store_true", help="Desglosa el recuento por movimiento raíz.")
+    parser.add_argument("--referencias", action="store_true", help="Comprueba las posiciones de referencia.")
+    args = parser.parse_args()
+
+    if args.referencias:
+        fallos = 0
+        for r in comprobar_referencias(args.profundidad, args.motor):
+            estado = "OK" if r["correcto"] else "FALLO"
+            fallos += not r["correcto"]
+            print(f"{r['posicion']:<18} p={r['profundidad']} nodos={r['nodos']:>9} "
+                  f"esperado={r['esperado']:>9} {estado:<5} {r['nps']:>10.0f} nps")
+        if args.motor != "bitmap":
+            # Un nivel menos: las sumas se calculan desde cero en cada posición
+            for nombre, errores in comprobar_sumas(max(args.profundidad - 1, 0), args.motor).items():
+                fallos += errores > 0
+                print(f"{nombre:<18} sumas de evaluación: {'OK' if not errores else f'FALLO ({errores})'}")
+        raise SystemExit(1 if fallos else 0)
+
+    if args.dividir:
+        if args.motor == "bitmap":
+            parser.error("El desglose solo está disponible para los motores objetos y bitboard.")
+        tablero = MOTORES[args.motor]()
+        color = tablero.cargar_fen(args.fen)
+        inicio = time.perf_counter()
+        desglose = perft_dividido(tablero, color, args.profundidad)
+        segundos = time.perf_counter() - inicio
+        for movimiento, nodos in sorted(desglose.items()):
+            print(f"{movimiento}: {nodos}")
+        total = sum(desglose.values())
+        print(f"\nMovimientos: {len(desglose)}\nNodos: {total}\nTiempo: {segundos:.3f} s"
+              f"\nNPS: {total / segundos if segundos > 0 else 0:.0f}")
+        return
+
+    medida = medir(args.fen, args.profundidad, args.motor)
+    print(f"Nodos: {medida['nodos']}\nTiempo: {medida['segundos']:.3f} s\nNPS: {medida['nps']:.0f}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Tuple, Union, Dict, Any, Optional,Type
 
 from juego.tablero import Tablero
+from juego.tablero_bitboard import TableroBitboard
 from juego.validador_movimiento import ValidadorMovimiento
 from utiles.file_menager import guardar_partida
 from utiles.elo import calcular_elo
@@ -16,6 +17,12 @@ from usuario.usuario import Usuario
 from juego.usuarioIA import UsuarioIA
 from config import PATH_PARTIDAS_TEMP
 
+# Motores de tablero disponibles para cada sesión
+MOTORES_TABLERO: Dict[str, Type[Tablero]] = {
+    "objetos": Tablero,
+    "bitboard": TableroBitboard,
+}
+
 class SesionDeJuego:
     """
     Clase que representa una sesión de juego entre dos usuarios.
@@ -38,9 +45,11 @@ class SesionDeJuego:
         Color del ganador ('blanco', 'negro' o None si empate o en curso).
     movimientos : list
         Lista de movimientos realizados en la partida.
+    motor : str
+        Motor de tablero usado en la sesión ('objetos' o 'bitboard').
     """
 
-    def __init__(self, jugador_blanco: Usuario, jugador_negro: Usuario) -> None:
+    def __init__(self, jugador_blanco: Usuario, jugador_negro: Usuario, motor: str = "objetos") -> None:
         """
         Inicializa la sesión de juego con dos jugadores.
 
@@ -50,8 +59,18 @@ class SesionDeJuego:
             Usuario que jugará con las piezas blancas.
         jugador_negro : Usuario
             Usuario que jugará con las piezas negras.
+        motor : str, opcional
+            Motor de tablero a utilizar: 'objetos' (por defecto) o 'bitboard'.
+
+        Lanza:
+        ------
+        ValueError
+            Si el motor indicado no existe.
         """
-        self.tablero: Tablero = Tablero()
+        if motor not in MOTORES_TABLERO:
+            raise ValueError(f"Motor de tablero no válido: {motor}")
+        self.motor: str = motor
+        self.tablero: Tablero = MOTORES_TABLERO[motor]()
         self.jugador_blanco: Usuario = jugador_blanco
         self.jugador_negro: Usuario = jugador_negro
         self.turno_actual: str = "blanco"
@@ -100,7 +119,7 @@ class SesionDeJuego:
         
         pieza_destino = self.tablero.casillas[destino[0]][destino[1]]
 
-        if pieza.__class__.__name__ == "peon":
+        if pieza.__class__.__name__ == "Peon":
             if (pieza.color == "blanco" and destino[0] == 0) or (pieza.color == "negro" and destino[0] == 7):
                 if promocion is None:
                     promocion = "dama"
@@ -183,17 +202,9 @@ class SesionDeJuego:
         bool
             True si existe al menos un movimiento legal, False en caso contrario.
         """
-        for fila in range(8):
-            for col in range(8):
-                pieza = self.tablero.casillas[fila][col]
-                if pieza and pieza.color == color:
-                    for legal in pieza.obtener_movimientos_validos(
-                        (fila, col), self.tablero
-                    ):
-                        
-                        if self.validador.movimiento_es_legal((fila,col),legal,color):
-                            return True
-        return False
+        # Generador legal con clavadas y máscara de jaque: sin movimientos de prueba
+        return bool(self.tablero.generar_movimientos_legales(color))
+
     def obtener_datos_partida(self, include_final: bool = True) -> Dict[str, Any]:
         """
         Obtiene los datos completos de la partida para guardado o análisis.
@@ -211,7 +222,8 @@ class SesionDeJuego:
             "movimientos": self.movimientos,
             "fecha": str(datetime.now()),
             "turno_actual": self.turno_actual,
-            "terminado": self.terminado
+            "terminado": self.terminado,
+            "motor": self.motor
         }
 
         if include_final:
@@ -225,6 +237,7 @@ class SesionDeJuego:
                 ]
                 for fila in self.tablero.casillas
             ]
+            datos["derechos_enroque"] = self.tablero.derechos_enroque
 
         return datos
 
@@ -363,13 +376,15 @@ class SesionDeJuego:
             jugador_negro = UsuarioIA.cargar(datos["jugador_negro"]["user_id"])
 
         # Crear la instancia sin iniciar desde cero
-        instancia = cls(jugador_blanco, jugador_negro)
+        instancia = cls(jugador_blanco, jugador_negro, motor=datos.get("motor", "objetos"))
         instancia.turno_actual = datos["turno_actual"]
         instancia.terminado = datos["terminado"]
         instancia.ganador = datos["ganador"]
         instancia.movimientos = datos["movimientos"]
 
         # Restaurar estado del tablero
-        instancia.tablero.restaurar_estado_lista(datos["tablero_final"])
+        instancia.tablero.restaurar_estado_lista(
+            datos["tablero_final"], datos.get("derechos_enroque"), instancia.turno_actual
+        )
 
         return instancia
\ No newline at end of file
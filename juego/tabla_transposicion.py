@@ -0,0 +1,228 @@
+"""
+Módulo con la tabla de transposición de tamaño fijo usada por la IA.
+
+La tabla se reserva de una vez con arrays de tipos primitivos (uno por campo), de modo
+que su memoria queda acotada desde el principio y no crece con la partida. Se organiza
+en cubetas de dos entradas indexadas por la clave Zobrist del tablero.
+
+Cada entrada guarda la clave completa, la profundidad, la puntuación, el tipo de cota
+(exacta, inferior o superior) y el mejor movimiento encontrado. La tabla se conserva
+entre los movimientos de una misma partida; `nueva_busqueda` solo avanza la generación
+para que las entradas antiguas se reemplacen antes.
+
+Clases:
+-------
+- TablaTransposicion
+"""
+
+from array import array
+from typing import Optional, Tuple
+
+# Tipos de cota de la puntuación guardada
+EXACTA = 0
+COTA_INFERIOR = 1  # La puntuación real es >= la guardada (corte beta)
+COTA_SUPERIOR = 2  # La puntuación real es <= la guardada (ningún movimiento superó alfa)
+
+# Políticas de reemplazo
+REEMPLAZO_PROFUNDIDAD = "profundidad"
+REEMPLAZO_SIEMPRE = "siempre"
+
+SIN_MOVIMIENTO = 0xFFFF
+
+_ENTRADAS_POR_CUBETA = 2
+# clave (8) + puntuación (4) + movimiento (2) + profundidad, cota, generación y ocupada (1 cada una)
+_BYTES_POR_ENTRADA = 18
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int]]
+Entrada = Tuple[int, int, int, Optional[Movimiento]]
+
+
+def codificar_movimiento(movimiento: Optional[Movimiento]) -> int:
+    """
+    Codifica un movimiento (origen, destino) en 12 bits: origen * 64 + destino.
+    """
+    if movimiento is None:
+        return SIN_MOVIMIENTO
+    (fila_o, col_o), (fila_d, col_d) = movimiento
+    return (fila_o * 8 + col_o) * 64 + fila_d * 8 + col_d
+
+
+def decodificar_movimiento(codigo: int) -> Optional[Movimiento]:
+    """
+    Operación inversa de `codificar_movimiento`.
+    """
+    if codigo == SIN_MOVIMIENTO:
+        return None
+    origen, destino = divmod(codigo, 64)
+    return divmod(origen, 8), divmod(destino, 8)
+
+
+class TablaTransposicion:
+    """
+    Tabla de transposición acotada con cubetas de dos entradas.
+
+    Con la política "profundidad", la primera entrada de la cubeta solo se reemplaza por
+    una búsqueda al menos igual de profunda (o si es de una búsqueda anterior) y la
+    segunda se reemplaza siempre. Con "siempre", la entrada nueva ocupa la primera
+    posición y la anterior pasa a la segunda.
+
+    Atributos:
+    ----------
+    num_cubetas : int
+        Número de cubetas (potencia de dos).
+    politica : str
+        Política de reemplazo ("profundidad" o "siempre").
+    generacion : int
+        Contador de búsquedas (0-255) para envejecer las entradas.
+
+    Métodos:
+    --------
+    sondear(clave: int) -> Optional[Entrada]:
+        Devuelve (profundidad, puntuación, cota, movimiento) si la posición está guardada.
+    guardar(clave, profundidad, puntuacion, cota, movimiento) -> None:
+        Guarda el resultado de una búsqueda según la política de reemplazo.
+    nueva_busqueda() -> None:
+        Marca el comienzo de una búsqueda nueva (las entradas previas pasan a ser antiguas).
+    limpiar() -> None:
+        Vacía la tabla sin liberar la memoria reservada.
+    """
+
+    def __init__(self, megabytes: float = 4, politica: str = REEMPLAZO_PROFUNDIDAD) -> None:
+        """
+        Reserva la tabla con un tamaño máximo aproximado.
+
+        Parámetros:
+        -----------
+        megabytes : float
+            Memoria máxima que puede ocupar la tabla.
+        politica : str
+            "profundidad" (profundidad preferida + siempre) o "siempre".
+
+        Lanza:
+        ------
+        ValueError
+            Si el tamaño no es positivo o la política no existe.
+        """
+        if megabytes <= 0:
+            raise ValueError("El tamaño de la tabla de transposición debe ser positivo.")
+        if politica not in (REEMPLAZO_PROFUNDIDAD, REEMPLAZO_SIEMPRE):
+            raise ValueError(f"Política de reemplazo desconocida: {politica}")
+
+        maximo = int(megabytes * 1024 * 1024) // (_BYTES_POR_ENTRADA * _ENTRADAS_POR_CUBETA)
+        self.num_cubetas: int = 1 << max(0, maximo.bit_length() - 1)
+        self.politica: str = politica
+        self.generacion: int = 0
+        self._mascara: int = self.num_cubetas - 1
+
+        entradas = self.num_cubetas * _ENTRADAS_POR_CUBETA
+        self._claves = array("Q", bytes(8 * entradas))
+        self._puntuaciones = array("i", bytes(4 * entradas))
+        self._movimientos = array("H", [SIN_MOVIMIENTO]) * entradas
+        self._profundidades = array("b", bytes(entradas))
+        self._cotas = array("B", bytes(entradas))
+        self._generaciones = array("B", bytes(entradas))
+        self._ocupadas = array("B", bytes(entradas))
+
+    def sondear(self, clave: int) -> Optional[Entrada]:
+        """
+        Busca una posición en la tabla.
+
+        Parámetros:
+        -----------
+        clave : int
+            Clave Zobrist de la posición.
+
+        Retorna:
+        --------
+        Optional[Entrada]
+            (profundidad, puntuación, cota, movimiento) o None si no está guardada.
+        """
+        base = (clave & self._mascara) * _ENTRADAS_POR_CUBETA
+        for i in (base, base + 1):
+            if self._ocupadas[i] and self._claves[i] == clave:
+                return (
+                    self._profundidades[i], self._puntuaciones[i], self._cotas[i],
+                    decodificar_movimiento(self._movimientos[i]),
+                )
+        return None
+
+    def guardar(
+        self, clave: int, profundidad: int, puntuacion: int, cota: int, movimiento: Optional[Movimiento] = None
+    ) -> None:
+        """
+        Guarda el resultado de buscar una posición.
+
+        Si la posición ya estaba en la cubeta se actualiza su entrada (conservando el
+        movimiento anterior si no se aporta uno nuevo).
+
+        Parámetros:
+        -----------
+        clave : int
+            Clave Zobrist de la posición.
+        profundidad : int
+            Profundidad restante con la que se buscó.
+        puntuacion : int
+            Puntuación obtenida.
+        cota : int
+            EXACTA, COTA_INFERIOR o COTA_SUPERIOR.
+        movimiento : Optional[Movimiento]
+            Mejor movimiento encontrado, si lo hay.
+        """
+        base = (clave & self._mascara) * _ENTRADAS_POR_CUBETA
+        codigo = codificar_movimiento(movimiento)
+
+        if self._ocupadas[base] and self._claves[base] == clave:
+            destino = base
+        elif self._ocupadas[base + 1] and self._claves[base + 1] == clave:
+            destino = base + 1
+        elif self.politica == REEMPLAZO_SIEMPRE:
+            self._copiar(base, base + 1)
+            destino = base
+        elif (
+            not self._ocupadas[base]
+            or self._generaciones[base] != self.generacion
+            or profundidad >= self._profundidades[base]
+        ):
+            # La entrada desplazada aún puede servir: pasa a la de reemplazo siempre
+            self._copiar(base, base + 1)
+            destino = base
+        else:
+            destino = base + 1
+
+        if codigo == SIN_MOVIMIENTO and self._ocupadas[destino] and self._claves[destino] == clave:
+            codigo = self._movimientos[destino]
+        self._claves[destino] = clave
+        self._profundidades[destino] = max(-128, min(127, profundidad))
+        self._puntuaciones[destino] = puntuacion
+        self._cotas[destino] = cota
+        self._movimientos[destino] = codigo
+        self._generaciones[destino] = self.generacion
+        self._ocupadas[destino] = 1
+
+    def nueva_busqueda(self) -> None:
+        """
+        Avanza la generación; las entradas de búsquedas anteriores se reemplazan antes.
+        """
+        self.generacion = (self.generacion + 1) & 0xFF
+
+    def limpiar(self) -> None:
+        """
+        Marca todas las entradas como libres sin liberar la memoria reservada.
+        """
+        self._ocupadas = array("B", bytes(len(self._ocupadas)))
+        self.generacion = 0
+
+    def ocupacion(self) -> float:
+        """
+        Devuelve la fracción de entradas ocupadas (0.0 - 1.0).
+        """
+        return sum(self._ocupadas) / len(self._ocupadas)
+
+    def _copiar(self, origen: int, destino: int) -> None:
+        self._claves[destino] = self._claves[origen]
+        self._profundidades[destino] = self._profundidades[origen]
+        self._puntuaciones[destino] = self._puntuaciones[origen]
+        self._cotas[destino] = self._cotas[origen]
+        self._movimientos[destino] = self._movimientos[origen]
+        self._generaciones[destino] = self._generaciones[origen]
+        self._ocupadas[destino] = self._ocupadas[origen]
@@ -0,0 +1,80 @@
+"""
+Módulo con las tablas de evaluación indexadas por código de pieza que mantiene el tablero.
+
+Reorganiza las tablas PeSTO de `SALAS_IA/pesto.py` (medio juego y final) para que el
+tablero pueda sumar o restar la contribución de una pieza al colocarla o retirarla con
+una sola consulta: `PST_MEDIO[codigo][casilla]`. Las tablas de PeSTO están escritas desde
+el punto de vista de las blancas con la casilla 0 en a8, igual que `fila * 8 + columna`;
+para las negras se refleja la fila (casilla ^ 56) y se cambia el signo, de modo que las
+sumas del tablero son siempre a favor de las blancas.
+
+El material usa los valores de `piezas/codigos.py` (los mismos que el resto de la IA);
+de PeSTO solo se toman las bonificaciones posicionales y el peso de cada pieza en la fase.
+
+Contenido:
+----------
+- MATERIAL, PST_MEDIO, PST_FINAL y FASE_PIEZA, indexadas por código con signo.
+- FASE_MAXIMA: fase con todas las piezas en el tablero (la de `SALAS_IA/pesto.py`).
+- sumas_evaluacion: las cuatro sumas desde cero, para comprobar las incrementales
+  (`juego/perft.py --referencias`).
+"""
+
+from typing import Sequence, Tuple
+
+from SALAS_IA.pesto import mg_pesto_table, eg_pesto_table, gamephase_inc, FASE_MAXIMA
+from piezas.codigos import VALORES, CODIGO_REY
+
+
+def _por_codigo(valor_blancas) -> tuple:
+    # 13 filas como CLAVES_PIEZA: los códigos negativos se indexan desde el final
+    filas = [None] * 13
+    filas[0] = valor_blancas(0, False)
+    for tipo in range(1, 7):
+        filas[tipo] = valor_blancas(tipo, False)
+        filas[-tipo] = valor_blancas(tipo, True)
+    return tuple(filas)
+
+
+def _tabla(tablas_pesto):
+    def valor(tipo: int, negra: bool) -> Tuple[int, ...]:
+        if tipo == 0:
+            return (0,) * 64
+        tabla = tablas_pesto[tipo - 1]
+        if negra:
+            return tuple(-tabla[casilla ^ 56] for casilla in range(64))
+        return tuple(tabla)
+    return valor
+
+
+PST_MEDIO: Tuple[Tuple[int, ...], ...] = _por_codigo(_tabla(mg_pesto_table))
+PST_FINAL: Tuple[Tuple[int, ...], ...] = _por_codigo(_tabla(eg_pesto_table))
+
+# El rey no suma material: siempre hay uno de cada color
+MATERIAL: Tuple[int, ...] = _por_codigo(
+    lambda tipo, negra: 0 if tipo in (0, CODIGO_REY) else (-VALORES[tipo] if negra else VALORES[tipo])
+)
+FASE_PIEZA: Tuple[int, ...] = _por_codigo(lambda tipo, negra: gamephase_inc[tipo - 1] if tipo else 0)
+
+
+def sumas_evaluacion(codigos: Sequence[int]) -> Tuple[int, int, int, int]:
+    """
+    Calcula desde cero las sumas que el tablero mantiene de forma incremental.
+
+    Parámetros:
+    -----------
+    codigos : Sequence[int]
+        Las 64 casillas codificadas.
+
+    Retorna:
+    --------
+    Tuple[int, int, int, int]
+        Material, posicional de medio juego y de final (a favor de las blancas) y fase.
+    """
+    material = medio = final = fase = 0
+    for casilla, codigo in enumerate(codigos):
+        if codigo:
+            material += MATERIAL[codigo]
+            medio += PST_MEDIO[codigo][casilla]
+            final += PST_FINAL[codigo][casilla]
+            fase += FASE_PIEZA[codigo]
+    return material, medio, final, fase
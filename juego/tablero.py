@@ -15,9 +15,44 @@ from piezas.torre import Torre
 from piezas.caballo import Caballo
 from piezas.alfil import Alfil
 from piezas.reina import Reina
-from piezas.rey import Rey
+from piezas.rey import Rey, ENROQUE_CORTO, ENROQUE_LARGO
 from piezas.pieza_base import Pieza
+from piezas.codigos import (
+    SIGNO, CODIGO_PEON, CODIGO_CABALLO, CODIGO_ALFIL, CODIGO_TORRE, CODIGO_REINA, CODIGO_REY,
+    codigo_de, tablero_vacio,
+)
+from piezas.tablas_ataque import (
+    ATAQUES_CABALLO, ATAQUES_REY, ATAQUES_PEON, ataques_alfil, ataques_torre, ataques_reina,
+    INDICES_SALTOS_CABALLO, INDICES_CAPTURAS_PEON, INDICES_RAYOS, DIRECCIONES_ALFIL, DIRECCIONES_TORRE,
+)
 from juego.validador_movimiento import ValidadorMovimiento
+from juego.zobrist import CLAVES_PIEZA, CLAVE_TURNO, CLAVES_ENROQUE, CLAVES_AL_PASO, calcular_clave
+from juego.tablas_pesto import MATERIAL, PST_MEDIO, PST_FINAL, FASE_PIEZA
+
+# Piezas a las que puede promocionar un peón
+PROMOCIONES = {"dama": Reina, "torre": Torre, "alfil": Alfil, "caballo": Caballo}
+
+# Letras FEN de cada pieza (en minúscula; las blancas van en mayúscula)
+PIEZAS_FEN = {"p": Peon, "n": Caballo, "b": Alfil, "r": Torre, "q": Reina, "k": Rey}
+LETRAS_FEN = {clase.__name__: letra for letra, clase in PIEZAS_FEN.items()}
+
+# Derechos de enroque FEN: bit en `derechos_enroque`, fila del rey y columna de la torre implicada
+ENROQUES_FEN = {
+    "K": (ENROQUE_CORTO["blanco"], 7, 7), "Q": (ENROQUE_LARGO["blanco"], 7, 0),
+    "k": (ENROQUE_CORTO["negro"], 0, 7), "q": (ENROQUE_LARGO["negro"], 0, 0),
+}
+TODOS_LOS_ENROQUES = 15
+
+# Derechos que se pierden cuando un movimiento sale de o llega a cada casilla
+# (casillas iniciales de reyes y torres; llegar a ellas equivale a capturar la torre)
+PERDIDA_ENROQUE = [0] * 64
+for _bit, _fila, _col_torre in ENROQUES_FEN.values():
+    PERDIDA_ENROQUE[_fila * 8 + 4] |= _bit
+    PERDIDA_ENROQUE[_fila * 8 + _col_torre] |= _bit
+PERDIDA_ENROQUE = tuple(PERDIDA_ENROQUE)
+
+# Generadores de ataque de las piezas deslizantes por código de tipo, a partir de la tabla de rayos
+_ATAQUES_DESLIZANTES = {CODIGO_ALFIL: ataques_alfil, CODIGO_TORRE: ataques_torre, CODIGO_REINA: ataques_reina}
 
 class Tablero:
     """
@@ -29,6 +64,30 @@ class Tablero:
         Matriz 8x8 que contiene las piezas del tablero o None en casillas vacías.
     ultimo_movimiento : Optional[Tuple[Tuple[int, int], Tuple[int, int], Pieza]]
         Información sobre el último movimiento realizado.
+    casilla_al_paso : Optional[Tuple[int, int]]
+        Casilla a la que se puede capturar al paso tras un doble avance de peón, o None.
+    derechos_enroque : int
+        Derechos de enroque como máscara de 4 bits (K=1, Q=2, k=4, q=8, como en FEN).
+    turno : str
+        Color al que le toca mover; cada `hacer_movimiento` lo alterna.
+    clave_zobrist : int
+        Clave Zobrist de 64 bits de la posición (piezas, turno, enroques y captura al
+        paso), mantenida de forma incremental (ver `juego/zobrist.py`).
+    historial_movimientos : List[tuple]
+        Pila de registros para deshacer los movimientos hechos con `hacer_movimiento`.
+    posiciones_rey : Dict[str, Optional[Tuple[int, int]]]
+        Casilla actual del rey de cada color, mantenida de forma incremental.
+    codigos : array
+        Tablero codificado: 64 enteros con signo (`piezas/codigos.py`) indexados por
+        `fila * 8 + columna`, sincronizado con `casillas`. Es la vista que usan la
+        detección de ataques, el hash y la evaluación.
+    material, posicional_medio, posicional_final : int
+        Sumas de material y de las tablas posicionales PeSTO de medio juego y final, a
+        favor de las blancas, mantenidas al colocar y retirar piezas (`juego/tablas_pesto.py`).
+    fase : int
+        Fase de la partida según las piezas que quedan (24 con todas, 0 con solo reyes y peones).
+    numero_piezas : int
+        Piezas en el tablero, reyes incluidos (para decidir si se sondean las tablas de finales).
 
     Métodos:
     --------
@@ -40,6 +99,12 @@ class Tablero:
         Realiza la promoción de un peón (sin implementar).
     interpretar_entrada(entrada: str) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         Convierte una entrada en notación algebraica a coordenadas internas.
+    cargar_fen(fen: str) -> str:
+        Coloca una posición FEN y devuelve el color al que le toca mover.
+    obtener_fen(turno: Optional[str] = None) -> str:
+        Describe la posición actual en notación FEN.
+    hacer_movimiento_nulo() / deshacer_movimiento_nulo(estado) -> None:
+        Pasa el turno sin mover (para la poda de movimiento nulo) y lo revierte.
     mover_pieza_tests(origenydestino: Tuple[Tuple[int, int], Tuple[int, int]]) -> bool:
         Mueve una pieza sin validación para pruebas internas.
     """
@@ -47,8 +112,19 @@ class Tablero:
     def __init__(self) -> None:
         self.casillas: List[List[Optional[object]]] = [[None for _ in range(8)] for _ in range(8)]
         self.ultimo_movimiento: Optional[Tuple[Tuple[int, int], Tuple[int, int], object]] = None
+        self.casilla_al_paso: Optional[Tuple[int, int]] = None
+        self.derechos_enroque: int = 0
+        self.turno: str = "blanco"
+        self.clave_zobrist: int = 0
+        self.posiciones_rey: Dict[str, Optional[Tuple[int, int]]] = {"blanco": None, "negro": None}
+        self.codigos = tablero_vacio()
+        self.material: int = 0
+        self.posicional_medio: int = 0
+        self.posicional_final: int = 0
+        self.fase: int = 0
+        self.numero_piezas: int = 0
+        self.historial_movimientos: List[tuple] = []
         self.colocar_piezas_iniciales()
-        self.historial_movimientos = []  
         self.validador: ValidadorMovimiento = ValidadorMovimiento(self)
 
 
@@ -85,26 +161,55 @@ class Tablero:
         """
         Coloca las piezas en sus posiciones iniciales en el tablero.
         """
-        self.casillas[7][0] = Torre("blanco")
-        self.casillas[7][1] = Caballo("blanco")
-        self.casillas[7][2] = Alfil("blanco")
-        self.casillas[7][3] = Reina("blanco")
-        self.casillas[7][4] = Rey("blanco")
-        self.casillas[7][5] = Alfil("blanco")
-        self.casillas[7][6] = Caballo("blanco")
-        self.casillas[7][7] = Torre("blanco")
-        for col in range(8):
-            self.casillas[6][col] = Peon("blanco")
-        self.casillas[0][0] = Torre("negro")
-        self.casillas[0][1] = Caballo("negro")
-        self.casillas[0][2] = Alfil("negro")
-        self.casillas[0][3] = Reina("negro")
-        self.casillas[0][4] = Rey("negro")
-        self.casillas[0][5] = Alfil("negro")
-        self.casillas[0][6] = Caballo("negro")
-        self.casillas[0][7] = Torre("negro")
-        for col in range(8):
-            self.casillas[1][col] = Peon("negro")
+        orden = [Torre, Caballo, Alfil, Reina, Rey, Alfil, Caballo, Torre]
+        for col, clase in enumerate(orden):
+            self._colocar_pieza(7, col, clase("blanco"))
+            self._colocar_pieza(6, col, Peon("blanco"))
+            self._colocar_pieza(0, col, clase("negro"))
+            self._colocar_pieza(1, col, Peon("negro"))
+        self.derechos_enroque = TODOS_LOS_ENROQUES
+        self._recalcular_clave()
+
+    def _colocar_pieza(self, fila: int, columna: int, pieza: Pieza) -> None:
+        """
+        Coloca una pieza en una casilla vacía.
+
+        Junto con `_retirar_pieza`, es el único punto por el que cambia el contenido de
+        `casillas`, de modo que todo el estado incremental (tablero codificado, posición
+        de los reyes, sumas de evaluación y, en las subclases, bitboards) se actualiza aquí.
+        """
+        indice = fila * 8 + columna
+        codigo = codigo_de(pieza)
+        self.casillas[fila][columna] = pieza
+        self.codigos[indice] = codigo
+        self.clave_zobrist ^= CLAVES_PIEZA[codigo][indice]
+        self.material += MATERIAL[codigo]
+        self.posicional_medio += PST_MEDIO[codigo][indice]
+        self.posicional_final += PST_FINAL[codigo][indice]
+        self.fase += FASE_PIEZA[codigo]
+        self.numero_piezas += 1
+        if pieza.codigo == CODIGO_REY:
+            self.posiciones_rey[pieza.color] = (fila, columna)
+
+    def _retirar_pieza(self, fila: int, columna: int) -> Optional[Pieza]:
+        """
+        Vacía una casilla y devuelve la pieza que contenía (o None si ya estaba vacía).
+        """
+        pieza = self.casillas[fila][columna]
+        if pieza is not None:
+            indice = fila * 8 + columna
+            codigo = self.codigos[indice]
+            self.clave_zobrist ^= CLAVES_PIEZA[codigo][indice]
+            self.material -= MATERIAL[codigo]
+            self.posicional_medio -= PST_MEDIO[codigo][indice]
+            self.posicional_final -= PST_FINAL[codigo][indice]
+            self.fase -= FASE_PIEZA[codigo]
+            self.numero_piezas -= 1
+            self.casillas[fila][columna] = None
+            self.codigos[indice] = 0
+            if pieza.codigo == CODIGO_REY:
+                self.posiciones_rey[pieza.color] = None
+        return pieza
 
     def mover_pieza(
         self,
@@ -148,46 +253,20 @@ class Tablero:
         if (fila_destino, col_destino) not in movimientos_validos or not self.validador.movimiento_es_legal((fila_origen,col_origen),(fila_destino,col_destino),pieza.color):
             return {"exito": False, "error": "Movimiento no válido para la pieza."}
 
-        # Enroque
-        if isinstance(pieza, Rey) and abs(col_destino - col_origen) == 2:
-            fila = fila_origen
-            if col_destino == 6:  # Enroque corto
-                torre = self.casillas[fila][7]
-                self.casillas[fila][5] = torre
-                self.casillas[fila][7] = None
-                torre.se_ha_movido = True
-            elif col_destino == 2:  # Enroque largo
-                torre = self.casillas[fila][0]
-                self.casillas[fila][3] = torre
-                self.casillas[fila][0] = None
-                torre.se_ha_movido = True
-
-        # Captura al paso
-        if isinstance(pieza, Peon) and col_origen != col_destino and self.casillas[fila_destino][col_destino] is None:
-            fila_captura = fila_origen
-            self.casillas[fila_captura][col_destino] = None
-
-        # Movimiento normal
-        self.casillas[fila_destino][col_destino] = pieza
-        self.casillas[fila_origen][col_origen] = None
-
-        if hasattr(pieza, "se_ha_movido"):
-            pieza.se_ha_movido = True
-
-        # Promoción de peón
-        if isinstance(pieza, Peon):
-            if (pieza.color == "blanco" and fila_destino == 0) or (pieza.color == "negro" and fila_destino == 7):
-                if promocion is None:
-                    return {
-                        "exito": False,
-                        "error": "Se requiere una pieza para promoción: dama, torre, alfil o caballo.",
-                        "requiere_promocion": True
-                    }
-                resultado_promocion = self.promocionar_peon(fila_destino, col_destino, pieza.color, promocion)
-                if resultado_promocion is not True:
-                    return {"exito": False, "error": resultado_promocion}
-
-        self.ultimo_movimiento = ((fila_origen, col_origen), (fila_destino, col_destino), pieza)
+        # Promoción de peón: la elección se valida antes de tocar el tablero
+        if isinstance(pieza, Peon) and fila_destino in (0, 7):
+            if promocion is None:
+                return {
+                    "exito": False,
+                    "error": "Se requiere una pieza para promoción: dama, torre, alfil o caballo.",
+                    "requiere_promocion": True
+                }
+            promocion = promocion.strip().lower()
+            if promocion not in PROMOCIONES:
+                return {"exito": False, "error": "Opción no válida. Elige dama, torre, alfil o caballo."}
+
+        # Enroque, captura al paso y promoción se resuelven en hacer_movimiento
+        self.hacer_movimiento(origen, destino, promocion)
 
         return {
             "exito": True,
@@ -221,79 +300,404 @@ class Tablero:
         """
 
         eleccion = eleccion.strip().lower()
-        if eleccion == "dama":
-            self.casillas[fila][columna] = Reina(color)
-        elif eleccion == "torre":
-            self.casillas[fila][columna] = Torre(color)
-        elif eleccion == "alfil":
-            self.casillas[fila][columna] = Alfil(color)
-        elif eleccion == "caballo":
-            self.casillas[fila][columna] = Caballo(color)
-        else:
+        if eleccion not in PROMOCIONES:
             return "Opción no válida. Elige dama, torre, alfil o caballo."
 
+        self._retirar_pieza(fila, columna)
+        self._colocar_pieza(fila, columna, PROMOCIONES[eleccion](color))
         return True
         
 
-    def hacer_movimiento(self, origen: Tuple[int, int], destino: Tuple[int, int]) -> None:
+    def hacer_movimiento(
+        self, origen: Tuple[int, int], destino: Tuple[int, int], promocion: Optional[str] = None
+    ) -> None:
         """
-        Realiza un movimiento de una pieza en el tablero y guarda la información necesaria 
-        para revertirlo posteriormente.
+        Realiza un movimiento completo en el tablero y apila un registro compacto para
+        poder revertirlo exactamente con `deshacer_ultimo_movimiento`.
+
+        Cubre todos los tipos de movimiento: capturas, enroque (mueve también la torre),
+        captura al paso, promoción, derechos de enroque, `ultimo_movimiento`, la casilla
+        de captura al paso, el turno y la clave Zobrist, que se actualiza con XOR solo de
+        lo que cambia. Así la búsqueda nunca necesita copiar el tablero.
+
+        El registro es una tupla con: origen, destino, pieza movida, pieza capturada,
+        casilla de la captura, pieza promocionada, movimiento de torre del enroque
+        (columna origen, columna destino), derechos de enroque previos,
+        `ultimo_movimiento` previo, casilla de captura al paso previa y clave Zobrist previa.
 
         Args:
             origen (Tuple[int, int]): Coordenada (fila, columna) de origen.
             destino (Tuple[int, int]): Coordenada (fila, columna) de destino.
+            promocion (Optional[str]): Pieza elegida si un peón llega a la última fila
+                ("dama" por defecto).
         """
         fila_o, col_o = origen
         fila_d, col_d = destino
+        clave_previa = self.clave_zobrist
+
+        pieza: Optional[Pieza] = self.casillas[fila_o][col_o]
+        es_peon = pieza.codigo == CODIGO_PEON
+        casilla_captura = destino
+        pieza_capturada: Optional[Pieza] = self._retirar_pieza(fila_d, col_d)
+        if pieza_capturada is None and es_peon and col_o != col_d:
+            # Captura al paso: el peón capturado está en la fila de origen
+            casilla_captura = (fila_o, col_d)
+            pieza_capturada = self._retirar_pieza(fila_o, col_d)
+
+        self._retirar_pieza(fila_o, col_o)
+        promovida: Optional[Pieza] = None
+        if es_peon and fila_d in (0, 7):
+            promovida = PROMOCIONES[promocion or "dama"](pieza.color)
+            self._colocar_pieza(fila_d, col_d, promovida)
+        else:
+            self._colocar_pieza(fila_d, col_d, pieza)
 
-        pieza_origen: Optional[Pieza] = self.casillas[fila_o][col_o]
-        pieza_capturada: Optional[Pieza] = self.casillas[fila_d][col_d]
+        movimiento_torre = None
+        if pieza.codigo == CODIGO_REY and abs(col_d - col_o) == 2:
+            col_torre, col_torre_destino = (7, 5) if col_d > col_o else (0, 3)
+            torre = self._retirar_pieza(fila_o, col_torre)
+            self._colocar_pieza(fila_o, col_torre_destino, torre)
+            movimiento_torre = (col_torre, col_torre_destino)
 
         # Guardamos el movimiento para poder deshacerlo
-        self.historial_movimientos.append((origen, destino, pieza_origen, pieza_capturada))
-
-        # Realizamos el movimiento
-        self.casillas[fila_d][col_d] = pieza_origen
-        self.casillas[fila_o][col_o] = None
+        derechos = self.derechos_enroque
+        al_paso = self.casilla_al_paso
+        self.historial_movimientos.append((
+            origen, destino, pieza, pieza_capturada, casilla_captura, promovida,
+            movimiento_torre, derechos, self.ultimo_movimiento, al_paso, clave_previa,
+        ))
+        clave = self.clave_zobrist ^ CLAVE_TURNO
+        if derechos:
+            self.derechos_enroque = derechos & ~(PERDIDA_ENROQUE[fila_o * 8 + col_o] | PERDIDA_ENROQUE[fila_d * 8 + col_d])
+            clave ^= CLAVES_ENROQUE[derechos] ^ CLAVES_ENROQUE[self.derechos_enroque]
+        if al_paso is not None:
+            clave ^= CLAVES_AL_PASO[al_paso[1]]
+        self.ultimo_movimiento = (origen, destino, pieza)
+        if es_peon and abs(fila_d - fila_o) == 2:
+            self.casilla_al_paso = ((fila_o + fila_d) // 2, col_o)
+            clave ^= CLAVES_AL_PASO[col_o]
+        else:
+            self.casilla_al_paso = None
+        self.clave_zobrist = clave
+        self.turno = "negro" if self.turno == "blanco" else "blanco"
 
     def deshacer_ultimo_movimiento(self) -> None:
         """
-        Revierte el último movimiento realizado en el tablero.
+        Revierte el último movimiento realizado en el tablero a partir de su registro.
         Si no hay movimientos para deshacer, no hace nada.
         """
         if not self.historial_movimientos:
             return
 
-        origen, destino, pieza_origen, pieza_capturada = self.historial_movimientos.pop()
+        (origen, destino, pieza, pieza_capturada, casilla_captura, promovida,
+         movimiento_torre, derechos_enroque, ultimo_movimiento, casilla_al_paso,
+         clave_zobrist) = self.historial_movimientos.pop()
 
         fila_o, col_o = origen
-        fila_d, col_d = destino
 
         # Restauramos el estado anterior del tablero
-        self.casillas[fila_o][col_o] = pieza_origen
-        self.casillas[fila_d][col_d] = pieza_capturada
+        self._retirar_pieza(destino[0], destino[1])
+        self._colocar_pieza(fila_o, col_o, pieza)
+        if pieza_capturada is not None:
+            self._colocar_pieza(casilla_captura[0], casilla_captura[1], pieza_capturada)
+
+        if movimiento_torre is not None:
+            col_torre, col_torre_destino = movimiento_torre
+            torre = self._retirar_pieza(fila_o, col_torre_destino)
+            self._colocar_pieza(fila_o, col_torre, torre)
+
+        self.derechos_enroque = derechos_enroque
+        self.ultimo_movimiento = ultimo_movimiento
+        self.casilla_al_paso = casilla_al_paso
+        self.clave_zobrist = clave_zobrist
+        self.turno = "negro" if self.turno == "blanco" else "blanco"
+
+    def hacer_movimiento_nulo(self) -> Tuple[Optional[Tuple[int, int]], int]:
+        """
+        Pasa el turno sin mover ninguna pieza (movimiento nulo de la búsqueda de la IA).
+
+        Solo cambian el turno, la casilla de captura al paso y la clave Zobrist; no se
+        apila nada en `historial_movimientos`.
+
+        Retorna:
+        --------
+        Tuple[Optional[Tuple[int, int]], int]
+            Estado previo (casilla de captura al paso y clave) para `deshacer_movimiento_nulo`.
+        """
+        estado = (self.casilla_al_paso, self.clave_zobrist)
+        clave = self.clave_zobrist ^ CLAVE_TURNO
+        if self.casilla_al_paso is not None:
+            clave ^= CLAVES_AL_PASO[self.casilla_al_paso[1]]
+            self.casilla_al_paso = None
+        self.clave_zobrist = clave
+        self.turno = "negro" if self.turno == "blanco" else "blanco"
+        return estado
+
+    def deshacer_movimiento_nulo(self, estado: Tuple[Optional[Tuple[int, int]], int]) -> None:
+        """
+        Revierte un `hacer_movimiento_nulo` con el estado que devolvió.
+        """
+        self.casilla_al_paso, self.clave_zobrist = estado
+        self.turno = "negro" if self.turno == "blanco" else "blanco"
+
+    def _recalcular_clave(self) -> None:
+        """
+        Calcula la clave Zobrist desde cero, tras colocar una posición completa.
+        """
+        columna_al_paso = self.casilla_al_paso[1] if self.casilla_al_paso is not None else None
+        self.clave_zobrist = calcular_clave(self.codigos, self.turno, self.derechos_enroque, columna_al_paso)
+
+    def posicion_rey(self, color: str) -> Optional[Tuple[int, int]]:
+        """
+        Devuelve en O(1) la casilla del rey del color dado.
+
+        Parámetros:
+        -----------
+        color : str
+            Color del rey ('blanco' o 'negro').
+
+        Retorna:
+        --------
+        Optional[Tuple[int, int]]
+            Coordenadas del rey, o None si no está en el tablero.
+        """
+        return self.posiciones_rey[color]
+
+    def generar_movimientos(self, color: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Genera todos los movimientos pseudolegales de las piezas de un color.
+
+        Parámetros:
+        -----------
+        color : str
+            Color de las piezas ('blanco' o 'negro').
+
+        Retorna:
+        --------
+        List[Tuple[Tuple[int, int], Tuple[int, int]]]
+            Lista de pares (origen, destino).
+        """
+        movimientos = []
+        for fila in range(8):
+            for col in range(8):
+                pieza = self.casillas[fila][col]
+                if pieza and pieza.color == color:
+                    for destino in pieza.obtener_movimientos_validos((fila, col), self):
+                        movimientos.append(((fila, col), destino))
+        return movimientos
+
+    def generar_movimientos_legales(self, color: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Genera únicamente los movimientos legales de un color, sin movimientos de prueba.
+
+        Por posición se calculan una sola vez las piezas que dan jaque (con la máscara de
+        casillas que tapan o capturan el jaque), las piezas propias clavadas (con el rayo
+        por el que pueden moverse) y las casillas atacadas por el rival. Con ello se filtran
+        los movimientos pseudolegales. Solo la captura al paso, por su posible jaque
+        descubierto horizontal, se comprueba aparte.
+
+        Parámetros:
+        -----------
+        color : str
+            Color de las piezas ('blanco' o 'negro').
+
+        Retorna:
+        --------
+        List[Tuple[Tuple[int, int], Tuple[int, int]]]
+            Lista de pares (origen, destino) legales.
+        """
+        movimientos = self.generar_movimientos(color)
+        rey = self.posiciones_rey[color]
+        if rey is None:
+            return movimientos
+
+        enemigo = "negro" if color == "blanco" else "blanco"
+        indice_rey = rey[0] * 8 + rey[1]
+        num_jaques, mascara_jaque, clavadas = self._jaques_y_clavadas(color, indice_rey)
+        atacadas = self.casillas_atacadas(enemigo, ignorar=rey)
+        codigos = self.codigos
+
+        legales = []
+        for origen, destino in movimientos:
+            indice_origen = origen[0] * 8 + origen[1]
+            bit_destino = 1 << (destino[0] * 8 + destino[1])
+
+            if indice_origen == indice_rey:
+                if bit_destino & atacadas:
+                    continue
+                if abs(destino[1] - origen[1]) == 2:
+                    # Enroque: ni desde jaque ni atravesando una casilla atacada
+                    paso = indice_origen + (1 if destino[1] > origen[1] else -1)
+                    if num_jaques or (1 << paso) & atacadas:
+                        continue
+                legales.append((origen, destino))
+                continue
+
+            if num_jaques > 1:
+                continue  # Jaque doble: solo puede mover el rey
+
+            if (
+                origen[1] != destino[1]
+                and not codigos[destino[0] * 8 + destino[1]]
+                and codigos[indice_origen] in (CODIGO_PEON, -CODIGO_PEON)
+            ):
+                if self._captura_al_paso_legal(origen, destino, rey, enemigo):
+                    legales.append((origen, destino))
+                continue
+
+            if num_jaques and not bit_destino & mascara_jaque:
+                continue
+            if indice_origen in clavadas and not bit_destino & clavadas[indice_origen]:
+                continue
+            legales.append((origen, destino))
+
+        return legales
+
+    def _jaques_y_clavadas(self, color: str, indice_rey: int) -> Tuple[int, int, Dict[int, int]]:
+        """
+        Calcula los jaques y las clavadas sobre el rey mirando hacia fuera desde su casilla.
+
+        Parámetros:
+        -----------
+        color : str
+            Color del rey.
+        indice_rey : int
+            Casilla plana del rey.
+
+        Retorna:
+        --------
+        Tuple[int, int, Dict[int, int]]
+            Número de piezas que dan jaque, máscara de casillas que resuelven el jaque
+            (capturar a quien lo da o interponerse) y, para cada pieza clavada, la máscara
+            del rayo por el que puede moverse.
+        """
+        codigos = self.codigos
+        signo = SIGNO[color]
+        num_jaques = 0
+        mascara_jaque = 0
+        clavadas: Dict[int, int] = {}
+
+        caballo = -signo * CODIGO_CABALLO
+        for indice in INDICES_SALTOS_CABALLO[indice_rey]:
+            if codigos[indice] == caballo:
+                num_jaques += 1
+                mascara_jaque |= 1 << indice
+
+        peon = -signo * CODIGO_PEON
+        for indice in INDICES_CAPTURAS_PEON[color][indice_rey]:
+            if codigos[indice] == peon:
+                num_jaques += 1
+                mascara_jaque |= 1 << indice
+
+        reina = -signo * CODIGO_REINA
+        for direcciones, deslizante in ((DIRECCIONES_ALFIL, -signo * CODIGO_ALFIL), (DIRECCIONES_TORRE, -signo * CODIGO_TORRE)):
+            for direccion in direcciones:
+                rayo = 0
+                propia = None
+                for indice in INDICES_RAYOS[direccion][indice_rey]:
+                    rayo |= 1 << indice
+                    codigo = codigos[indice]
+                    if not codigo:
+                        continue
+                    if codigo * signo > 0:
+                        if propia is not None:
+                            break  # Dos piezas propias: no hay clavada
+                        propia = indice
+                        continue
+                    if codigo == deslizante or codigo == reina:
+                        if propia is None:
+                            num_jaques += 1
+                            mascara_jaque |= rayo
+                        else:
+                            clavadas[propia] = rayo
+                    break
+
+        return num_jaques, mascara_jaque, clavadas
+
+    def _captura_al_paso_legal(
+        self, origen: Tuple[int, int], destino: Tuple[int, int], rey: Tuple[int, int], enemigo: str
+    ) -> bool:
+        """
+        Comprueba una captura al paso aplicándola directamente sobre `codigos`.
+
+        Es el único caso en que desaparecen dos piezas de la misma fila, por lo que puede
+        descubrir un jaque que la máscara de clavadas no detecta.
+        """
+        codigos = self.codigos
+        origen_i = origen[0] * 8 + origen[1]
+        destino_i = destino[0] * 8 + destino[1]
+        capturado_i = origen[0] * 8 + destino[1]
+        peon = codigos[origen_i]
+        capturado = codigos[capturado_i]
+
+        codigos[destino_i] = peon
+        codigos[origen_i] = 0
+        codigos[capturado_i] = 0
+        legal = not self.validador.casilla_atacada(rey, enemigo)
+        codigos[origen_i] = peon
+        codigos[capturado_i] = capturado
+        codigos[destino_i] = 0
+        return legal
+
+    def casillas_atacadas(self, color: str, ignorar: Optional[Tuple[int, int]] = None) -> int:
+        """
+        Calcula qué casillas ataca un color, como máscara de 64 bits (bit `fila * 8 + columna`).
 
-    def generar_hash(self) -> str:
+        Las piezas de salto y los peones se resuelven con las tablas de ataque y las
+        deslizantes con la tabla de rayos y la ocupación actual del tablero. No incluye
+        avances de peón ni enroques, ya que no atacan.
+
+        Parámetros:
+        -----------
+        color : str
+            Color atacante ('blanco' o 'negro').
+        ignorar : Optional[Tuple[int, int]]
+            Casilla que se considera vacía para los rayos (p. ej. el rey defensor, para
+            que no tape las casillas que quedan detrás de él en la línea de jaque).
+
+        Retorna:
+        --------
+        int
+            Máscara con las casillas atacadas.
         """
-        Genera una representación en forma de cadena del estado actual del tablero.
+        signo = SIGNO[color]
+        ignorado = ignorar[0] * 8 + ignorar[1] if ignorar is not None else -1
+        ocupacion = 0
+        piezas_color = []
+        for indice, codigo in enumerate(self.codigos):
+            if codigo and indice != ignorado:
+                ocupacion |= 1 << indice
+                if codigo * signo > 0:
+                    piezas_color.append((codigo * signo, indice))
+
+        atacadas = 0
+        for tipo, indice in piezas_color:
+            if tipo == CODIGO_PEON:
+                atacadas |= ATAQUES_PEON[color][indice]
+            elif tipo == CODIGO_CABALLO:
+                atacadas |= ATAQUES_CABALLO[indice]
+            elif tipo == CODIGO_REY:
+                atacadas |= ATAQUES_REY[indice]
+            else:
+                atacadas |= _ATAQUES_DESLIZANTES[tipo](indice, ocupacion)
+        return atacadas
+
+    def generar_hash(self) -> int:
+        """
+        Devuelve la clave Zobrist de 64 bits del estado actual del tablero.
         Útil para implementaciones de tablas de transposición o almacenamiento en caché.
 
         Returns:
-            str: Cadena que representa el estado del tablero.
+            int: Clave que identifica piezas, turno, derechos de enroque y captura al paso.
         """
-        piezas: List[str] = []
-
-        for fila in self.casillas:
-            for p in fila:
-                if p:
-                    piezas.append(f"{p.__class__.__name__[0]}{p.color[0]}")
-                else:
-                    piezas.append("..")  # Casilla vacía
+        return self.clave_zobrist
 
-        return ''.join(piezas)
-    
-    def restaurar_estado_lista(self, lista: List[List[Optional[Dict[str, str]]]]) -> None:
+    def restaurar_estado_lista(
+        self,
+        lista: List[List[Optional[Dict[str, str]]]],
+        derechos_enroque: Optional[int] = None,
+        turno: str = "blanco"
+    ) -> None:
         """
         Restaura el estado del tablero a partir de una lista bidimensional que representa 
         cada casilla con un diccionario que indica el tipo y color de la pieza, o None si está vacía.
@@ -305,6 +709,11 @@ class Tablero:
             - Un diccionario con las claves "tipo" (str) y "color" (str) que identifican 
             la pieza que debe colocarse en esa casilla.
             - None, si la casilla está vacía.
+        derechos_enroque : Optional[int]
+            Derechos de enroque guardados. Si no se indican, se conservan los de los reyes y
+            torres que siguen en su casilla inicial.
+        turno : str
+            Color al que le toca mover en la posición restaurada.
 
         Retorna:
         --------
@@ -325,14 +734,161 @@ class Tablero:
             "Peon": Peon
         }
 
+        self.historial_movimientos = []
+        self.ultimo_movimiento = None
+        self.casilla_al_paso = None
         for i, fila in enumerate(lista):
             for j, celda in enumerate(fila):
-                if celda is None:
-                    self.casillas[i][j] = None
-                else:
+                self._retirar_pieza(i, j)
+                if celda is not None:
                     tipo = celda["tipo"]
                     color = celda["color"]
-                    self.casillas[i][j] = clase_pieza[tipo](color)
+                    self._colocar_pieza(i, j, clase_pieza[tipo](color))
+        if derechos_enroque is None:
+            derechos_enroque = TODOS_LOS_ENROQUES
+        self.derechos_enroque = self._derechos_por_posicion(derechos_enroque)
+        self.turno = turno
+        self._recalcular_clave()
+
+    def _derechos_por_posicion(self, derechos: int) -> int:
+        """
+        Conserva de `derechos` solo los enroques cuyo rey y torre están en su casilla inicial.
+        """
+        for bit, fila, col_torre in ENROQUES_FEN.values():
+            color = "blanco" if fila == 7 else "negro"
+            rey = self.casillas[fila][4]
+            torre = self.casillas[fila][col_torre]
+            if not (
+                isinstance(rey, Rey) and rey.color == color
+                and isinstance(torre, Torre) and torre.color == color
+            ):
+                derechos &= ~bit
+        return derechos
+
+    def cargar_fen(self, fen: str) -> str:
+        """
+        Coloca en el tablero la posición descrita por una cadena FEN.
+
+        Los derechos de enroque pasan a `derechos_enroque` (solo si el rey y la torre están
+        en su casilla inicial) y la casilla de captura al paso a `casilla_al_paso`. Los contadores de jugadas se ignoran.
+
+        Parámetros:
+        -----------
+        fen : str
+            Posición en notación FEN (al menos la colocación de piezas y el turno).
+
+        Retorna:
+        --------
+        str
+            Color al que le toca mover ('blanco' o 'negro').
+
+        Lanza:
+        ------
+        ValueError
+            Si la cadena no es un FEN válido.
+        """
+        partes = fen.split()
+        if len(partes) < 2 or partes[1] not in ("w", "b"):
+            raise ValueError(f"FEN no válido: {fen!r}")
+        filas = partes[0].split("/")
+        enroques = partes[2] if len(partes) > 2 else "-"
+        al_paso = partes[3] if len(partes) > 3 else "-"
+        if len(filas) != 8:
+            raise ValueError(f"FEN no válido: {fen!r}")
+
+        self.historial_movimientos = []
+        self.ultimo_movimiento = None
+        self.casilla_al_paso = None
+        self.derechos_enroque = 0
+        for i in range(8):
+            for j in range(8):
+                self._retirar_pieza(i, j)
+
+        for i, fila in enumerate(filas):
+            j = 0
+            for caracter in fila:
+                if caracter.isdigit():
+                    j += int(caracter)
+                    continue
+                if caracter.lower() not in PIEZAS_FEN or j > 7:
+                    raise ValueError(f"FEN no válido: {fen!r}")
+                color = "blanco" if caracter.isupper() else "negro"
+                self._colocar_pieza(i, j, PIEZAS_FEN[caracter.lower()](color))
+                j += 1
+            if j != 8:
+                raise ValueError(f"FEN no válido: {fen!r}")
+
+        derechos = 0
+        for letra, (bit, _, _) in ENROQUES_FEN.items():
+            if letra in enroques:
+                derechos |= bit
+        self.derechos_enroque = self._derechos_por_posicion(derechos)
+
+        if al_paso != "-":
+            casilla = self.interpretar_casilla(al_paso)
+            if casilla is None:
+                raise ValueError(f"FEN no válido: {fen!r}")
+            self.casilla_al_paso = casilla
+
+        self.turno = "blanco" if partes[1] == "w" else "negro"
+        self._recalcular_clave()
+        return self.turno
+
+    def obtener_fen(self, turno: Optional[str] = None) -> str:
+        """
+        Describe la posición actual en notación FEN.
+
+        Parámetros:
+        -----------
+        turno : Optional[str]
+            Color al que le toca mover ('blanco' o 'negro'); por defecto, `self.turno`.
+
+        Retorna:
+        --------
+        str
+            Cadena FEN de la posición (los contadores de jugadas se dejan en "0 1").
+        """
+        filas = []
+        for fila in self.casillas:
+            texto = ""
+            vacias = 0
+            for pieza in fila:
+                if pieza is None:
+                    vacias += 1
+                    continue
+                if vacias:
+                    texto += str(vacias)
+                    vacias = 0
+                letra = LETRAS_FEN[pieza.__class__.__name__]
+                texto += letra.upper() if pieza.color == "blanco" else letra
+            if vacias:
+                texto += str(vacias)
+            filas.append(texto)
+
+        enroques = "".join(
+            letra for letra, (bit, _, _) in ENROQUES_FEN.items() if self.derechos_enroque & bit
+        )
+
+        al_paso = "-"
+        if self.casilla_al_paso is not None:
+            fila, col = self.casilla_al_paso
+            al_paso = "abcdefgh"[col] + str(8 - fila)
+
+        if turno is None:
+            turno = self.turno
+        return f"{'/'.join(filas)} {'w' if turno == 'blanco' else 'b'} {enroques or '-'} {al_paso} 0 1"
+
+    @staticmethod
+    def interpretar_casilla(texto: str) -> Optional[Tuple[int, int]]:
+        """
+        Convierte una casilla en notación algebraica (ej. 'e3') a coordenadas internas.
+
+        Retorna None si el texto no es una casilla válida.
+        """
+        texto = texto.strip().lower()
+        if len(texto) != 2 or texto[0] not in "abcdefgh" or texto[1] not in "12345678":
+            return None
+        return 8 - int(texto[1]), "abcdefgh".index(texto[0])
 
 
     @staticmethod
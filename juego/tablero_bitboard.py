@@ -0,0 +1,237 @@
+"""
+Módulo con un motor de tablero alternativo basado en bitboards de 64 bits.
+
+`TableroBitboard` mantiene la misma API que `Tablero` (`mover_pieza`, `hacer_movimiento`,
+`deshacer_ultimo_movimiento`, ...) y la misma matriz `casillas`, pero además guarda doce
+bitboards (uno por tipo de pieza y color) junto con las máscaras de ocupación por color
+y total. La generación de movimientos para la IA se resuelve con aritmética de máscaras
+en lugar de llamar al método de cada pieza.
+
+Clases:
+    - TableroBitboard
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from juego.tablero import Tablero
+from juego.bitboards import (
+    FILAS, COLUMNA_A, COLUMNA_H, MASCARA_64,
+    PEON, CABALLO, ALFIL, TORRE, REINA, REY,
+    indice_codigo,
+)
+from piezas.rey import ENROQUE_CORTO, ENROQUE_LARGO
+from piezas.tablas_ataque import (
+    ATAQUES_CABALLO, ATAQUES_REY, ATAQUES_PEON,
+    ataques_alfil, ataques_torre, ataques_reina,
+)
+
+Movimiento = Tuple[Tuple[int, int], Tuple[int, int]]
+
+# Coordenadas (fila, columna) de cada índice plano, compartidas por todos los movimientos
+_COORDENADAS: Tuple[Tuple[int, int], ...] = tuple(divmod(indice, 8) for indice in range(64))
+
+# Bitboard de cada código con signo (13 filas, los negativos se indexan desde el final)
+_BITBOARD_CODIGO: Tuple[int, ...] = tuple(
+    indice_codigo(codigo) if codigo else -1 for codigo in (*range(7), *range(-6, 0))
+)
+
+
+class TableroBitboard(Tablero):
+    """
+    Tablero de ajedrez que acompaña la matriz de objetos con bitboards de 64 bits.
+
+    Atributos:
+    ----------
+    bitboards : List[int]
+        Doce máscaras, una por tipo de pieza y color (blancas 0-5, negras 6-11).
+    ocupacion_color : Dict[str, int]
+        Máscara de casillas ocupadas por cada color.
+    ocupacion : int
+        Máscara de todas las casillas ocupadas.
+
+    Métodos:
+    --------
+    generar_movimientos(color: str) -> List[Movimiento]:
+        Genera los movimientos pseudolegales del color indicado mediante máscaras.
+    """
+
+    def __init__(self) -> None:
+        self.bitboards: List[int] = [0] * 12
+        self.ocupacion_color: Dict[str, int] = {"blanco": 0, "negro": 0}
+        self.ocupacion: int = 0
+        super().__init__()
+
+    def _colocar_pieza(self, fila: int, columna: int, pieza) -> None:
+        """
+        Coloca la pieza en la matriz y activa su bit en las máscaras.
+        """
+        super()._colocar_pieza(fila, columna, pieza)
+        indice = fila * 8 + columna
+        bit = 1 << indice
+        self.bitboards[_BITBOARD_CODIGO[self.codigos[indice]]] |= bit
+        self.ocupacion_color[pieza.color] |= bit
+        self.ocupacion |= bit
+
+    def _retirar_pieza(self, fila: int, columna: int):
+        """
+        Vacía la casilla en la matriz y desactiva su bit en las máscaras.
+        """
+        indice = fila * 8 + columna
+        codigo = self.codigos[indice]
+        pieza = super()._retirar_pieza(fila, columna)
+        if pieza is not None:
+            # Las máscaras siempre tienen el bit activo: XOR lo apaga sin construir ~bit
+            bit = 1 << indice
+            self.bitboards[_BITBOARD_CODIGO[codigo]] ^= bit
+            self.ocupacion_color[pieza.color] ^= bit
+            self.ocupacion ^= bit
+        return pieza
+
+    def generar_movimientos(self, color: str) -> List[Movimiento]:
+        """
+        Genera los movimientos pseudolegales del color dado usando aritmética de máscaras.
+
+        Produce el mismo conjunto de movimientos que `Tablero.generar_movimientos`
+        (incluidos enroque y captura al paso), pero sin recorrer las 64 casillas ni
+        llamar a `obtener_movimientos_validos` de cada pieza.
+
+        Parámetros:
+        -----------
+        color : str
+            Color de las piezas ('blanco' o 'negro').
+
+        Retorna:
+        --------
+        List[Movimiento]
+            Lista de pares (origen, destino).
+        """
+        base = 0 if color == "blanco" else 6
+        enemigo = "negro" if color == "blanco" else "blanco"
+        propias = self.ocupacion_color[color]
+        rivales = self.ocupacion_color[enemigo]
+        ocupacion = self.ocupacion
+        vacias = ~ocupacion & MASCARA_64
+        libres = ~propias
+        bitboards = self.bitboards
+        coordenadas = _COORDENADAS
+        movimientos: List[Movimiento] = []
+        anadir = movimientos.append
+
+        self._movimientos_peon(color, bitboards[base + PEON], vacias, rivales, movimientos)
+
+        # Los bits se recorren en línea (menor bit activo y XOR): un generador por
+        # máscara cuesta más que el propio cálculo de los destinos
+        for tipo, tabla, ataques in (
+            (CABALLO, ATAQUES_CABALLO, None), (ALFIL, None, ataques_alfil),
+            (TORRE, None, ataques_torre), (REINA, None, ataques_reina), (REY, ATAQUES_REY, None),
+        ):
+            piezas = bitboards[base + tipo]
+            while piezas:
+                bit = piezas & -piezas
+                piezas ^= bit
+                origen = bit.bit_length() - 1
+                destinos = (tabla[origen] if ataques is None else ataques(origen, ocupacion)) & libres
+                casilla_origen = coordenadas[origen]
+                while destinos:
+                    bit = destinos & -destinos
+                    destinos ^= bit
+                    anadir((casilla_origen, coordenadas[bit.bit_length() - 1]))
+
+        rey = bitboards[base + REY]
+        if rey:
+            self._movimientos_enroque(color, rey.bit_length() - 1, movimientos)
+
+        return movimientos
+
+    def casillas_atacadas(self, color: str, ignorar: Optional[Tuple[int, int]] = None) -> int:
+        """
+        Calcula la máscara de casillas atacadas por las piezas de un color usando los bitboards.
+
+        Parámetros:
+        -----------
+        color : str
+            Color atacante ('blanco' o 'negro').
+        ignorar : Optional[Tuple[int, int]]
+            Casilla que se considera vacía para los rayos.
+
+        Retorna:
+        --------
+        int
+            Máscara de 64 bits con las casillas atacadas.
+        """
+        base = 0 if color == "blanco" else 6
+        bitboards = self.bitboards
+        ocupacion = self.ocupacion
+        if ignorar is not None:
+            ocupacion &= ~(1 << (ignorar[0] * 8 + ignorar[1]))
+        atacadas = 0
+        for tipo, tabla in ((PEON, ATAQUES_PEON[color]), (CABALLO, ATAQUES_CABALLO), (REY, ATAQUES_REY)):
+            piezas = bitboards[base + tipo]
+            while piezas:
+                bit = piezas & -piezas
+                piezas ^= bit
+                atacadas |= tabla[bit.bit_length() - 1]
+        for tipo, ataques in ((ALFIL, ataques_alfil), (TORRE, ataques_torre), (REINA, ataques_reina)):
+            piezas = bitboards[base + tipo]
+            while piezas:
+                bit = piezas & -piezas
+                piezas ^= bit
+                atacadas |= ataques(bit.bit_length() - 1, ocupacion)
+        return atacadas
+
+    def _movimientos_peon(self, color: str, peones: int, vacias: int, rivales: int, movimientos: List[Movimiento]) -> None:
+        """
+        Añade los avances, dobles avances, capturas y capturas al paso de todos los peones.
+        """
+        if color == "blanco":
+            avance = -8
+            un_paso = (peones >> 8) & vacias
+            dos_pasos = ((un_paso & FILAS[5]) >> 8) & vacias
+            captura_oeste = ((peones & ~COLUMNA_A) >> 9) & rivales
+            captura_este = ((peones & ~COLUMNA_H) >> 7) & rivales
+            desp_oeste, desp_este = -9, -7
+        else:
+            avance = 8
+            un_paso = (peones << 8) & vacias
+            dos_pasos = ((un_paso & FILAS[2]) << 8) & vacias
+            captura_oeste = ((peones & ~COLUMNA_A) << 7) & rivales
+            captura_este = ((peones & ~COLUMNA_H) << 9) & rivales
+            desp_oeste, desp_este = 7, 9
+
+        coordenadas = _COORDENADAS
+        anadir = movimientos.append
+        for destinos, desplazamiento in (
+            (un_paso, avance), (dos_pasos, 2 * avance),
+            (captura_oeste, desp_oeste), (captura_este, desp_este),
+        ):
+            while destinos:
+                bit = destinos & -destinos
+                destinos ^= bit
+                destino = bit.bit_length() - 1
+                anadir((coordenadas[destino - desplazamiento], coordenadas[destino]))
+
+        # Captura al paso: la casilla objetivo queda en la fila 2 para las blancas y 5 para las negras
+        if self.casilla_al_paso is not None:
+            fila, col = self.casilla_al_paso
+            if fila == (2 if color == "blanco" else 5):
+                fila_origen = fila - avance // 8
+                for col_vecina in (col - 1, col + 1):
+                    if 0 <= col_vecina < 8 and peones & (1 << (fila_origen * 8 + col_vecina)):
+                        movimientos.append(((fila_origen, col_vecina), (fila, col)))
+
+    def _movimientos_enroque(self, color: str, origen: int, movimientos: List[Movimiento]) -> None:
+        """
+        Añade el enroque corto y largo si se conserva el derecho y el camino está libre.
+        """
+        fila_rey = 7 if color == "blanco" else 0
+        if origen != fila_rey * 8 + 4 or not self.derechos_enroque:
+            return
+        fila_bits = fila_rey * 8
+        for bit, cols_libres, col_destino in (
+            (ENROQUE_CORTO[color], (5, 6), 6), (ENROQUE_LARGO[color], (1, 2, 3), 2),
+        ):
+            if not self.derechos_enroque & bit:
+                continue
+            if any(self.ocupacion & (1 << (fila_bits + c)) for c in cols_libres):
+                continue
+            movimientos.append(((fila_rey, 4), (fila_rey, col_destino)))
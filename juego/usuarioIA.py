@@ -4,7 +4,12 @@ import json
 
 from usuario.usuario import Usuario
 from juego.IAjedrez import IADeAjedrez
+from juego.busqueda_paralela import buscar_en_paralelo
+from juego.libro_aperturas import libro_compartido
+from juego.finales import tablas_compartidas
+from juego.motor_uci import IAMotorUCI, pool_uci_compartido
 from config import PATH_USUARIOS                 # Ruta donde se guardan los archivos de usuario
+from config import TAMANO_TABLA_TRANSPOSICION_MB, TIEMPO_MOVIMIENTO_IA_MS, PODAS_IA
 
 
 class UsuarioIA(Usuario):
@@ -41,7 +46,21 @@ class UsuarioIA(Usuario):
         super().__init__(username=username, password=password, elo=elo,**kwargs)
         self.nivel: int = nivel
         self.es_ia: bool = es_ia
-        self.ia: IADeAjedrez = IADeAjedrez(self.nivel)  # Inicializa el motor IA con el nivel dado
+        # Inicializa el motor IA con el nivel dado; la memoria de su tabla de transposición, el
+        # tiempo por movimiento (que acota la latencia de /partidas/<id>/mover) y las podas
+        # de la búsqueda también dependen del nivel. Todas las IA comparten el mismo libro de
+        # aperturas y las mismas tablas de finales, abiertos una vez por proceso
+        megabytes = TAMANO_TABLA_TRANSPOSICION_MB.get(self.nivel, max(TAMANO_TABLA_TRANSPOSICION_MB.values()))
+        tiempo_ms = TIEMPO_MOVIMIENTO_IA_MS.get(self.nivel, max(TIEMPO_MOVIMIENTO_IA_MS.values()))
+        podas = PODAS_IA.get(self.nivel, PODAS_IA[max(PODAS_IA)])
+        parametros = dict(megabytes_tabla=megabytes, tiempo_ms=tiempo_ms,
+                          libro=libro_compartido(), finales=tablas_compartidas(), **podas)
+        # Con un motor UCI externo configurado, la IA le pide a él los movimientos
+        pool_uci = pool_uci_compartido()
+        if pool_uci is not None:
+            self.ia: IADeAjedrez = IAMotorUCI(pool_uci, self.nivel, **parametros)
+        else:
+            self.ia = IADeAjedrez(self.nivel, **parametros)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -121,6 +140,10 @@ class UsuarioIA(Usuario):
         """
         Usa el motor de ajedrez interno para calcular el mejor movimiento para la IA.
 
+        Si se ha iniciado el pool de procesos compartido (`juego/busqueda_paralela.py`),
+        la búsqueda se reparte entre sus procesos. Con un motor UCI externo configurado
+        (`MOTOR_UCI`), el movimiento se pide al pool de ese motor.
+
         Parámetros:
         -----------
         tablero : Tablero
@@ -134,4 +157,7 @@ class UsuarioIA(Usuario):
             Movimiento elegido por la IA (según la implementación de IADeAjedrez).
         """
         self.ia.color = color
-        return self.ia.encontrar_mejor_movimiento(tablero)
+        if isinstance(self.ia, IAMotorUCI):
+            # El motor externo ya reparte el trabajo entre sus propios procesos
+            return self.ia.encontrar_mejor_movimiento(tablero)
+        return buscar_en_paralelo(self.ia, tablero)
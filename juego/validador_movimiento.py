@@ -11,6 +11,15 @@ Clases:
 
 from typing import Optional, Tuple
 
+from piezas.rey import Rey
+from piezas.codigos import (
+    SIGNO, CODIGO_PEON, CODIGO_CABALLO, CODIGO_ALFIL, CODIGO_TORRE, CODIGO_REINA, CODIGO_REY,
+)
+from piezas.tablas_ataque import (
+    INDICES_SALTOS_CABALLO, INDICES_VECINOS_REY, INDICES_CAPTURAS_PEON, INDICES_RAYOS,
+    DIRECCIONES_ALFIL, DIRECCIONES_TORRE,
+)
+
 
 class ValidadorMovimiento:
     """
@@ -26,6 +35,8 @@ class ValidadorMovimiento:
 
     Métodos:
     --------
+    casilla_atacada(casilla: Tuple[int, int], por_color: str) -> bool:
+        Determina si alguna pieza del color dado ataca la casilla.
     esta_en_jaque(color: str) -> bool:
         Determina si el rey del color dado está en jaque.
     movimiento_es_legal(origen: Tuple[int, int], destino: Tuple[int, int], color: str) -> bool:
@@ -61,16 +72,59 @@ class ValidadorMovimiento:
         rey_pos = self._encontrar_rey(color)
         if not rey_pos:
             return False
+        return self.casilla_atacada(rey_pos, "negro" if color == "blanco" else "blanco")
+
+    def casilla_atacada(self, casilla: Tuple[int, int], por_color: str) -> bool:
+        """
+        Determina si alguna pieza de `por_color` ataca la casilla indicada.
 
-        for fila in range(8):
-            for col in range(8):
-                pieza = self.tablero.casillas[fila][col]
-                if pieza and pieza.color != color:
-                    movimientos = pieza.obtener_movimientos_validos(
-                        (fila, col), self.tablero, noatacando=True
-                    )
-                    if rey_pos in movimientos and self.movimiento_es_legal((fila,col),rey_pos,pieza.color):
-                        return True
+        En lugar de generar los movimientos de todas las piezas rivales, se mira hacia
+        fuera desde la casilla: saltos de caballo, casillas desde las que capturaría un
+        peón, casillas vecinas (rey) y los ocho rayos deslizantes, deteniéndose en el
+        primer bloqueo de cada rayo.
+
+        Parámetros:
+        -----------
+        casilla : Tuple[int, int]
+            Coordenadas (fila, columna) de la casilla a comprobar.
+        por_color : str
+            Color de las piezas atacantes ('blanco' o 'negro').
+
+        Retorna:
+        --------
+        bool
+            True si la casilla está atacada, False en caso contrario.
+        """
+        codigos = self.tablero.codigos
+        indice = casilla[0] * 8 + casilla[1]
+        signo = SIGNO[por_color]
+
+        caballo = signo * CODIGO_CABALLO
+        for i in INDICES_SALTOS_CABALLO[indice]:
+            if codigos[i] == caballo:
+                return True
+
+        # Un peón de `por_color` ataca esta casilla desde donde capturaría un peón del otro color
+        color_defensor = "negro" if por_color == "blanco" else "blanco"
+        peon = signo * CODIGO_PEON
+        for i in INDICES_CAPTURAS_PEON[color_defensor][indice]:
+            if codigos[i] == peon:
+                return True
+
+        rey = signo * CODIGO_REY
+        for i in INDICES_VECINOS_REY[indice]:
+            if codigos[i] == rey:
+                return True
+
+        reina = signo * CODIGO_REINA
+        for direcciones, deslizante in ((DIRECCIONES_ALFIL, signo * CODIGO_ALFIL), (DIRECCIONES_TORRE, signo * CODIGO_TORRE)):
+            for direccion in direcciones:
+                for i in INDICES_RAYOS[direccion][indice]:
+                    codigo = codigos[i]
+                    if codigo:
+                        if codigo == deslizante or codigo == reina:
+                            return True
+                        break
 
         return False
 
@@ -102,6 +156,13 @@ class ValidadorMovimiento:
         ):
             return False
 
+        # Enroque: el rey no puede estar en jaque ni atravesar una casilla atacada
+        if isinstance(pieza, Rey) and abs(destino[1] - origen[1]) == 2:
+            enemigo = "negro" if color == "blanco" else "blanco"
+            casilla_paso = (origen[0], (origen[1] + destino[1]) // 2)
+            if self.casilla_atacada(origen, enemigo) or self.casilla_atacada(casilla_paso, enemigo):
+                return False
+
         self.tablero.hacer_movimiento(origen,destino)
         es_legal = not self.esta_en_jaque(color)
         self.tablero.deshacer_ultimo_movimiento()
@@ -111,6 +172,9 @@ class ValidadorMovimiento:
         """
         Encuentra la posición del rey del color dado.
 
+        El tablero mantiene la casilla de cada rey de forma incremental, por lo que
+        la consulta es O(1) en lugar de recorrer las 64 casillas.
+
         Parámetros:
         -----------
         color : str
@@ -121,9 +185,4 @@ class ValidadorMovimiento:
         Optional[Tuple[int, int]]
             Coordenadas del rey, o None si no se encuentra.
         """
-        for fila in range(8):
-            for col in range(8):
-                pieza = self.tablero.casillas[fila][col]
-                if pieza and pieza.color == color and pieza.__class__.__name__ == "Rey":
-                    return (fila, col)
-        return None
+        return self.tablero.posicion_rey(color)
@@ -0,0 +1,84 @@
+"""
+Módulo con las claves Zobrist de 64 bits del tablero.
+
+Adapta el esquema de `SALAS_IA/Zobrist.py` (`init_zobrist` / `update_zobrist`) a la
+codificación de `piezas/codigos.py`: la clave de una posición es el XOR de un número
+aleatorio por cada pieza en su casilla, más el turno, los derechos de enroque y la
+columna de captura al paso. Al hacer un movimiento basta con aplicar XOR a las claves
+que cambian, sin recorrer el tablero.
+
+Los números se generan con una semilla fija para que la misma posición tenga la misma
+clave en todos los procesos y ejecuciones (libro de aperturas, búsqueda en paralelo).
+
+Contenido:
+----------
+- CLAVES_PIEZA, CLAVE_TURNO, CLAVES_ENROQUE y CLAVES_AL_PASO.
+- calcular_clave: clave completa de una posición desde cero.
+"""
+
+import random
+from typing import Optional, Sequence, Tuple
+
+SEMILLA = 0x5A0B12157
+
+_generador = random.Random(SEMILLA)
+
+# CLAVES_PIEZA[codigo][casilla]; los códigos negativos se indexan desde el final de la tupla
+# como en cualquier secuencia de Python, así que basta con 13 filas (la 0 no se usa).
+CLAVES_PIEZA: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_generador.getrandbits(64) for _ in range(64)) for _ in range(13)
+)
+
+# Se aplica cuando mueven las negras
+CLAVE_TURNO: int = _generador.getrandbits(64)
+
+# Una clave por derecho (K, Q, k, q) y la combinación ya calculada para cada máscara de 4 bits
+_CLAVES_DERECHO = tuple(_generador.getrandbits(64) for _ in range(4))
+
+
+def _clave_derechos(derechos: int) -> int:
+    clave = 0
+    for bit in range(4):
+        if derechos & (1 << bit):
+            clave ^= _CLAVES_DERECHO[bit]
+    return clave
+
+
+CLAVES_ENROQUE: Tuple[int, ...] = tuple(_clave_derechos(derechos) for derechos in range(16))
+
+# Una clave por columna de captura al paso; sin captura al paso no se aplica ninguna
+CLAVES_AL_PASO: Tuple[int, ...] = tuple(_generador.getrandbits(64) for _ in range(8))
+
+
+def calcular_clave(
+    codigos: Sequence[int], turno: str, derechos_enroque: int, columna_al_paso: Optional[int]
+) -> int:
+    """
+    Calcula desde cero la clave Zobrist de una posición.
+
+    Parámetros:
+    -----------
+    codigos : Sequence[int]
+        Las 64 casillas codificadas (0 vacía, ± código de pieza).
+    turno : str
+        Color al que le toca mover ('blanco' o 'negro').
+    derechos_enroque : int
+        Máscara de 4 bits de derechos de enroque (K=1, Q=2, k=4, q=8).
+    columna_al_paso : Optional[int]
+        Columna (0-7) de la casilla de captura al paso, o None.
+
+    Retorna:
+    --------
+    int
+        Clave de 64 bits.
+    """
+    clave = 0
+    for casilla, codigo in enumerate(codigos):
+        if codigo:
+            clave ^= CLAVES_PIEZA[codigo][casilla]
+    if turno == "negro":
+        clave ^= CLAVE_TURNO
+    clave ^= CLAVES_ENROQUE[derechos_enroque]
+    if columna_al_paso is not None:
+        clave ^= CLAVES_AL_PASO[columna_al_paso]
+    return clave
@@ -8,6 +8,7 @@ Clases:
 
 from typing import List, Tuple
 from piezas.pieza_base import Pieza
+from piezas.tablas_ataque import movimientos_deslizantes, DIRECCIONES_ALFIL
 
 
 class Alfil(Pieza):
@@ -25,17 +26,10 @@ class Alfil(Pieza):
         Devuelve una lista de movimientos válidos considerando reglas del juego 
     """
 
-    def __init__(self, color: str) -> None:
-        """
-        Inicializa un alfil con el color dado.
+    __slots__ = ()
 
-        Parámetros:
-        -----------
-        color : str
-            'blanco' o 'negro'.
-        """
-        super().__init__(color)
-        self.valor = 333 # Valor asignado por AlphaZero
+    codigo = 3  # Mismo código que SALAS_IA/fenbit.py
+    valor = 333 # Valor asignado por AlphaZero
 
     def simbolo(self) -> str:
         """
@@ -74,21 +68,5 @@ class Alfil(Pieza):
             Lista de coordenadas válidas donde el alfil puede moverse.
         """
         fila, columna = posicion
-        movimientos_potenciales = []
-        direcciones = [(-1, -1), (-1, 1), (1, -1), (1, 1)]  # diagonales
-
-        for df, dc in direcciones:
-            nueva_fila, nueva_columna = fila + df, columna + dc
-            while 0 <= nueva_fila < 8 and 0 <= nueva_columna < 8:
-                casilla = tablero.casillas[nueva_fila][nueva_columna]
-                if casilla is None:
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-                elif self.es_oponente(casilla):
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-                    break
-                else:
-                    break
-                nueva_fila += df
-                nueva_columna += dc
-
-        return movimientos_potenciales
+        # Rayos precalculados recorridos hasta el primer bloqueo
+        return movimientos_deslizantes(self, fila * 8 + columna, tablero.casillas, DIRECCIONES_ALFIL)
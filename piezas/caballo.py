@@ -8,6 +8,7 @@ Clases:
 
 from typing import List, Tuple
 from piezas.pieza_base import Pieza
+from piezas.tablas_ataque import SALTOS_CABALLO
 
 
 class Caballo(Pieza):
@@ -25,17 +26,10 @@ class Caballo(Pieza):
         Devuelve una lista de movimientos válidos considerando las reglas del juego.
     """
 
-    def __init__(self, color: str) -> None:
-        """
-        Inicializa un caballo con el color dado.
+    __slots__ = ()
 
-        Parámetros:
-        -----------
-        color : str
-            'blanco' o 'negro'.
-        """
-        super().__init__(color)
-        self.valor = 305 # Valor asignado por AlphaZero
+    codigo = 2  # Mismo código que SALAS_IA/fenbit.py
+    valor = 305 # Valor asignado por AlphaZero
 
     def simbolo(self) -> str:
         """
@@ -75,19 +69,12 @@ class Caballo(Pieza):
             Lista de coordenadas válidas donde el caballo puede moverse.
         """
         fila, columna = posicion
-        movimientos_posibles = [ # Saltos en L
-            (fila + 2, columna + 1), (fila + 2, columna - 1),
-            (fila - 2, columna + 1), (fila - 2, columna - 1),
-            (fila + 1, columna + 2), (fila + 1, columna - 2),
-            (fila - 1, columna + 2), (fila - 1, columna - 2),
-        ]
-
         movimientos_potenciales: List[Tuple[int, int]] = []
 
-        for nueva_fila, nueva_columna in movimientos_posibles:
-            if 0 <= nueva_fila < 8 and 0 <= nueva_columna < 8:
-                casilla = tablero.casillas[nueva_fila][nueva_columna]
-                if casilla is None or self.es_oponente(casilla):
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
+        # Saltos en L precalculados, ya filtrados a los que caen dentro del tablero
+        for nueva_fila, nueva_columna in SALTOS_CABALLO[fila * 8 + columna]:
+            casilla = tablero.casillas[nueva_fila][nueva_columna]
+            if casilla is None or self.es_oponente(casilla):
+                movimientos_potenciales.append((nueva_fila, nueva_columna))
 
         return movimientos_potenciales
@@ -0,0 +1,102 @@
+"""
+Módulo con la codificación compacta de las piezas mediante enteros con signo.
+
+Cada casilla se representa con un entero pequeño, igual que en `SALAS_IA/fenbit.py`:
+0 para una casilla vacía, 1-6 para peón, caballo, alfil, torre, reina y rey blancos, y
+los mismos valores en negativo para las piezas negras. Un tablero completo cabe en un
+`array('b')` de 64 bytes indexado por `fila * 8 + columna`.
+
+La codificación (`Tablero.codigos`) convive con la matriz de objetos `casillas` en lugar
+de sustituirla: las clases de `piezas` se usan como proveedoras de reglas sin estado, con
+una instancia compartida por clase y color, y este módulo traduce en los dos sentidos.
+
+Contenido:
+----------
+- Constantes de código por tipo de pieza y signo por color.
+- Tablas de valor, clase e instancia compartida indexadas por código.
+- Conversión entre objetos `Pieza` y códigos.
+"""
+
+from array import array
+from typing import Dict, Optional, Tuple
+
+from piezas.pieza_base import Pieza
+from piezas.peon import Peon
+from piezas.caballo import Caballo
+from piezas.alfil import Alfil
+from piezas.torre import Torre
+from piezas.reina import Reina
+from piezas.rey import Rey
+
+VACIO = 0
+CODIGO_PEON = Peon.codigo
+CODIGO_CABALLO = Caballo.codigo
+CODIGO_ALFIL = Alfil.codigo
+CODIGO_TORRE = Torre.codigo
+CODIGO_REINA = Reina.codigo
+CODIGO_REY = Rey.codigo
+
+SIGNO: Dict[str, int] = {"blanco": 1, "negro": -1}
+
+# Clase de pieza por tipo (valor absoluto del código)
+CLASES = {clase.codigo: clase for clase in (Peon, Caballo, Alfil, Torre, Reina, Rey)}
+
+# Valor material por tipo, el mismo que el atributo `valor` de cada clase
+VALORES = (0,) + tuple(CLASES[codigo].valor for codigo in range(1, 7))
+
+# Instancia compartida por código con signo; como las demás tablas por código con signo,
+# 13 posiciones en las que los códigos negativos se indexan desde el final
+PIEZAS: Tuple[Optional[Pieza], ...] = (
+    (None,) + tuple(CLASES[codigo]("blanco") for codigo in range(1, 7))
+    + tuple(CLASES[codigo]("negro") for codigo in range(6, 0, -1))
+)
+
+
+def tablero_vacio() -> array:
+    """
+    Devuelve un tablero codificado de 64 casillas vacías (enteros con signo de un byte).
+    """
+    return array("b", bytes(64))
+
+
+def codigo_de(pieza: Optional[Pieza]) -> int:
+    """
+    Devuelve el código con signo de una pieza (0 si la casilla está vacía).
+
+    Parámetros:
+    -----------
+    pieza : Optional[Pieza]
+        Pieza a codificar, o None.
+
+    Retorna:
+    --------
+    int
+        Código positivo para las blancas y negativo para las negras.
+    """
+    if pieza is None:
+        return VACIO
+    return pieza.codigo if pieza.color == "blanco" else -pieza.codigo
+
+
+def pieza_de(codigo: int) -> Optional[Pieza]:
+    """
+    Devuelve la instancia compartida de `Pieza` de un código con signo.
+
+    Parámetros:
+    -----------
+    codigo : int
+        Código con signo de la pieza (0 para una casilla vacía).
+
+    Retorna:
+    --------
+    Optional[Pieza]
+        Instancia compartida de la pieza, o None para una casilla vacía.
+
+    Lanza:
+    ------
+    ValueError
+        Si el código no corresponde a ninguna pieza.
+    """
+    if not -6 <= codigo <= 6:
+        raise ValueError(f"Código de pieza no válido: {codigo}")
+    return PIEZAS[codigo]
@@ -8,6 +8,7 @@ Clases:
 
 from typing import List, Tuple
 from piezas.pieza_base import Pieza
+from piezas.tablas_ataque import CAPTURAS_PEON
 
 
 class Peon(Pieza):
@@ -17,18 +18,10 @@ class Peon(Pieza):
     Implementa la lógica del movimiento normal, doble paso inicial, captura diagonal y captura al paso (en passant).
     """
 
-    def __init__(self, color: str) -> None:
-        """
-        Inicializa un peón con su color y estado de movimiento.
+    __slots__ = ()
 
-        Parámetros:
-        -----------
-        color : str
-            'blanco' o 'negro'.
-        """
-        super().__init__(color)
-        self.se_ha_movido = False
-        self.valor = 100 # Valor básico en todos los sistemas
+    codigo = 1  # Mismo código que SALAS_IA/fenbit.py
+    valor = 100 # Valor básico en todos los sistemas
 
     def simbolo(self) -> str:
         """
@@ -55,7 +48,7 @@ class Peon(Pieza):
         posicion : Tuple[int, int]
             Posición actual del peón en el tablero.
         tablero : Tablero
-            Objeto que contiene el estado del tablero y el último movimiento realizado.
+            Objeto que contiene el estado del tablero y la casilla de captura al paso.
         noatacando : bool
             Si True, se omiten los movimientos hacia adelante (usado para validación de jaque).
 
@@ -72,30 +65,23 @@ class Peon(Pieza):
         if not noatacando:
             if self._esta_vacio(tablero.casillas, fila + direccion, columna):
                 movimientos_potenciales.append((fila + direccion, columna))
-                if not self.se_ha_movido and self._esta_vacio(tablero.casillas, fila + 2 * direccion, columna):
+                # Doble paso desde la fila inicial: la regla no depende de ningún estado del peón
+                if fila == (6 if self.color == 'blanco' else 1) and self._esta_vacio(tablero.casillas, fila + 2 * direccion, columna):
                     movimientos_potenciales.append((fila + 2 * direccion, columna))
 
         # Capturas diagonales y en passant
-        for desplazamiento_columna in [-1, 1]:
-            nueva_columna = columna + desplazamiento_columna
-            nueva_fila = fila + direccion
-
-            if 0 <= nueva_fila < 8 and 0 <= nueva_columna < 8:
-                objetivo = tablero.casillas[nueva_fila][nueva_columna]
-                if objetivo and self.es_oponente(objetivo):
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-
-                # Captura al paso
-                if not noatacando and tablero.ultimo_movimiento:
-                    origen, destino, pieza_movida = tablero.ultimo_movimiento
-                    if (
-                        isinstance(pieza_movida, Peon)
-                        and abs(destino[0] - origen[0]) == 2
-                        and destino[0] == fila
-                        and destino[1] == nueva_columna
-                        and self.es_oponente(pieza_movida)
-                    ):
-                        movimientos_potenciales.append((fila + direccion, nueva_columna))
+        for nueva_fila, nueva_columna in CAPTURAS_PEON[self.color][fila * 8 + columna]:
+            objetivo = tablero.casillas[nueva_fila][nueva_columna]
+            if objetivo and self.es_oponente(objetivo):
+                movimientos_potenciales.append((nueva_fila, nueva_columna))
+
+            # Captura al paso: solo desde la quinta fila propia y hacia la casilla saltada
+            if (
+                not noatacando
+                and fila == (3 if self.color == 'blanco' else 4)
+                and tablero.casilla_al_paso == (nueva_fila, nueva_columna)
+            ):
+                movimientos_potenciales.append((nueva_fila, nueva_columna))
 
         return movimientos_potenciales
 
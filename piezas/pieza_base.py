@@ -10,19 +10,29 @@ Clases:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
+
+
+# Instancias compartidas por (clase, color)
+_INSTANCIAS: Dict[Tuple[type, str], 'Pieza'] = {}
 
 
 class Pieza(ABC):
     """
     Clase abstracta base para todas las piezas de ajedrez.
 
+    Las piezas no guardan estado mutable (el enroque y la captura al paso los lleva el
+    tablero), así que cada combinación de clase y color tiene una única instancia
+    compartida: construir `Peon("blanco")` dos veces devuelve el mismo objeto.
+
     Atributos:
     ----------
     color : str
         Color de la pieza ('blanco' o 'negro').
     valor : int
         Valor numérico de la pieza para evaluar su importancia (por defecto 0).
+    codigo : int
+        Código entero del tipo de pieza (1-6, ver `piezas/codigos.py`), común a toda la clase.
 
     Métodos abstractos:
     -------------------
@@ -39,9 +49,25 @@ class Pieza(ABC):
         Retorna una copia de la pieza actual, incluyendo ciertos atributos adicionales si existen.
     """
 
+    __slots__ = ("color",)
+
+    codigo: int = 0
+    valor: int = 0
+
+    def __new__(cls, color: str) -> 'Pieza':
+        instancia = _INSTANCIAS.get((cls, color))
+        if instancia is None:
+            instancia = super().__new__(cls)
+            instancia.color = color
+            _INSTANCIAS[(cls, color)] = instancia
+        return instancia
+
     def __init__(self, color: str) -> None:
         self.color: str = color
-        self.valor: int = 0
+
+    def __reduce__(self):
+        # Al copiar o serializar se vuelve a pasar por __new__ y se recupera la instancia compartida
+        return self.__class__, (self.color,)
 
     @abstractmethod
     def obtener_movimientos_validos(
@@ -101,15 +127,11 @@ class Pieza(ABC):
         """
         Retorna una copia de la pieza actual.
 
-        Si la pieza tiene atributos adicionales como 'se_ha_movido', también se copian.
+        Como las piezas no tienen estado mutable, la copia es la propia instancia compartida.
 
         Retorna:
         --------
         Pieza
-            Nueva instancia de la misma clase con los mismos atributos.
+            Instancia compartida de la misma clase y color.
         """
-        clase = self.__class__
-        clon = clase(self.color)
-        if hasattr(self, 'se_ha_movido'):
-            clon.se_ha_movido = self.se_ha_movido
-        return clon
+        return self
@@ -4,6 +4,7 @@ Define la clase Reina, una pieza que combina movimientos de alfil y torre.
 
 from typing import List, Tuple
 from piezas.pieza_base import Pieza
+from piezas.tablas_ataque import movimientos_deslizantes, DIRECCIONES_REINA
 
 
 class Reina(Pieza):
@@ -14,17 +15,10 @@ class Reina(Pieza):
     (horizontal, vertical o diagonal) mientras no encuentre obstáculos.
     """
 
-    def __init__(self, color: str) -> None:
-        """
-        Inicializa una reina con su color.
+    __slots__ = ()
 
-        Parámetros:
-        -----------
-        color : str
-            'blanco' o 'negro'
-        """
-        super().__init__(color)
-        self.valor = 950 # Valor asignado por AlphaZero
+    codigo = 5  # Mismo código que SALAS_IA/fenbit.py
+    valor = 950 # Valor asignado por AlphaZero
 
     def simbolo(self) -> str:
         """
@@ -61,27 +55,5 @@ class Reina(Pieza):
             Lista de coordenadas a las que la reina puede moverse legalmente.
         """
         fila, columna = posicion
-        movimientos_potenciales: List[Tuple[int, int]] = []
-
-        # Todas las direcciones posibles: diagonales, verticales y horizontales
-        direcciones = [
-            (-1, -1), (-1, 0), (-1, 1),
-            ( 0, -1),          ( 0, 1),
-            ( 1, -1), ( 1, 0), ( 1, 1)
-        ]
-
-        for df, dc in direcciones:
-            nueva_fila, nueva_columna = fila + df, columna + dc
-            while 0 <= nueva_fila < 8 and 0 <= nueva_columna < 8:
-                casilla = tablero.casillas[nueva_fila][nueva_columna]
-                if casilla is None:
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-                elif self.es_oponente(casilla):
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-                    break
-                else:
-                    break  # Aliado bloqueando
-                nueva_fila += df
-                nueva_columna += dc
-
-        return movimientos_potenciales
+        # Rayos precalculados recorridos hasta el primer bloqueo
+        return movimientos_deslizantes(self, fila * 8 + columna, tablero.casillas, DIRECCIONES_REINA)
@@ -7,7 +7,11 @@ Clases:
 """
 
 from piezas.pieza_base import Pieza
-from piezas.torre import Torre
+from piezas.tablas_ataque import VECINOS_REY
+
+# Bits de los derechos de enroque del tablero (mismo orden que las letras FEN "KQkq")
+ENROQUE_CORTO = {"blanco": 1, "negro": 4}
+ENROQUE_LARGO = {"blanco": 2, "negro": 8}
 
 class Rey(Pieza):
     """
@@ -16,11 +20,6 @@ class Rey(Pieza):
     Hereda de la clase base `Pieza` e implementa los movimientos básicos
     del rey, incluyendo el enroque.
 
-    Atributos:
-    ----------
-    se_ha_movido : bool
-        Indica si el rey ya se ha movido (importante para enroque).
-
     Métodos:
     --------
     simbolo() -> str:
@@ -29,18 +28,10 @@ class Rey(Pieza):
         Calcula movimientos legales del rey.
     """
 
-    def __init__(self, color):
-        """
-        Inicializa el rey con el color dado.
+    __slots__ = ()
 
-        Parámetros:
-        -----------
-        color : str
-            'blanco' o 'negro'
-        """
-        super().__init__(color)
-        self.se_ha_movido = False
-        self.valor = 1000000 # Valor amuy elevado para similar el infinito
+    codigo = 6  # Mismo código que SALAS_IA/fenbit.py
+    valor = 1000000 # Valor amuy elevado para similar el infinito
 
     def simbolo(self):
         """
@@ -79,32 +70,23 @@ class Rey(Pieza):
         movimientos_potenciales = []
         
         
-        # Movimientos normales del rey (una casilla en cualquier dirección)
-        direcciones = [
-            (-1, -1), (-1, 0), (-1, 1),
-            ( 0, -1),          ( 0, 1),
-            ( 1, -1), ( 1, 0), ( 1, 1)
-        ]
-
-        for df, dc in direcciones:
-            nueva_fila, nueva_columna = fila + df, columna + dc
-            if 0 <= nueva_fila < 8 and 0 <= nueva_columna < 8:
-                casilla = tablero.casillas[nueva_fila][nueva_columna]
-                if casilla is None or self.es_oponente(casilla):
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-
-        if not noatacando and not self.se_ha_movido:
+        # Movimientos normales del rey (una casilla en cualquier dirección), precalculados
+        for nueva_fila, nueva_columna in VECINOS_REY[fila * 8 + columna]:
+            casilla = tablero.casillas[nueva_fila][nueva_columna]
+            if casilla is None or self.es_oponente(casilla):
+                movimientos_potenciales.append((nueva_fila, nueva_columna))
+
+        # Enroque: los derechos los mantiene el tablero (se pierden al mover el rey o la torre)
+        if not noatacando and tablero.derechos_enroque:
             fila_rey = 7 if self.color == 'blanco' else 0
 
             # Enroque corto (torre en columna 7)
-            torre_corta = tablero.casillas[fila_rey][7]
-            if isinstance(torre_corta, Torre) and not torre_corta.se_ha_movido:
+            if tablero.derechos_enroque & ENROQUE_CORTO[self.color]:
                 if all(tablero.casillas[fila_rey][c] is None for c in [5, 6]):
                     movimientos_potenciales.append((fila_rey, 6))
 
             # Enroque largo (torre en columna 0)
-            torre_larga = tablero.casillas[fila_rey][0]
-            if isinstance(torre_larga, Torre) and not torre_larga.se_ha_movido:
+            if tablero.derechos_enroque & ENROQUE_LARGO[self.color]:
                 if all(tablero.casillas[fila_rey][c] is None for c in [1, 2, 3]):
                     movimientos_potenciales.append((fila_rey, 2))
 
@@ -0,0 +1,232 @@
+"""
+Módulo con las tablas de ataque precalculadas de todas las piezas.
+
+Las tablas se construyen una sola vez al importar el módulo y se indexan por la casilla
+plana `fila * 8 + columna` (0 = a8, 63 = h1). Para cada casilla se guardan los destinos
+del caballo, del rey y de las capturas de peón de cada color, tanto como tuplas de
+coordenadas (para recorrer la matriz `casillas`) como máscaras de 64 bits (para los bitboards).
+Las piezas deslizantes usan una tabla de rayos por dirección y un escaneo del primer bloqueo.
+
+Tablas:
+-------
+- SALTOS_CABALLO / ATAQUES_CABALLO
+- VECINOS_REY / ATAQUES_REY
+- CAPTURAS_PEON / ATAQUES_PEON (por color)
+- RAYOS_CASILLAS / RAYOS (por dirección)
+- INDICES_*: las mismas tablas como índices planos, para el tablero codificado
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+Casilla = Tuple[int, int]
+
+_DESPLAZAMIENTOS_CABALLO = (
+    (2, 1), (2, -1), (-2, 1), (-2, -1),
+    (1, 2), (1, -2), (-1, 2), (-1, -2),
+)
+
+_DESPLAZAMIENTOS_REY = (
+    (-1, -1), (-1, 0), (-1, 1),
+    ( 0, -1),          ( 0, 1),
+    ( 1, -1), ( 1, 0), ( 1, 1),
+)
+
+# Los peones blancos avanzan hacia la fila 0 y los negros hacia la fila 7
+_DESPLAZAMIENTOS_PEON = {
+    "blanco": ((-1, -1), (-1, 1)),
+    "negro": ((1, -1), (1, 1)),
+}
+
+
+def _destinos(desplazamientos: Iterable[Tuple[int, int]]) -> Tuple[Tuple[Casilla, ...], ...]:
+    """
+    Construye, para cada una de las 64 casillas, la tupla de destinos dentro del tablero.
+    """
+    tabla = []
+    for origen in range(64):
+        fila, columna = divmod(origen, 8)
+        tabla.append(tuple(
+            (fila + df, columna + dc)
+            for df, dc in desplazamientos
+            if 0 <= fila + df < 8 and 0 <= columna + dc < 8
+        ))
+    return tuple(tabla)
+
+
+def _indices(destinos: Tuple[Tuple[Casilla, ...], ...]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Convierte una tabla de destinos en la tabla equivalente de índices planos.
+    """
+    return tuple(tuple(f * 8 + c for f, c in casillas) for casillas in destinos)
+
+
+def _mascaras(destinos: Tuple[Tuple[Casilla, ...], ...]) -> Tuple[int, ...]:
+    """
+    Convierte una tabla de destinos en la tabla de máscaras de 64 bits equivalente.
+    """
+    return tuple(sum(1 << (f * 8 + c) for f, c in casillas) for casillas in destinos)
+
+
+SALTOS_CABALLO = _destinos(_DESPLAZAMIENTOS_CABALLO)
+ATAQUES_CABALLO = _mascaras(SALTOS_CABALLO)
+
+VECINOS_REY = _destinos(_DESPLAZAMIENTOS_REY)
+ATAQUES_REY = _mascaras(VECINOS_REY)
+
+CAPTURAS_PEON: Dict[str, Tuple[Tuple[Casilla, ...], ...]] = {
+    color: _destinos(desplazamientos) for color, desplazamientos in _DESPLAZAMIENTOS_PEON.items()
+}
+ATAQUES_PEON: Dict[str, Tuple[int, ...]] = {
+    color: _mascaras(destinos) for color, destinos in CAPTURAS_PEON.items()
+}
+
+# Las mismas tablas como índices planos, para recorrer el tablero codificado (`codigos`)
+INDICES_SALTOS_CABALLO = _indices(SALTOS_CABALLO)
+INDICES_VECINOS_REY = _indices(VECINOS_REY)
+INDICES_CAPTURAS_PEON: Dict[str, Tuple[Tuple[int, ...], ...]] = {
+    color: _indices(destinos) for color, destinos in CAPTURAS_PEON.items()
+}
+
+
+# ---------------------------------------------------------------------------
+# Rayos de las piezas deslizantes
+# ---------------------------------------------------------------------------
+
+# Las ocho direcciones (df, dc). Su posición en la tupla es el índice de dirección.
+DIRECCIONES_RAYO = (
+    (-1, -1), (-1, 0), (-1, 1),
+    ( 0, -1),          ( 0, 1),
+    ( 1, -1), ( 1, 0), ( 1, 1),
+)
+
+# Índices de dirección de cada pieza, en el mismo orden en que siempre han recorrido el tablero
+DIRECCIONES_ALFIL = (0, 2, 5, 7)
+DIRECCIONES_TORRE = (1, 6, 3, 4)
+DIRECCIONES_REINA = (0, 1, 2, 3, 4, 5, 6, 7)
+
+# Una dirección es "creciente" si avanza hacia índices planos mayores
+_CRECIENTE = tuple(df * 8 + dc > 0 for df, dc in DIRECCIONES_RAYO)
+
+
+def _rayo(origen: int, df: int, dc: int) -> Tuple[Casilla, ...]:
+    fila, columna = divmod(origen, 8)
+    casillas = []
+    fila, columna = fila + df, columna + dc
+    while 0 <= fila < 8 and 0 <= columna < 8:
+        casillas.append((fila, columna))
+        fila, columna = fila + df, columna + dc
+    return tuple(casillas)
+
+
+# RAYOS_CASILLAS[direccion][casilla]: casillas del rayo ordenadas desde el origen hacia fuera
+RAYOS_CASILLAS = tuple(
+    tuple(_rayo(origen, df, dc) for origen in range(64)) for df, dc in DIRECCIONES_RAYO
+)
+# RAYOS[direccion][casilla]: el mismo rayo como máscara de 64 bits
+RAYOS = tuple(_mascaras(rayos) for rayos in RAYOS_CASILLAS)
+# INDICES_RAYOS[direccion][casilla]: el mismo rayo como índices planos
+INDICES_RAYOS = tuple(_indices(rayos) for rayos in RAYOS_CASILLAS)
+
+
+# Rayos y sentido de cada dirección de las piezas deslizantes, ya emparejados para no
+# indexar dos tablas por dirección en cada llamada
+_RAYOS_ALFIL = tuple((RAYOS[d], _CRECIENTE[d]) for d in DIRECCIONES_ALFIL)
+_RAYOS_TORRE = tuple((RAYOS[d], _CRECIENTE[d]) for d in DIRECCIONES_TORRE)
+_RAYOS_REINA = tuple((RAYOS[d], _CRECIENTE[d]) for d in DIRECCIONES_REINA)
+
+
+def ataques_deslizantes(indice: int, ocupacion: int, rayos_direcciones: Tuple[Tuple[Tuple[int, ...], bool], ...]) -> int:
+    """
+    Une las casillas alcanzadas desde una casilla en varias direcciones, en cada una hasta
+    el primer bloqueo (incluido).
+
+    Se localiza el primer bloqueador de cada rayo con una sola operación de bits (el bit
+    más bajo en direcciones crecientes y el más alto en decrecientes) y se recorta el rayo
+    restando el rayo que parte desde ese bloqueador.
+
+    Parámetros:
+    -----------
+    indice : int
+        Casilla plana de origen.
+    ocupacion : int
+        Máscara de casillas ocupadas.
+    rayos_direcciones : Tuple[Tuple[Tuple[int, ...], bool], ...]
+        Por dirección, su tabla de `RAYOS` y si es creciente.
+
+    Retorna:
+    --------
+    int
+        Máscara de casillas alcanzadas.
+    """
+    ataques = 0
+    for rayos, creciente in rayos_direcciones:
+        rayo = rayos[indice]
+        bloqueadores = rayo & ocupacion
+        if bloqueadores:
+            if creciente:
+                rayo ^= rayos[(bloqueadores & -bloqueadores).bit_length() - 1]
+            else:
+                rayo ^= rayos[bloqueadores.bit_length() - 1]
+        ataques |= rayo
+    return ataques
+
+
+def ataques_alfil(indice: int, ocupacion: int) -> int:
+    """
+    Devuelve la máscara de casillas atacadas por un alfil desde `indice` (las cuatro diagonales),
+    con la ocupación dada (ver `ataques_deslizantes`).
+    """
+    return ataques_deslizantes(indice, ocupacion, _RAYOS_ALFIL)
+
+
+def ataques_torre(indice: int, ocupacion: int) -> int:
+    """
+    Devuelve la máscara de casillas atacadas por una torre desde `indice` (filas y columnas),
+    con la ocupación dada (ver `ataques_deslizantes`).
+    """
+    return ataques_deslizantes(indice, ocupacion, _RAYOS_TORRE)
+
+
+def ataques_reina(indice: int, ocupacion: int) -> int:
+    """
+    Devuelve la máscara de casillas atacadas por una reina desde `indice` (las ocho direcciones),
+    con la ocupación dada (ver `ataques_deslizantes`).
+    """
+    return ataques_deslizantes(indice, ocupacion, _RAYOS_REINA)
+
+
+def movimientos_deslizantes(pieza, indice: int, casillas, direcciones: Tuple[int, ...]) -> List[Casilla]:
+    """
+    Recorre los rayos precalculados sobre la matriz `casillas` hasta el primer bloqueo.
+
+    Es la variante para el tablero de objetos: no crea coordenadas ni comprueba los
+    bordes, solo lee las casillas del rayo hasta encontrar una pieza.
+
+    Parámetros:
+    -----------
+    pieza : Pieza
+        Pieza que se mueve (para distinguir capturas de piezas amigas).
+    indice : int
+        Casilla plana de origen.
+    casillas : List[List[Optional[Pieza]]]
+        Matriz 8x8 del tablero.
+    direcciones : Tuple[int, ...]
+        Índices de `DIRECCIONES_RAYO` a recorrer.
+
+    Retorna:
+    --------
+    List[Casilla]
+        Destinos alcanzables (vacíos o con pieza rival).
+    """
+    movimientos: List[Casilla] = []
+    color = pieza.color
+    for direccion in direcciones:
+        for destino in RAYOS_CASILLAS[direccion][indice]:
+            ocupante = casillas[destino[0]][destino[1]]
+            if ocupante is None:
+                movimientos.append(destino)
+            else:
+                if ocupante.color != color:
+                    movimientos.append(destino)
+                break
+    return movimientos
@@ -7,6 +7,7 @@ Clases:
 """
 
 from piezas.pieza_base import Pieza
+from piezas.tablas_ataque import movimientos_deslizantes, DIRECCIONES_TORRE
 
 class Torre(Pieza):
     """
@@ -15,11 +16,6 @@ class Torre(Pieza):
     Hereda de la clase base `Pieza` e implementa el movimiento lineal
     vertical y horizontal característico de la torre.
 
-    Atributos:
-    ----------
-    se_ha_movido : bool
-        Indica si la torre ya se ha movido (útil para enroque).
-
     Métodos:
     --------
     simbolo() -> str:
@@ -28,18 +24,10 @@ class Torre(Pieza):
         Calcula los movimientos válidos para la torre desde la posición dada.
     """
 
-    def __init__(self, color):
-        """
-        Inicializa la torre con el color especificado.
+    __slots__ = ()
 
-        Parámetros:
-        -----------
-        color : str
-            'blanco' o 'negro'
-        """
-        super().__init__(color)
-        self.se_ha_movido = False
-        self.valor = 563 # Valor asignado por AlphaZero
+    codigo = 4  # Mismo código que SALAS_IA/fenbit.py
+    valor = 563 # Valor asignado por AlphaZero
 
     def simbolo(self):
         """
@@ -74,21 +62,5 @@ class Torre(Pieza):
             Lista de movimientos legales donde la torre puede desplazarse.
         """
         fila, columna = posicion
-        movimientos_potenciales = []
-        direcciones = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Movimientos verticales y horizontales
-
-        for df, dc in direcciones:
-            nueva_fila, nueva_columna = fila + df, columna + dc
-            while 0 <= nueva_fila < 8 and 0 <= nueva_columna < 8:
-                casilla = tablero.casillas[nueva_fila][nueva_columna]
-                if casilla is None:
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-                elif self.es_oponente(casilla):
-                    movimientos_potenciales.append((nueva_fila, nueva_columna))
-                    break
-                else:  # Pieza amiga bloquea el camino
-                    break
-                nueva_fila += df
-                nueva_columna += dc
-
-        return movimientos_potenciales
+        # Rayos precalculados recorridos hasta el primer bloqueo
+        return movimientos_deslizantes(self, fila * 8 + columna, tablero.casillas, DIRECCIONES_TORRE)
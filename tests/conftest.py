@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Los módulos del proyecto se importan desde la raíz del repositorio (juego, piezas, config)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
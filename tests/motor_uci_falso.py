@@ -0,0 +1,57 @@
+"""
+Motor UCI falso para las pruebas de `juego/motor_uci.py`.
+
+Contesta siempre `bestmove e2e4` y apunta cada orden recibida en `<directorio>/<pid>.log`.
+
+Uso:
+----
+    python motor_uci_falso.py <modo> <directorio>
+
+Modos:
+------
+- normal: contesta a cada `go` al momento.
+- colgar: no contesta a `go` hasta recibir `stop`.
+- mudo: no contesta a `go` ni a `stop`.
+- caer: termina sin contestar al primer `go` si existe `<directorio>/caer` (y lo borra).
+- ilegal: propone una promoción a caballo (`e7e8n`).
+"""
+
+import os
+import sys
+
+
+def main() -> None:
+    modo, directorio = sys.argv[1], sys.argv[2]
+    registro = open(os.path.join(directorio, f"{os.getpid()}.log"), "a")
+
+    def responder(linea: str) -> None:
+        sys.stdout.write(linea + "\n")
+        sys.stdout.flush()
+
+    for linea in sys.stdin:
+        registro.write(linea)
+        registro.flush()
+        orden = linea.split()[:1]
+        if orden == ["uci"]:
+            responder("id name falso")
+            responder("uciok")
+        elif orden == ["isready"]:
+            responder("readyok")
+        elif orden == ["go"]:
+            marca = os.path.join(directorio, "caer")
+            if modo == "caer" and os.path.exists(marca):
+                os.remove(marca)
+                sys.exit(1)
+            if modo in ("colgar", "mudo"):
+                continue
+            movimiento = "e7e8n" if modo == "ilegal" else "e2e4"
+            responder(f"info depth 5 score cp 31 pv {movimiento}")
+            responder(f"bestmove {movimiento}")
+        elif orden == ["stop"] and modo == "colgar":
+            responder("bestmove e2e4")
+        elif orden == ["quit"]:
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Pruebas del pool de motores UCI contra el motor falso de `tests/motor_uci_falso.py`:
+tiempo agotado, reinicio de un proceso caído, respaldo con la búsqueda propia y
+reparto de las partidas entre procesos.
+"""
+
+import glob
+import os
+import sys
+
+import pytest
+
+from juego import motor_uci
+from juego.motor_uci import ErrorMotorUCI, IAMotorUCI, MotorUCI, PoolMotoresUCI
+from juego.tablero import Tablero
+
+MOTOR_FALSO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "motor_uci_falso.py")
+FEN_INICIAL = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+
+def comando(modo: str, directorio) -> list:
+    return [sys.executable, MOTOR_FALSO, modo, str(directorio)]
+
+
+def registros(directorio) -> list:
+    # Órdenes recibidas por cada proceso del motor falso
+    resultado = []
+    for ruta in sorted(glob.glob(os.path.join(str(directorio), "*.log"))):
+        with open(ruta) as f:
+            resultado.append(f.read().splitlines())
+    return resultado
+
+
+@pytest.fixture
+def margen_corto(monkeypatch):
+    # Sin esto cada espera de un motor que no contesta dura segundos
+    monkeypatch.setattr(motor_uci, "MARGEN_RESPUESTA_MS", 200)
+
+
+def test_tiempo_agotado_pide_stop(tmp_path, margen_corto):
+    motor = MotorUCI(comando("colgar", tmp_path))
+    try:
+        resultado = motor.analizar(FEN_INICIAL, tiempo_ms=20, espera_ms=100)
+    finally:
+        motor.cerrar()
+    assert resultado.mejor_movimiento == "e2e4"
+    assert "stop" in registros(tmp_path)[0]
+
+
+def test_motor_mudo_lanza_error(tmp_path, margen_corto):
+    motor = MotorUCI(comando("mudo", tmp_path))
+    try:
+        with pytest.raises(ErrorMotorUCI):
+            motor.analizar(FEN_INICIAL, tiempo_ms=20, espera_ms=100)
+    finally:
+        motor.cerrar()
+
+
+def test_reinicia_un_proceso_caido(tmp_path):
+    (tmp_path / "caer").touch()
+    pool = PoolMotoresUCI(comando("caer", tmp_path), procesos=1)
+    try:
+        resultado = pool.analizar(FEN_INICIAL, tiempo_ms=20)
+    finally:
+        pool.cerrar()
+    assert resultado.mejor_movimiento == "e2e4"
+    assert pool.reinicios == 1
+    assert len(registros(tmp_path)) == 2
+
+
+def test_partida_en_un_mismo_proceso_sin_ucinewgame(tmp_path):
+    pool = PoolMotoresUCI(comando("normal", tmp_path), procesos=3)
+    jugadas = ["e2e4", "e7e5", "g1f3", "b8c6"]
+    try:
+        for n in range(len(jugadas) + 1):
+            pool.analizar(FEN_INICIAL, tiempo_ms=10, partida=7, movimientos=jugadas[:n])
+            # Las posiciones sueltas van al proceso más libre, no al de la partida
+            pool.analizar(FEN_INICIAL, tiempo_ms=10)
+    finally:
+        pool.cerrar()
+    con_partida = [r for r in registros(tmp_path) if any(" moves " in linea for linea in r)]
+    assert len(con_partida) == 1
+    ordenes = [l for l in con_partida[0] if l.startswith(("position", "ucinewgame"))]
+    assert ordenes == [
+        "position fen " + FEN_INICIAL + (" moves " + " ".join(jugadas[:n]) if n else "")
+        for n in range(len(jugadas) + 1)
+    ]
+
+
+def test_ia_conserva_la_partida_entre_movimientos(tmp_path):
+    pool = PoolMotoresUCI(comando("normal", tmp_path), procesos=1)
+    ia = IAMotorUCI(pool, max_profundidad=1)
+    ia.color = "blanco"
+    tablero = Tablero()
+    try:
+        assert ia.encontrar_mejor_movimiento(tablero, 10) == ((6, 4), (4, 4))
+        tablero.hacer_movimiento((6, 4), (4, 4))
+        tablero.hacer_movimiento((1, 4), (3, 4))
+        ia.encontrar_mejor_movimiento(tablero, 10)
+        otra = Tablero()
+        ia.encontrar_mejor_movimiento(otra, 10)
+    finally:
+        pool.cerrar()
+    ordenes = [l for l in registros(tmp_path)[0] if l.startswith(("position", "ucinewgame"))]
+    assert ordenes == [
+        "position fen " + FEN_INICIAL,
+        "position fen " + FEN_INICIAL + " moves e2e4 e7e5",
+        "ucinewgame",
+        "position fen " + FEN_INICIAL,
+    ]
+
+
+def test_respaldo_si_el_motor_falla(tmp_path, margen_corto):
+    pool = PoolMotoresUCI(comando("mudo", tmp_path), procesos=1)
+    ia = IAMotorUCI(pool, max_profundidad=1)
+    ia.color = "blanco"
+    tablero = Tablero()
+    try:
+        movimiento = ia.encontrar_mejor_movimiento(tablero, 50)
+    finally:
+        pool.cerrar()
+    assert movimiento in ia.generar_movimientos(tablero, "blanco")
+    assert ia.ultimo_resultado is None
+    assert pool.reinicios == 2
+
+
+def test_respaldo_si_el_motor_subpromociona(tmp_path):
+    pool = PoolMotoresUCI(comando("ilegal", tmp_path), procesos=1)
+    ia = IAMotorUCI(pool, max_profundidad=1)
+    ia.color = "blanco"
+    tablero = Tablero()
+    try:
+        movimiento = ia.encontrar_mejor_movimiento(tablero, 50)
+    finally:
+        pool.cerrar()
+    assert movimiento in ia.generar_movimientos(tablero, "blanco")
+    assert ia.ultimo_resultado.mejor_movimiento == "e7e8n"
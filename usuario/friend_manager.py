@@ -6,7 +6,7 @@ from datetime import datetime
 from usuario.usuario import Usuario
 from juego.usuarioIA import UsuarioIA
 from juego.sesion_juego import SesionDeJuego 
-from config import PATH_SOLICITUDES, PATH_RETOS, PATH_CHATS
+from config import PATH_SOLICITUDES, PATH_RETOS, PATH_CHATS, MOTOR_TABLERO_IA
 
 
 def _ruta_chat(user1_id: str, user2_id: str) -> str:
@@ -352,9 +352,9 @@ def enviar_reto_a_amigo(retador_username: str, username_amigo: str) -> None:
     if not retador or not amigo:
         raise ValueError("El usuario no existe.")
 
-    # Si es IA, iniciar automáticamente la partida
+    # Si es IA, iniciar automáticamente la partida con el motor de tablero de la IA
     if isinstance(amigo, UsuarioIA):
-        return SesionDeJuego(retador, amigo)
+        return SesionDeJuego(retador, amigo, motor=MOTOR_TABLERO_IA)
 
     if amigo.user_id not in retador.amigos:
         raise ValueError("Este usuario no es tu amigo.")